@@ -20,6 +20,8 @@ from sqlmodel import SQLModel
 from src.models.user import User  # noqa
 from src.models.task import Task  # noqa
 from src.models.tag import Tag, TaskTag  # noqa
+from src.models.refresh_token import RefreshToken  # noqa
+from src.models.personal_access_token import PersonalAccessToken  # noqa
 
 # Import settings
 from src.config import settings
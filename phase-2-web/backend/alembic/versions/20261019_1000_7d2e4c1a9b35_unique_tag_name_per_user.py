@@ -0,0 +1,63 @@
+"""unique tag name per user
+
+Revision ID: 7d2e4c1a9b35
+Revises:
+Create Date: 2026-10-19 10:00:00
+
+Adds the (user_id, name) unique constraint on tags that the model always
+documented but never created. Duplicate tags left behind by the old
+check-then-insert path are merged into the oldest tag of each name first.
+
+On a fresh database create_all already builds the constraint, so the
+upgrade only touches tables that exist without it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2e4c1a9b35'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CONSTRAINT_NAME = "uq_tags_user_id_name"
+
+# Duplicate tags mapped to the tag that survives (oldest per user and name)
+DUPLICATE_TAGS = """
+    SELECT id, keep_id FROM (
+        SELECT id, first_value(id) OVER (
+            PARTITION BY user_id, name ORDER BY created_at, id
+        ) AS keep_id
+        FROM tags
+    ) ranked
+    WHERE id <> keep_id
+"""
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "tags" not in inspector.get_table_names():
+        return
+    if any(uc["name"] == CONSTRAINT_NAME for uc in inspector.get_unique_constraints("tags")):
+        return
+
+    # Move task assignments from duplicates onto the surviving tag
+    op.execute(f"""
+        INSERT INTO task_tags (task_id, tag_id, created_at)
+        SELECT tt.task_id, d.keep_id, tt.created_at
+        FROM task_tags tt JOIN ({DUPLICATE_TAGS}) d ON d.id = tt.tag_id
+        ON CONFLICT DO NOTHING
+    """)
+    op.execute(f"DELETE FROM task_tags WHERE tag_id IN (SELECT id FROM ({DUPLICATE_TAGS}) d)")
+    op.execute(f"DELETE FROM tags WHERE id IN (SELECT id FROM ({DUPLICATE_TAGS}) d)")
+
+    op.create_unique_constraint(CONSTRAINT_NAME, "tags", ["user_id", "name"])
+
+
+def downgrade() -> None:
+    op.drop_constraint(CONSTRAINT_NAME, "tags", type_="unique")
@@ -0,0 +1,55 @@
+"""personal access tokens
+
+Revision ID: 4f4aadaf1648
+Revises: 0c584cb08d0e
+Create Date: 2026-10-19 11:10:00
+
+Adds the personal_access_tokens table for machine clients (an HMAC digest
+per token, looked up through a unique index).
+
+Deployments that already ran create_all with this model have the table;
+the upgrade then only stamps the revision.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f4aadaf1648'
+down_revision: Union[str, None] = '0c584cb08d0e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "personal_access_tokens" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "personal_access_tokens",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("name", sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False),
+        sa.Column("token_digest", sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+        sa.Column("token_prefix", sqlmodel.sql.sqltypes.AutoString(length=16), nullable=False),
+        sa.Column("scopes", sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=True),
+        sa.Column("revoked_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_personal_access_tokens_user_id", "personal_access_tokens", ["user_id"])
+    op.create_index(
+        "ix_personal_access_tokens_token_digest", "personal_access_tokens", ["token_digest"], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_personal_access_tokens_token_digest", table_name="personal_access_tokens")
+    op.drop_index("ix_personal_access_tokens_user_id", table_name="personal_access_tokens")
+    op.drop_table("personal_access_tokens")
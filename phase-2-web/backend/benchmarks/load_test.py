@@ -0,0 +1,312 @@
+"""
+Backend load test.
+
+Drives the task endpoints at a fixed concurrency against data seeded by
+benchmarks/seed_data.py and reports latency percentiles and throughput
+per scenario:
+
+- list:   GET /api/tasks (first page)
+- search: GET /api/tasks?search=<word>&status=pending
+- create: POST /api/tasks
+- toggle: PATCH /api/tasks/{id}/complete
+- assign: POST /api/tasks/{id}/tags
+
+Each scenario runs on its own for --duration seconds after a warm-up,
+spread over a random sample of benchmark users. Access tokens are minted
+locally with SECRET_KEY, so the target server must share this .env.
+
+By default requests go to the app in-process (no network, no uvicorn);
+pass --base-url to measure a running server instead. Results are written
+as JSON (with the git commit) so runs can be compared between commits.
+
+Usage (from phase-2-web/backend):
+    python benchmarks/seed_data.py --users 1000 --tasks 100000 --tags 5000
+    python benchmarks/load_test.py --concurrency 32 --duration 20
+    python benchmarks/load_test.py --base-url http://localhost:8000 --scenarios list,search
+    python benchmarks/load_test.py --compare benchmarks/results/<previous>.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from sqlalchemy import func, select
+
+from src.auth.jwt import create_access_token
+from src.database import engine, close_db
+from src.models import User, Task, Tag
+from seed_data import USERNAME_PREFIX, NOUNS, VERBS, dataset_counts
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = BACKEND_DIR / "benchmarks" / "results"
+
+
+@dataclass
+class BenchUser:
+    """A sampled benchmark user with ids to act on."""
+    headers: Dict[str, str]
+    task_ids: List[str]
+    tag_ids: List[str]
+
+
+@dataclass
+class ScenarioResult:
+    """Latencies (ms) and error count for one scenario."""
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    elapsed: float = 0.0
+
+    def summary(self) -> dict:
+        samples = sorted(self.latencies)
+
+        def percentile(p: float) -> float:
+            # Nearest rank
+            return samples[max(0, int(round(p / 100 * len(samples))) - 1)] if samples else 0.0
+
+        return {
+            "requests": len(samples),
+            "errors": self.errors,
+            "rps": round(len(samples) / self.elapsed, 1) if self.elapsed else 0.0,
+            "mean_ms": round(statistics.fmean(samples), 2) if samples else 0.0,
+            "p50_ms": round(percentile(50), 2),
+            "p95_ms": round(percentile(95), 2),
+            "p99_ms": round(percentile(99), 2),
+            "max_ms": round(samples[-1], 2) if samples else 0.0,
+        }
+
+
+# Each scenario builds one request for a user: (method, url, json body)
+def list_request(rng: random.Random, user: BenchUser):
+    return "GET", "/api/tasks?page=1&limit=20", None
+
+
+def search_request(rng: random.Random, user: BenchUser):
+    return "GET", f"/api/tasks?search={rng.choice(NOUNS)}&status=pending&limit=20", None
+
+
+def create_request(rng: random.Random, user: BenchUser):
+    body = {
+        "title": f"{rng.choice(VERBS)} {rng.choice(NOUNS)}",
+        "priority": rng.choice(["low", "medium", "high"]),
+    }
+    return "POST", "/api/tasks", body
+
+
+def toggle_request(rng: random.Random, user: BenchUser):
+    return "PATCH", f"/api/tasks/{rng.choice(user.task_ids)}/complete", None
+
+
+def assign_request(rng: random.Random, user: BenchUser):
+    body = {"tag_id": rng.choice(user.tag_ids)}
+    return "POST", f"/api/tasks/{rng.choice(user.task_ids)}/tags", body
+
+
+SCENARIOS: Dict[str, Callable] = {
+    "list": list_request,
+    "search": search_request,
+    "create": create_request,
+    "toggle": toggle_request,
+    "assign": assign_request,
+}
+
+
+async def sample_users(count: int, tasks_per_user: int, rng: random.Random) -> List[BenchUser]:
+    """Pick random benchmark users that own at least one task and one tag."""
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            select(User.id, User.username)
+            .where(User.username.like(f"{USERNAME_PREFIX}%"))
+            .order_by(func.random())
+            .limit(count * 4)
+        )
+        candidates = result.all()
+
+        users = []
+        for user_id, username in candidates:
+            task_ids = (await conn.execute(
+                select(Task.id).where(Task.user_id == user_id).limit(tasks_per_user)
+            )).scalars().all()
+            tag_ids = (await conn.execute(
+                select(Tag.id).where(Tag.user_id == user_id)
+            )).scalars().all()
+            if not task_ids or not tag_ids:
+                continue
+
+            token = create_access_token(user_id, username)
+            users.append(BenchUser(
+                headers={"Authorization": f"Bearer {token}"},
+                task_ids=[str(task_id) for task_id in task_ids],
+                tag_ids=[str(tag_id) for tag_id in tag_ids],
+            ))
+            if len(users) == count:
+                break
+
+    rng.shuffle(users)
+    return users
+
+
+async def drive(client: httpx.AsyncClient, build: Callable, users: List[BenchUser],
+                concurrency: int, duration: float, rng: random.Random) -> ScenarioResult:
+    """Run `concurrency` workers issuing requests back to back for `duration` seconds."""
+    result = ScenarioResult()
+    deadline = time.perf_counter() + duration
+
+    async def worker(worker_rng: random.Random) -> None:
+        while time.perf_counter() < deadline:
+            user = worker_rng.choice(users)
+            method, url, body = build(worker_rng, user)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, url, json=body, headers=user.headers)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            result.latencies.append((time.perf_counter() - started) * 1000)
+            if failed:
+                result.errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(random.Random(rng.random())) for _ in range(concurrency)))
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def git_revision() -> Optional[str]:
+    """Current commit (with a -dirty suffix for uncommitted changes)."""
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_table(results: Dict[str, dict], baseline: Optional[dict] = None) -> None:
+    print(f"\n{'scenario':<10}{'requests':>10}{'errors':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, stats in results.items():
+        print(
+            f"{name:<10}{stats['requests']:>10}{stats['errors']:>8}{stats['rps']:>10.1f}"
+            f"{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+        )
+        previous = (baseline or {}).get("scenarios", {}).get(name)
+        if previous:
+            def change(key: str) -> str:
+                if not previous[key]:
+                    return "-"
+                return f"{(stats[key] - previous[key]) / previous[key] * 100:+.0f}%"
+
+            print(
+                f"{'  vs base':<10}{'':>10}{'':>8}{change('rps'):>10}"
+                f"{change('p50_ms'):>10}{change('p95_ms'):>10}{change('p99_ms'):>10}"
+            )
+
+
+async def run(args) -> None:
+    rng = random.Random(args.seed)
+    scenarios = [name.strip() for name in args.scenarios.split(",")]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        raise SystemExit(f"Unknown scenario(s): {', '.join(unknown)} (choose from {', '.join(SCENARIOS)})")
+
+    try:
+        counts = await dataset_counts()
+        users = await sample_users(args.sample_users, args.tasks_per_user, rng)
+        if not users:
+            raise SystemExit("No benchmark data found; run benchmarks/seed_data.py first")
+
+        if args.base_url:
+            transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+            )
+            base_url, target = args.base_url, args.base_url
+        else:
+            import main as app_module
+
+            transport = httpx.ASGITransport(app=app_module.app)
+            base_url, target = "http://benchmark", "in-process"
+
+        print(
+            f"Dataset: {counts['users']} users, {counts['tasks']} tasks, {counts['tags']} tags "
+            f"({engine.dialect.name}); {len(users)} sampled users"
+        )
+        print(f"Target: {target}, concurrency {args.concurrency}, {args.duration}s per scenario")
+
+        results = {}
+        async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=30.0) as client:
+            for name in scenarios:
+                print(f"  {name}...", flush=True)
+                await drive(client, SCENARIOS[name], users, args.concurrency, args.warmup, rng)
+                result = await drive(client, SCENARIOS[name], users, args.concurrency, args.duration, rng)
+                results[name] = result.summary()
+    finally:
+        await close_db()
+
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else None
+    if baseline and (
+        baseline["meta"]["concurrency"] != args.concurrency
+        or baseline["meta"]["target"] != target
+        or baseline["dataset"] != counts
+    ):
+        print(f"\nWarning: {args.compare} used a different target, concurrency or dataset")
+    print_table(results, baseline)
+
+    revision = git_revision()
+    report = {
+        "meta": {
+            "revision": revision,
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "target": target,
+            "database": engine.dialect.name,
+            "python": platform.python_version(),
+            "concurrency": args.concurrency,
+            "duration_seconds": args.duration,
+            "warmup_seconds": args.warmup,
+            "sampled_users": len(users),
+            "seed": args.seed,
+        },
+        "dataset": counts,
+        "scenarios": results,
+    }
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"{datetime.utcnow():%Y%m%d-%H%M%S}-{revision or 'unknown'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\nResults written to {output}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", help="Running server to test (default: the app in-process)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Comma-separated scenarios to run")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent in-flight requests")
+    parser.add_argument("--duration", type=float, default=15.0, help="Measured seconds per scenario")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Unmeasured seconds before each scenario")
+    parser.add_argument("--sample-users", type=int, default=200, help="Benchmark users to spread requests over")
+    parser.add_argument("--tasks-per-user", type=int, default=50, help="Task ids loaded per sampled user")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for request selection")
+    parser.add_argument("--output", help="JSON results path (default: benchmarks/results/<time>-<commit>.json)")
+    parser.add_argument("--compare", help="Previous results JSON to compare against")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
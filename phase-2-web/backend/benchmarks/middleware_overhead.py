@@ -0,0 +1,159 @@
+"""
+Per-request overhead of the session middleware.
+
+Compares a bare ASGI endpoint against the same endpoint wrapped in:
+- before: SessionMiddleware on every HTTP request (the old
+  WebSocketSkipSessionMiddleware)
+- after: PathScopedSessionMiddleware limited to /api/auth/oauth
+
+Each variant is measured with and without a session cookie on a
+non-OAuth path (/api/tasks). The ASGI app is called directly, so the
+numbers isolate middleware cost from the network and the database.
+
+Usage (from phase-2-web/backend):
+    python benchmarks/middleware_overhead.py
+    python benchmarks/middleware_overhead.py --requests 50000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from starlette.middleware.sessions import SessionMiddleware
+
+from src.middleware import PathScopedSessionMiddleware
+
+
+SECRET_KEY = "benchmark-secret-key"
+
+
+async def endpoint(scope, receive, send):
+    """Minimal endpoint: touches the session if present, returns 200."""
+    session = scope.get("session")
+    if session is not None:
+        session.get("_state")
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"application/json")]
+    })
+    await send({"type": "http.response.body", "body": b"[]"})
+
+
+class WebSocketSkipSessionMiddleware(SessionMiddleware):
+    """The previous main.py middleware: sessions on every HTTP request."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "websocket":
+            await self.app(scope, receive, send)
+        else:
+            await super().__call__(scope, receive, send)
+
+
+def session_cookie() -> bytes:
+    """A signed session cookie like the one left behind by an OAuth login."""
+    captured = {}
+
+    async def set_session(scope, receive, send):
+        scope["session"]["_state_google_abc"] = {"data": {"nonce": "x" * 32}}
+        await endpoint(scope, receive, send)
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            for name, value in message["headers"]:
+                if name == b"set-cookie":
+                    captured["cookie"] = value.split(b";", 1)[0]
+
+    app = SessionMiddleware(set_session, secret_key=SECRET_KEY)
+    asyncio.run(app(make_scope("/api/auth/oauth/google", []), receive, send))
+    return captured["cookie"]
+
+
+def make_scope(path: str, headers: list) -> dict:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("test", 80),
+        "scheme": "http",
+        "root_path": "",
+    }
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def discard(message):
+    pass
+
+
+async def measure(app, scope: dict, requests: int) -> list:
+    """Time `requests` sequential calls; returns per-request microseconds."""
+    samples = []
+    for _ in range(requests):
+        call_scope = dict(scope)
+        start = time.perf_counter()
+        await app(call_scope, receive, discard)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return samples
+
+
+def summarize(samples: list) -> dict:
+    samples = sorted(samples)
+    return {
+        "mean": statistics.fmean(samples),
+        "p50": samples[len(samples) // 2],
+        "p99": samples[int(len(samples) * 0.99) - 1],
+    }
+
+
+async def run(requests: int, cookie: bytes) -> None:
+    variants = {
+        "no middleware": endpoint,
+        "before (all paths)": WebSocketSkipSessionMiddleware(endpoint, secret_key=SECRET_KEY, max_age=3600),
+        "after (OAuth only)": PathScopedSessionMiddleware(
+            endpoint, path_prefix="/api/auth/oauth", secret_key=SECRET_KEY, max_age=3600
+        ),
+    }
+    cases = {
+        "no cookie": make_scope("/api/tasks", []),
+        "with cookie": make_scope("/api/tasks", [(b"cookie", b"session=" + cookie.split(b"=", 1)[1])]),
+    }
+
+    print(f"{requests} requests per case, microseconds per request\n")
+    print(f"{'variant':<22}{'case':<14}{'mean':>8}{'p50':>8}{'p99':>8}{'overhead':>10}")
+
+    for case_name, scope in cases.items():
+        # Warm up and take the bare endpoint as the baseline
+        await measure(endpoint, scope, 1000)
+        baseline = summarize(await measure(endpoint, scope, requests))["mean"]
+
+        for name, app in variants.items():
+            await measure(app, scope, 1000)
+            stats = summarize(await measure(app, scope, requests))
+            print(
+                f"{name:<22}{case_name:<14}{stats['mean']:>8.2f}{stats['p50']:>8.2f}"
+                f"{stats['p99']:>8.2f}{stats['mean'] - baseline:>10.2f}"
+            )
+        print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000, help="Requests per case")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.requests, session_cookie()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+Synthetic data generator for load tests.
+
+Seeds the database at DATABASE_URL with benchmark users, tags, tasks and
+tag assignments. Volumes are configurable and the output is reproducible
+for a given --seed. Distributions are skewed like real usage:
+
+- Tasks and tags per user follow a Pareto distribution (a few heavy
+  users own most of the data, many users have a handful of tasks)
+- Status: 50% pending, 20% in progress, 30% completed
+- Priority: 30% low, 50% medium, 20% high
+- 60% of tasks have a due date (30 days back to 60 days ahead)
+- Tags per task: 0 (45%), 1 (35%), 2 (15%), 3 (5%), from the owner's tags
+- Titles and descriptions are drawn from a small vocabulary, so searches
+  match a realistic share of rows
+
+Benchmark users are named bench_<n> and share the password
+"benchmark-password". Re-running with --reset removes them (and their
+data) first; other users are never touched.
+
+Usage (from phase-2-web/backend, after `python -m src.schema init`):
+    python benchmarks/seed_data.py --users 1000 --tasks 100000 --tags 5000
+    python benchmarks/seed_data.py --users 10000 --tasks 1000000 --tags 50000 --reset
+"""
+import argparse
+import asyncio
+import bisect
+import itertools
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from uuid import UUID
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete, func, insert, select
+
+from src.auth.password import hash_password
+from src.database import engine, close_db
+from src.models import User, Task, Tag, TaskTag
+from src.models.task import PriorityEnum, StatusEnum
+
+
+USERNAME_PREFIX = "bench_"
+PASSWORD = "benchmark-password"
+
+VERBS = [
+    "Review", "Write", "Update", "Fix", "Plan", "Prepare", "Send", "Call",
+    "Schedule", "Clean", "Buy", "Read", "Refactor", "Deploy", "Test", "Draft",
+]
+NOUNS = [
+    "report", "invoice", "presentation", "budget", "email", "meeting notes",
+    "groceries", "garage", "release", "proposal", "backlog", "dashboard",
+    "contract", "newsletter", "roadmap", "documentation", "onboarding guide",
+]
+QUALIFIERS = [
+    "for Monday", "for the team", "before Friday", "with Alex", "for Q3",
+    "for the client", "urgent", "again", "this week", "v2", "draft", "",
+]
+TAG_WORDS = [
+    "work", "home", "urgent", "errands", "finance", "health", "reading",
+    "travel", "ideas", "family", "shopping", "learning", "backend", "design",
+]
+TAG_COLORS = [
+    "#3B82F6", "#EF4444", "#10B981", "#F59E0B", "#8B5CF6", "#EC4899", "#6B7280",
+]
+
+STATUSES = ([StatusEnum.PENDING, StatusEnum.IN_PROGRESS, StatusEnum.COMPLETED], [50, 20, 30])
+PRIORITIES = ([PriorityEnum.LOW, PriorityEnum.MEDIUM, PriorityEnum.HIGH], [30, 50, 20])
+TAGS_PER_TASK = ([0, 1, 2, 3], [45, 35, 15, 5])
+
+
+def uuid_from(rng: random.Random) -> UUID:
+    """Random UUID from the seeded generator (uuid4() would not be reproducible)."""
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def allocate(rng: random.Random, total: int, buckets: int, alpha: float = 1.16) -> list:
+    """
+    Split `total` items across `buckets` with Pareto-distributed weights
+    (alpha 1.16 is the classic 80/20 split).
+    """
+    weights = [rng.paretovariate(alpha) for _ in range(buckets)]
+    cum_weights = list(itertools.accumulate(weights))
+    counts = [0] * buckets
+    for _ in range(total):
+        counts[bisect.bisect(cum_weights, rng.random() * cum_weights[-1])] += 1
+    return counts
+
+
+async def insert_rows(table, rows: list, batch_size: int) -> None:
+    """Insert rows in batches, one transaction per batch."""
+    for start in range(0, len(rows), batch_size):
+        async with engine.begin() as conn:
+            await conn.execute(insert(table), rows[start:start + batch_size])
+
+
+async def reset() -> int:
+    """Delete benchmark users and everything they own. Returns users removed."""
+    bench_users = select(User.id).where(User.username.like(f"{USERNAME_PREFIX}%"))
+    bench_tasks = select(Task.id).where(Task.user_id.in_(bench_users))
+
+    async with engine.begin() as conn:
+        await conn.execute(delete(TaskTag).where(TaskTag.task_id.in_(bench_tasks)))
+        await conn.execute(delete(Task).where(Task.user_id.in_(bench_users)))
+        await conn.execute(delete(Tag).where(Tag.user_id.in_(bench_users)))
+        result = await conn.execute(delete(User).where(User.username.like(f"{USERNAME_PREFIX}%")))
+    return result.rowcount
+
+
+async def seed(users: int, tasks: int, tags: int, seed: int, batch_size: int) -> dict:
+    """Generate and insert the dataset. Returns the row counts inserted."""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    password_hash = hash_password(PASSWORD)
+
+    # Users
+    user_rows = []
+    for n in range(users):
+        created_at = now - timedelta(days=rng.uniform(30, 730))
+        user_rows.append({
+            "id": uuid_from(rng),
+            "username": f"{USERNAME_PREFIX}{n}",
+            "email": f"{USERNAME_PREFIX}{n}@example.com",
+            "password_hash": password_hash,
+            "is_active": True,
+            "created_at": created_at,
+            "updated_at": created_at,
+        })
+    await insert_rows(User.__table__, user_rows, batch_size)
+    user_ids = [row["id"] for row in user_rows]
+
+    # Tags (names unique per user)
+    tags_by_user = {}
+    tag_rows = []
+    for user_id, count in zip(user_ids, allocate(rng, tags, users)):
+        owned = []
+        for n in range(count):
+            word = TAG_WORDS[n % len(TAG_WORDS)]
+            tag_id = uuid_from(rng)
+            tag_rows.append({
+                "id": tag_id,
+                "user_id": user_id,
+                "name": word if n < len(TAG_WORDS) else f"{word}-{n // len(TAG_WORDS)}",
+                "color": rng.choice(TAG_COLORS),
+                "created_at": now - timedelta(days=rng.uniform(0, 365)),
+            })
+            owned.append(tag_id)
+        tags_by_user[user_id] = owned
+    await insert_rows(Tag.__table__, tag_rows, batch_size)
+
+    # Tasks and tag assignments, generated and inserted batch by batch
+    task_count = 0
+    assignment_count = 0
+    task_rows, task_tag_rows = [], []
+
+    async def flush() -> None:
+        await insert_rows(Task.__table__, task_rows, batch_size)
+        await insert_rows(TaskTag.__table__, task_tag_rows, batch_size)
+        task_rows.clear()
+        task_tag_rows.clear()
+
+    for user_id, count in zip(user_ids, allocate(rng, tasks, users)):
+        owned_tags = tags_by_user[user_id]
+        for _ in range(count):
+            task_id = uuid_from(rng)
+            created_at = now - timedelta(days=rng.uniform(0, 365))
+            status = rng.choices(*STATUSES)[0]
+            qualifier = rng.choice(QUALIFIERS)
+            title = f"{rng.choice(VERBS)} {rng.choice(NOUNS)} {qualifier}".strip()
+
+            task_rows.append({
+                "id": task_id,
+                "user_id": user_id,
+                "title": title,
+                "description": (
+                    f"{rng.choice(VERBS)} the {rng.choice(NOUNS)} and {rng.choice(VERBS).lower()} "
+                    f"the {rng.choice(NOUNS)}" if rng.random() < 0.4 else None
+                ),
+                "priority": rng.choices(*PRIORITIES)[0],
+                "status": status,
+                "due_date": now + timedelta(days=rng.uniform(-30, 60)) if rng.random() < 0.6 else None,
+                "created_at": created_at,
+                "updated_at": created_at,
+                "completed_at": created_at + timedelta(days=rng.uniform(0, 14)) if status == StatusEnum.COMPLETED else None,
+                "recurrence_rule": None,
+            })
+
+            if owned_tags:
+                picked = rng.sample(owned_tags, min(rng.choices(*TAGS_PER_TASK)[0], len(owned_tags)))
+                for tag_id in picked:
+                    task_tag_rows.append({"task_id": task_id, "tag_id": tag_id, "created_at": created_at})
+                assignment_count += len(picked)
+
+            task_count += 1
+            if len(task_rows) >= batch_size:
+                await flush()
+                print(f"  tasks: {task_count}/{tasks}", end="\r", flush=True)
+
+    await flush()
+    print()
+
+    return {"users": users, "tags": len(tag_rows), "tasks": task_count, "task_tags": assignment_count}
+
+
+async def dataset_counts() -> dict:
+    """Current benchmark row counts (used by load_test.py to label results)."""
+    bench_users = select(User.id).where(User.username.like(f"{USERNAME_PREFIX}%"))
+    async with engine.connect() as conn:
+        counts = {}
+        for name, statement in {
+            "users": select(func.count()).select_from(User).where(User.username.like(f"{USERNAME_PREFIX}%")),
+            "tags": select(func.count()).select_from(Tag).where(Tag.user_id.in_(bench_users)),
+            "tasks": select(func.count()).select_from(Task).where(Task.user_id.in_(bench_users)),
+        }.items():
+            counts[name] = (await conn.execute(statement)).scalar_one()
+    return counts
+
+
+async def run(args) -> None:
+    try:
+        if args.reset:
+            print(f"Removed {await reset()} benchmark users")
+
+        started = time.perf_counter()
+        counts = await seed(args.users, args.tasks, args.tags, args.seed, args.batch_size)
+        elapsed = time.perf_counter() - started
+
+        print(
+            f"Seeded {counts['users']} users, {counts['tags']} tags, {counts['tasks']} tasks, "
+            f"{counts['task_tags']} tag assignments in {elapsed:.1f}s"
+        )
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=1000, help="Benchmark users to create")
+    parser.add_argument("--tasks", type=int, default=100_000, help="Tasks across all users")
+    parser.add_argument("--tags", type=int, default=5000, help="Tags across all users")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (same seed, same data)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Rows per INSERT batch")
+    parser.add_argument("--reset", action="store_true", help="Remove existing benchmark users first")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -12,23 +12,39 @@ Setup:
     1. Create .env file (see .env.example)
     2. Set up PostgreSQL database (Neon recommended)
     3. Install dependencies: pip install -r requirements.txt
-    4. Run migrations: alembic upgrade head
+    4. Create/migrate the schema: python -m src.schema init
     5. Start server: uvicorn main:app --reload
 """
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Response
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.sessions import SessionMiddleware
 from contextlib import asynccontextmanager
 import json
+import logging
+import time
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 
 from src.config import settings
-from src.database import create_db_and_tables, close_db
+from src.database import warm_up_pool, close_db, replica_pool_engine
+from src.schema import check_schema
+from src.metrics import APP_STARTUP_SECONDS
+from src.middleware import PathScopedSessionMiddleware, QueryStatsMiddleware, MetricsMiddleware
+from src.auth.revocation import revocation_filter
+from src.auth.rate_limit import login_rate_limiter
+from src.replication import write_tracker
+from src.auth.oauth import start_oauth_http_client, close_oauth_http_client
+from src.loop_monitor import EventLoopMonitor
 from src.api.auth import router as auth_router
 from src.api.tasks import router as tasks_router
 from src.api.tags import router as tags_router
 
 
+logging.basicConfig(
+    level=settings.LOG_LEVEL,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+
+
 # ============================================================================
 # APPLICATION LIFECYCLE
 # ============================================================================
@@ -38,16 +54,19 @@ async def lifespan(app: FastAPI):
     """
     Application lifespan events.
 
-    Startup: Create database tables
-    Shutdown: Close database connections
+    Startup: Check schema revision, warm up connection pool, load refresh token revocation filter
+    Shutdown: Stop revocation sync, close database connections
     """
     # Startup
+    started = time.perf_counter()
     print("\n" + "="*70)
     print("Hackathon II - Phase 2: Todo Web Application Backend")
     print("="*70)
     print(f"App Name: {settings.APP_NAME}")
     print(f"Auth: JWT (Access: {settings.ACCESS_TOKEN_EXPIRE_MINUTES}min, Refresh: {settings.REFRESH_TOKEN_EXPIRE_DAYS}d)")
     print(f"Database: PostgreSQL (SQLModel + Async)")
+    print(f"DB Pool: size={settings.DB_POOL_SIZE}, overflow={settings.DB_MAX_OVERFLOW}, timeout={settings.DB_POOL_TIMEOUT}s")
+    print(f"Read Replica: {'enabled' if settings.READ_REPLICA_URL else 'disabled'}")
     print(f"CORS Origins: {', '.join(settings.CORS_ORIGINS)}")
     print(f"Debug Mode: {settings.DEBUG}")
     print("="*70)
@@ -55,14 +74,50 @@ async def lifespan(app: FastAPI):
     print("Health Check: http://localhost:8000/health")
     print("="*70 + "\n")
 
-    # Create database tables (if they don't exist)
-    await create_db_and_tables()
-    print("Database tables ready\n")
+    # Compare the schema revision with the code (tables are created by the init job)
+    if settings.SCHEMA_CHECK != "off":
+        schema = await check_schema()
+        print(("Schema: " if schema.up_to_date else "WARNING: ") + schema.describe())
+
+    # Open pool connections before traffic arrives
+    opened = await warm_up_pool()
+    print(f"Database pool warmed up ({opened}/{settings.DB_POOL_SIZE} connections)")
+    if replica_pool_engine is not None:
+        opened = await warm_up_pool(replica_pool_engine)
+        print(f"Read replica pool warmed up ({opened}/{settings.DB_POOL_SIZE} connections)")
+
+    # Load revoked refresh tokens and start cross-worker sync
+    await revocation_filter.start()
+    print("Refresh token revocation filter ready")
+
+    # Keep-alive client for OAuth provider APIs
+    await start_oauth_http_client()
+    print("OAuth HTTP client ready")
+
+    # Opt-in watchdog for blocking calls on the event loop
+    loop_monitor = None
+    if settings.LOOP_MONITOR_ENABLED:
+        loop_monitor = EventLoopMonitor(
+            interval=settings.LOOP_MONITOR_INTERVAL_MS / 1000,
+            threshold=settings.LOOP_LAG_THRESHOLD_MS / 1000
+        )
+        loop_monitor.start()
+        print(f"Event loop monitor started (threshold {settings.LOOP_LAG_THRESHOLD_MS:.0f}ms)")
+
+    startup_seconds = time.perf_counter() - started
+    APP_STARTUP_SECONDS.set(startup_seconds)
+    print(f"Startup completed in {startup_seconds * 1000:.0f}ms\n")
 
     yield
 
     # Shutdown
     print("\nShutting down application...")
+    if loop_monitor is not None:
+        await loop_monitor.stop()
+    await revocation_filter.stop()
+    await login_rate_limiter.close()
+    await write_tracker.close()
+    await close_oauth_http_client()
     await close_db()
     print("Database connections closed\n")
 
@@ -93,22 +148,17 @@ app = FastAPI(
 # MIDDLEWARE
 # ============================================================================
 
-# Session middleware (required for OAuth) - skip for WebSocket
-from starlette.middleware.base import BaseHTTPMiddleware
-
-class WebSocketSkipSessionMiddleware(SessionMiddleware):
-    async def __call__(self, scope, receive, send):
-        if scope["type"] == "websocket":
-            await self.app(scope, receive, send)
-        else:
-            await super().__call__(scope, receive, send)
-
+# Session middleware (required for OAuth) - pass-through outside the OAuth routes
 app.add_middleware(
-    WebSocketSkipSessionMiddleware,
+    PathScopedSessionMiddleware,
+    path_prefix="/api/auth/oauth",
     secret_key=settings.SECRET_KEY,
     max_age=3600  # 1 hour session timeout
 )
 
+# Per-request SQL stats: Server-Timing header + request log
+app.add_middleware(QueryStatsMiddleware, server_timing=settings.SERVER_TIMING)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -116,8 +166,12 @@ app.add_middleware(
     allow_credentials=True,  # Required for cookies/auth
     allow_methods=["*"],  # Allow all HTTP methods
     allow_headers=["*"],  # Allow all headers
+    expose_headers=["Server-Timing"],
 )
 
+# Prometheus request metrics (outermost, sees every request)
+app.add_middleware(MetricsMiddleware)
+
 # ============================================================================
 # ROUTERS
 # ============================================================================
@@ -208,6 +262,7 @@ async def health_check():
         "endpoints": {
             "docs": "/docs",
             "redoc": "/redoc",
+            "metrics": "/metrics",
             "auth": "/api/auth/*",
             "tasks": "/api/tasks",
             "tags": "/api/tags"
@@ -215,6 +270,14 @@ async def health_check():
     }
 
 
+@app.get("/metrics", tags=["System"], include_in_schema=False)
+async def metrics() -> Response:
+    """
+    Prometheus metrics endpoint.
+    """
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/", tags=["System"])
 async def root():
     """
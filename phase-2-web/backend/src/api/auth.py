@@ -4,28 +4,55 @@ Authentication API endpoints.
 Implements @specs/features/authentication.md:
 - POST /api/auth/register - User registration
 - POST /api/auth/login - User login with JWT tokens
-- POST /api/auth/refresh - Refresh access token
-- POST /api/auth/logout - Logout (invalidate tokens)
+- POST /api/auth/refresh - Refresh access token (rotates refresh token)
+- POST /api/auth/logout - Logout (revoke refresh token)
 - GET /api/auth/me - Get current user info
 - POST /api/auth/change-password - Change user password
+- POST /api/auth/tokens - Create personal access token
+- GET /api/auth/tokens - List personal access tokens
+- DELETE /api/auth/tokens/{id} - Revoke personal access token
 - GET /api/auth/oauth/{provider} - OAuth login (Google, GitHub)
 - GET /api/auth/oauth/{provider}/callback - OAuth callback
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.responses import RedirectResponse
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
-from typing import Annotated
+from sqlalchemy.exc import IntegrityError
+from typing import Annotated, Optional, List
+from datetime import datetime, timedelta
+from uuid import UUID
 import secrets
+import math
+import re
 
-from src.database import get_session
+from src.database import get_session, get_read_session, insert_on_conflict
 from src.models.user import User
+from src.models.personal_access_token import PersonalAccessToken
 from src.schemas.user import UserCreate, UserLogin, UserResponse, Token, ChangePassword
+from src.schemas.personal_token import PersonalTokenCreate, PersonalTokenResponse, PersonalTokenCreated
 from src.auth.password import hash_password, verify_password
-from src.auth.jwt import create_access_token, create_refresh_token, verify_token
-from src.auth.dependencies import get_current_active_user
+from src.auth.jwt import create_access_token, verify_token
+from src.auth.refresh_tokens import (
+    issue_refresh_token,
+    rotate_refresh_token,
+    revoke_refresh_token,
+    revoke_user_refresh_tokens,
+)
+from src.auth.revocation import revocation_filter
+from src.auth.rate_limit import login_rate_limiter
+from src.auth.personal_tokens import generate_personal_token, hash_personal_token, personal_token_cache
+from src.auth.dependencies import (
+    get_current_active_user,
+    get_current_active_reader,
+    get_current_session_user,
+    get_current_session_reader,
+)
 from src.auth.oauth import oauth, get_google_user_info, get_github_user_info
+from src.replication import record_write
 from src.config import settings
+from src.metrics import LOGIN_RATE_LIMITED
 
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
@@ -50,25 +77,7 @@ async def register(
     Raises:
         HTTPException 400: If username or email already exists
     """
-    # Check if username exists
-    statement = select(User).where(User.username == user_data.username)
-    result = await session.execute(statement)
-    if result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already registered"
-        )
-
-    # Check if email exists
-    statement = select(User).where(User.email == user_data.email)
-    result = await session.execute(statement)
-    if result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-
-    # Create new user
+    # Create new user; the unique username/email indexes reject duplicates
     user = User(
         username=user_data.username,
         email=user_data.email,
@@ -76,13 +85,35 @@ async def register(
         is_active=True
     )
 
-    session.add(user)
-    await session.commit()
-    await session.refresh(user)
+    statement = (
+        insert_on_conflict(session, User)
+        .values(**user.model_dump())
+        .on_conflict_do_nothing()
+    )
+    result = await session.execute(statement)
+
+    if result.rowcount == 0:
+        await session.rollback()
+        # Only reached on conflict: find out which field collided
+        statement = select(User.username).where(User.username == user_data.username)
+        result = await session.execute(statement)
+        detail = (
+            "Username already registered"
+            if result.first() is not None
+            else "Email already registered"
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
 
     # Generate tokens
     access_token = create_access_token(user.id, user.username)
-    refresh_token = create_refresh_token(user.id, user.username)
+    refresh_token = issue_refresh_token(session, user)
+
+    await session.commit()
+    # The new account may not be on the read replica yet
+    await record_write(user.id)
 
     return Token(
         access_token=access_token,
@@ -95,6 +126,7 @@ async def register(
 @router.post("/login", response_model=Token)
 async def login(
     credentials: UserLogin,
+    request: Request,
     session: AsyncSession = Depends(get_session)
 ) -> Token:
     """
@@ -103,9 +135,27 @@ async def login(
     Accepts either username OR email in username_or_email field.
     Returns JWT access token (30min) and refresh token (7 days).
 
+    Attempts are throttled per client IP and per username/email before
+    the password is checked, so floods cannot burn bcrypt CPU.
+
     Raises:
         HTTPException 401: If credentials are invalid
+        HTTPException 429: If too many attempts (see Retry-After header)
     """
+    # Throttle before touching the database or bcrypt
+    if settings.LOGIN_RATE_LIMIT_ENABLED:
+        client_ip = request.client.host if request.client else "unknown"
+        retry_after, scope = await login_rate_limiter.check(
+            client_ip, credentials.username_or_email
+        )
+        if scope:
+            LOGIN_RATE_LIMITED.labels(scope=scope).inc()
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many login attempts. Please try again later.",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
     # Try to find user by username or email
     statement = select(User).where(
         (User.username == credentials.username_or_email) |
@@ -131,7 +181,8 @@ async def login(
 
     # Generate tokens
     access_token = create_access_token(user.id, user.username)
-    refresh_token = create_refresh_token(user.id, user.username)
+    refresh_token = issue_refresh_token(session, user)
+    await session.commit()
 
     return Token(
         access_token=access_token,
@@ -152,24 +203,39 @@ async def refresh_token_endpoint(
     Exchange a valid refresh token for a new access token.
     Useful when access token expires (30 minutes).
 
+    Refresh tokens are single-use: the presented token is revoked and a new
+    one is returned. Presenting a revoked token again is treated as token
+    theft and revokes all of the user's refresh tokens.
+
     Args:
         refresh_token: Valid refresh token (from login response)
 
     Returns:
-        New access token and same refresh token
+        New access token and a new (rotated) refresh token
 
     Raises:
-        HTTPException 401: If refresh token is invalid or expired
+        HTTPException 401: If refresh token is invalid, expired or revoked
     """
-    # Verify refresh token
+    # Verify refresh token (tokens issued before rotation carry no jti)
     token_data = verify_token(refresh_token, token_type="refresh")
-    if token_data is None:
+    if token_data is None or token_data.jti is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid refresh token",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    revoked_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Refresh token has been revoked",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    # Revocation check (in-memory; only Bloom false positives hit the database)
+    if await revocation_filter.is_revoked(token_data.jti, session):
+        await revoke_user_refresh_tokens(session, token_data.user_id)
+        raise revoked_exception
+
     # Get user from database
     statement = select(User).where(User.id == token_data.user_id)
     result = await session.execute(statement)
@@ -187,37 +253,49 @@ async def refresh_token_endpoint(
             detail="User account is inactive"
         )
 
-    # Generate new access token (keep same refresh token)
+    # Rotate refresh token. This fails if the token was already rotated or
+    # revoked but this worker's filter has not heard of it yet: also reuse.
+    new_refresh_token = await rotate_refresh_token(session, token_data.jti, user)
+    if new_refresh_token is None:
+        await revoke_user_refresh_tokens(session, user.id)
+        raise revoked_exception
+
     new_access_token = create_access_token(user.id, user.username)
 
     return Token(
         access_token=new_access_token,
-        refresh_token=refresh_token,  # Return same refresh token
+        refresh_token=new_refresh_token,
         token_type="bearer",
         user=UserResponse.model_validate(user)
     )
 
 
 @router.post("/logout")
-async def logout() -> dict:
+async def logout(
+    refresh_token: Optional[str] = None,
+    session: AsyncSession = Depends(get_session)
+) -> dict:
     """
     Logout user.
 
-    Note: JWT tokens are stateless, so we can't truly "invalidate" them server-side
-    without a token blacklist (which adds complexity).
+    Revokes the given refresh token so it can no longer be exchanged for
+    access tokens. Access tokens stay valid until they expire (30min).
 
-    For MVP, the client should:
+    The client should also:
     1. Delete tokens from storage (localStorage, cookies)
     2. Stop including Authorization header in requests
 
-    For production, consider:
-    - Token blacklist in Redis
-    - Short-lived access tokens (current: 30min)
-    - Token versioning per user
+    Args:
+        refresh_token: Refresh token to revoke (optional)
 
     Returns:
         Success message
     """
+    if refresh_token:
+        token_data = verify_token(refresh_token, token_type="refresh")
+        if token_data is not None and token_data.jti is not None:
+            await revoke_refresh_token(session, token_data.jti)
+
     return {
         "message": "Logout successful",
         "detail": "Clear tokens from client storage"
@@ -226,7 +304,7 @@ async def logout() -> dict:
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
-    current_user: Annotated[User, Depends(get_current_active_user)]
+    current_user: Annotated[User, Depends(get_current_active_reader)]
 ) -> UserResponse:
     """
     Get current authenticated user information.
@@ -253,6 +331,10 @@ async def change_password(
     - New password (min 8 chars, uppercase, lowercase, number)
     - Confirm password (must match new password)
 
+    Every refresh token of the user is revoked, including the one behind
+    this request: all sessions, this one too, must log in again once their
+    access token expires (ACCESS_TOKEN_EXPIRE_MINUTES).
+
     Args:
         password_data: Password change request data
         current_user: Current authenticated user
@@ -294,12 +376,203 @@ async def change_password(
     session.add(current_user)
     await session.commit()
 
+    # End every session, this one included: no refresh token issued before
+    # the change works any more, so each client logs in again when its
+    # access token expires
+    await revoke_user_refresh_tokens(session, current_user.id)
+
     return {
         "message": "Password changed successfully",
-        "detail": "Your password has been updated. Please use your new password for future logins."
+        "detail": "Your password has been updated. All sessions, including this one, will need to log in again with the new password."
     }
 
 
+def _personal_token_response(token: PersonalAccessToken) -> PersonalTokenResponse:
+    """Convert a token row to its response schema."""
+    return PersonalTokenResponse(
+        id=token.id,
+        name=token.name,
+        token_prefix=token.token_prefix,
+        scopes=token.scope_list,
+        created_at=token.created_at,
+        expires_at=token.expires_at,
+        revoked_at=token.revoked_at
+    )
+
+
+@router.post("/tokens", response_model=PersonalTokenCreated, status_code=status.HTTP_201_CREATED)
+async def create_personal_token(
+    token_data: PersonalTokenCreate,
+    current_user: Annotated[User, Depends(get_current_session_user)],
+    session: AsyncSession = Depends(get_session)
+) -> PersonalTokenCreated:
+    """
+    Create a personal access token for a machine client.
+
+    Use it as a Bearer token (e.g. BACKEND_AUTH_TOKEN for the MCP server).
+    Unlike JWT access tokens it does not expire after 30 minutes, and it
+    can be revoked at any time.
+
+    The plaintext token is only returned in this response; the server
+    stores an HMAC digest.
+
+    The token endpoints require a signed-in session (JWT); personal access
+    tokens get 403 here.
+    """
+    plaintext = generate_personal_token()
+    expires_at = None
+    if token_data.expires_in_days:
+        expires_at = datetime.utcnow() + timedelta(days=token_data.expires_in_days)
+
+    token = PersonalAccessToken(
+        user_id=current_user.id,
+        name=token_data.name,
+        token_digest=hash_personal_token(plaintext),
+        token_prefix=plaintext[:12],
+        scopes=" ".join(sorted(set(token_data.scopes))),
+        expires_at=expires_at
+    )
+
+    session.add(token)
+    await session.commit()
+
+    return PersonalTokenCreated(
+        **_personal_token_response(token).model_dump(),
+        token=plaintext
+    )
+
+
+@router.get("/tokens", response_model=List[PersonalTokenResponse])
+async def list_personal_tokens(
+    current_user: Annotated[User, Depends(get_current_session_reader)],
+    session: AsyncSession = Depends(get_read_session)
+) -> List[PersonalTokenResponse]:
+    """
+    List the current user's personal access tokens (newest first).
+    Tokens themselves are never returned, only their prefix.
+    """
+    statement = (
+        select(PersonalAccessToken)
+        .where(PersonalAccessToken.user_id == current_user.id)
+        .order_by(PersonalAccessToken.created_at.desc())
+    )
+    result = await session.execute(statement)
+    tokens = result.scalars().all()
+
+    return [_personal_token_response(token) for token in tokens]
+
+
+@router.delete("/tokens/{token_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_personal_token(
+    token_id: UUID,
+    current_user: Annotated[User, Depends(get_current_session_user)],
+    session: AsyncSession = Depends(get_session)
+) -> None:
+    """
+    Revoke a personal access token.
+
+    Takes effect immediately on this worker and within
+    PAT_CACHE_TTL_SECONDS on other workers.
+
+    Raises:
+        HTTPException 404: Token not found (or belongs to another user)
+    """
+    statement = select(PersonalAccessToken).where(
+        PersonalAccessToken.id == token_id,
+        PersonalAccessToken.user_id == current_user.id
+    )
+    result = await session.execute(statement)
+    token = result.scalar_one_or_none()
+
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Token not found"
+        )
+
+    if token.revoked_at is None:
+        token.revoked_at = datetime.utcnow()
+        await session.commit()
+
+    personal_token_cache.invalidate_token(token.id)
+
+    return None
+
+
+async def _allocate_username(session: AsyncSession, base_username: str) -> str:
+    """
+    Pick a free username: base_username itself, or base_username{n} with
+    the lowest free n. Uses a single prefix scan instead of one query per
+    candidate.
+    """
+    # Fit the username rules (alphanumeric + underscore, 3-50 chars incl. suffix)
+    base = re.sub(r"[^a-zA-Z0-9_]", "_", base_username)[:44] or "user"
+    if len(base) < 3:
+        base = f"{base}_user"
+
+    escaped = base.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    statement = select(User.username).where(User.username.like(f"{escaped}%", escape="\\"))
+    result = await session.execute(statement)
+
+    taken = set()
+    for name in result.scalars().all():
+        suffix = name[len(base):]
+        if suffix == "":
+            taken.add(0)
+        elif suffix.isdigit():
+            taken.add(int(suffix))
+
+    if 0 not in taken:
+        return base
+
+    counter = 1
+    while counter in taken:
+        counter += 1
+    return f"{base}{counter}"
+
+
+async def _get_or_create_oauth_user(session: AsyncSession, email: str, username: str) -> User:
+    """
+    Find the user with this email, or create one.
+
+    Concurrent logins can race for the same username or email; the unique
+    constraints catch that and the lookup/allocation is retried.
+    """
+    password_hash = None
+
+    for _ in range(3):
+        statement = select(User).where(User.email == email)
+        result = await session.execute(statement)
+        user = result.scalar_one_or_none()
+        if user:
+            return user
+
+        # Random password (user won't use it for OAuth login). Only new users
+        # pay for bcrypt, and off the event loop.
+        if password_hash is None:
+            password_hash = await run_in_threadpool(hash_password, secrets.token_urlsafe(32))
+
+        user = User(
+            username=await _allocate_username(session, username),
+            email=email,
+            password_hash=password_hash,
+            is_active=True
+        )
+
+        try:
+            async with session.begin_nested():
+                session.add(user)
+        except IntegrityError:
+            continue
+
+        return user
+
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Could not allocate a unique username"
+    )
+
+
 @router.get("/oauth/{provider}")
 async def oauth_login(provider: str, request: Request):
     """
@@ -393,37 +666,8 @@ async def oauth_callback(
                 detail="Unable to retrieve email from OAuth provider"
             )
 
-        # Check if user exists
-        statement = select(User).where(User.email == email)
-        result = await session.execute(statement)
-        user = result.scalar_one_or_none()
-
-        if not user:
-            # Create new user with OAuth
-            # Generate a random secure password (user won't use it for OAuth login)
-            random_password = secrets.token_urlsafe(32)
-
-            # Ensure username is unique
-            base_username = username
-            counter = 1
-            while True:
-                statement = select(User).where(User.username == username)
-                result = await session.execute(statement)
-                if not result.scalar_one_or_none():
-                    break
-                username = f"{base_username}{counter}"
-                counter += 1
-
-            user = User(
-                username=username,
-                email=email,
-                password_hash=hash_password(random_password),
-                is_active=True
-            )
-
-            session.add(user)
-            await session.commit()
-            await session.refresh(user)
+        # Find user by email or create one with a free username
+        user = await _get_or_create_oauth_user(session, email, username)
 
         # Check if user is active
         if not user.is_active:
@@ -434,7 +678,9 @@ async def oauth_callback(
 
         # Generate JWT tokens
         access_token = create_access_token(user.id, user.username)
-        refresh_token = create_refresh_token(user.id, user.username)
+        refresh_token = issue_refresh_token(session, user)
+        await session.commit()
+        await record_write(user.id)
 
         # Redirect to frontend with tokens
         frontend_url = settings.OAUTH_REDIRECT_URI
@@ -11,23 +11,26 @@ Implements tag system for task categorization:
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
+from sqlalchemy.exc import IntegrityError
 from typing import Annotated, List
 from uuid import UUID
 
-from src.database import get_session
+from src.database import get_session, get_read_session, insert_on_conflict
 from src.models.user import User
 from src.models.tag import Tag, TaskTag
 from src.schemas.tag import TagCreate, TagUpdate, TagResponse
-from src.auth.dependencies import get_current_active_user
+from src.auth.dependencies import get_current_active_user, get_current_active_reader
+from src.instrumentation import query_budget
 
 
 router = APIRouter(prefix="/api/tags", tags=["Tags"])
 
 
 @router.get("", response_model=List[TagResponse])
+@query_budget(2)
 async def list_tags(
-    current_user: Annotated[User, Depends(get_current_active_user)],
-    session: AsyncSession = Depends(get_session),
+    current_user: Annotated[User, Depends(get_current_active_reader)],
+    session: AsyncSession = Depends(get_read_session),
 ) -> List[TagResponse]:
     """
     List all tags for the current user.
@@ -44,6 +47,7 @@ async def list_tags(
 
 
 @router.post("", response_model=TagResponse, status_code=status.HTTP_201_CREATED)
+@query_budget(2)
 async def create_tag(
     tag_data: TagCreate,
     current_user: Annotated[User, Depends(get_current_active_user)],
@@ -60,39 +64,37 @@ async def create_tag(
     Raises:
         HTTPException 400: If tag name already exists for this user
     """
-    # Check if tag name already exists for this user
-    statement = select(Tag).where(
-        Tag.user_id == current_user.id,
-        Tag.name == tag_data.name
+    # Create new tag; the (user_id, name) constraint rejects duplicates
+    tag = Tag(
+        user_id=current_user.id,
+        name=tag_data.name,
+        color=tag_data.color
+    )
+
+    statement = (
+        insert_on_conflict(session, Tag)
+        .values(**tag.model_dump())
+        .on_conflict_do_nothing(index_elements=["user_id", "name"])
     )
     result = await session.execute(statement)
-    existing_tag = result.scalar_one_or_none()
 
-    if existing_tag:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Tag with name '{tag_data.name}' already exists"
         )
 
-    # Create new tag
-    tag = Tag(
-        user_id=current_user.id,
-        name=tag_data.name,
-        color=tag_data.color
-    )
-
-    session.add(tag)
     await session.commit()
-    await session.refresh(tag)
 
     return TagResponse.model_validate(tag)
 
 
 @router.get("/{tag_id}", response_model=TagResponse)
+@query_budget(2)
 async def get_tag(
     tag_id: UUID,
-    current_user: Annotated[User, Depends(get_current_active_user)],
-    session: AsyncSession = Depends(get_session),
+    current_user: Annotated[User, Depends(get_current_active_reader)],
+    session: AsyncSession = Depends(get_read_session),
 ) -> TagResponse:
     """
     Get a specific tag by ID.
@@ -125,6 +127,7 @@ async def get_tag(
 
 
 @router.put("/{tag_id}", response_model=TagResponse)
+@query_budget(4)
 async def update_tag(
     tag_id: UUID,
     tag_data: TagUpdate,
@@ -162,33 +165,27 @@ async def update_tag(
             detail="Not authorized to update this tag"
         )
 
-    # Check for duplicate name if name is being updated
-    if tag_data.name and tag_data.name != tag.name:
-        statement = select(Tag).where(
-            Tag.user_id == current_user.id,
-            Tag.name == tag_data.name
-        )
-        result = await session.execute(statement)
-        existing_tag = result.scalar_one_or_none()
-
-        if existing_tag:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Tag with name '{tag_data.name}' already exists"
-            )
-
     # Update fields (only if provided)
     update_data = tag_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(tag, field, value)
 
-    await session.commit()
+    # A rename onto an existing name violates the (user_id, name) constraint
+    try:
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Tag with name '{tag_data.name}' already exists"
+        )
     await session.refresh(tag)
 
     return TagResponse.model_validate(tag)
 
 
 @router.delete("/{tag_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(5)
 async def delete_tag(
     tag_id: UUID,
     current_user: Annotated[User, Depends(get_current_active_user)],
@@ -11,29 +11,32 @@ Implements @specs/features/task-crud.md with user isolation:
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import select, or_, and_, func
-from sqlalchemy import desc, asc
+from sqlmodel import select, delete, or_, and_, func
+from sqlalchemy import desc, asc, case, true
+from sqlalchemy.orm import aliased
 from typing import Annotated, Optional, List
 from uuid import UUID
 from datetime import datetime
 
-from src.database import get_session
+from src.database import get_session, get_read_session, insert_on_conflict
 from src.models.user import User
 from src.models.task import Task, StatusEnum, PriorityEnum
 from src.models.tag import Tag, TaskTag
 from src.schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskWithTags, TagInResponse
 from src.schemas.tag import AssignTagRequest
 from src.schemas.common import MessageResponse, PaginatedResponse
-from src.auth.dependencies import get_current_active_user
+from src.auth.dependencies import get_current_active_user, get_current_active_reader
+from src.instrumentation import query_budget
 
 
 router = APIRouter(prefix="/api/tasks", tags=["Tasks"])
 
 
 @router.get("", response_model=PaginatedResponse[TaskResponse])
+@query_budget(2)
 async def list_tasks(
-    current_user: Annotated[User, Depends(get_current_active_user)],
-    session: AsyncSession = Depends(get_session),
+    current_user: Annotated[User, Depends(get_current_active_reader)],
+    session: AsyncSession = Depends(get_read_session),
     # Filters
     status_filter: Optional[StatusEnum] = Query(None, alias="status", description="Filter by status"),
     priority: Optional[PriorityEnum] = Query(None, description="Filter by priority"),
@@ -42,7 +45,7 @@ async def list_tasks(
     date_from: Optional[datetime] = Query(None, description="Filter tasks with due_date >= this date"),
     date_to: Optional[datetime] = Query(None, description="Filter tasks with due_date <= this date"),
     # Sorting
-    sort_by: Optional[str] = Query("created_at", description="Sort by field (created_at, due_date, priority, title, status)"),
+    sort_by: Optional[str] = Query("created_at", description="Sort by field (created_at, due_date, priority, title, status, relevance)"),
     sort_order: Optional[str] = Query("desc", description="Sort order (asc, desc)"),
     # Pagination
     page: int = Query(1, ge=1, description="Page number (starts at 1)"),
@@ -60,7 +63,8 @@ async def list_tasks(
     - date_to: Tasks with due_date <= this date
 
     **Sorting:**
-    - sort_by: created_at (default), due_date, priority, title, status
+    - sort_by: created_at (default), due_date, priority, title, status,
+      relevance (with search: title prefix, then title, then description matches)
     - sort_order: desc (default), asc
 
     **Pagination:**
@@ -81,6 +85,7 @@ async def list_tasks(
     - `/api/tasks?search=urgent&status=pending&page=1&limit=20`
     - `/api/tasks?tag_ids=uuid1&tag_ids=uuid2&page=2`
     - `/api/tasks?date_from=2025-01-01&date_to=2025-12-31&sort_by=due_date&sort_order=asc`
+    - `/api/tasks?search=report&sort_by=relevance&limit=5`
     - `/api/tasks?limit=50&page=1`
     """
     # Base query - filter by user
@@ -106,10 +111,14 @@ async def list_tasks(
 
     # Apply tag filter (tasks with ANY of the specified tags)
     if tag_ids:
-        # Join with TaskTag to filter by tags
-        statement = statement.join(TaskTag).where(
-            TaskTag.tag_id.in_([UUID(tag_id) for tag_id in tag_ids])
-        ).distinct()
+        # Semi-join on TaskTag (no duplicate rows, no DISTINCT needed)
+        statement = statement.where(
+            Task.id.in_(
+                select(TaskTag.task_id).where(
+                    TaskTag.tag_id.in_([UUID(tag_id) for tag_id in tag_ids])
+                )
+            )
+        )
 
     # Apply date range filters
     if date_from:
@@ -133,27 +142,56 @@ async def list_tasks(
         sort_column = Task.created_at
 
     # Apply sort order
-    if sort_by != "priority":
+    ordering = []
+    if sort_by == "relevance":
+        # Best matches first, newest first within a rank
+        if search:
+            rank = case(
+                (Task.title.ilike(f"{search}%"), 0),
+                (Task.title.ilike(f"%{search}%"), 1),
+                else_=2
+            )
+            ordering = [rank, desc(Task.created_at)]
+        else:
+            ordering = [desc(Task.created_at)]
+    elif sort_by != "priority":
         if sort_order == "asc":
-            statement = statement.order_by(asc(sort_column))
+            ordering = [asc(sort_column)]
         else:
-            statement = statement.order_by(desc(sort_column))
+            ordering = [desc(sort_column)]
     else:
         # For priority, we'll sort in Python after fetching
         pass
 
-    # Count total items (before pagination)
-    count_statement = select(func.count()).select_from(statement.alias())
-    total_result = await session.execute(count_statement)
-    total = total_result.scalar() or 0
-
-    # Apply pagination
+    # Apply pagination. The page is outer-joined onto the filtered count,
+    # so the page and the total are one query, and a page past the end
+    # still returns one row carrying the total.
     offset = (page - 1) * limit
-    statement = statement.offset(offset).limit(limit)
+    total_subquery = (
+        select(func.count().label("total"))
+        .select_from(statement.subquery())
+        .subquery()
+    )
+    page_subquery = (
+        statement
+        .add_columns(func.row_number().over(order_by=ordering).label("position"))
+        .order_by(*ordering)
+        .offset(offset)
+        .limit(limit)
+        .subquery()
+    )
+    page_task = aliased(Task, page_subquery)
+    page_statement = (
+        select(page_task, total_subquery.c.total)
+        .select_from(total_subquery.outerjoin(page_subquery, true()))
+        .order_by(page_subquery.c.position)
+    )
 
     # Execute query
-    result = await session.execute(statement)
-    tasks = result.scalars().all()
+    result = await session.execute(page_statement)
+    rows = result.all()
+    tasks = [row[0] for row in rows if row[0] is not None]
+    total = rows[0].total if rows else 0
 
     # Custom priority sorting if needed (only for current page)
     if sort_by == "priority":
@@ -178,6 +216,7 @@ async def list_tasks(
 
 
 @router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
+@query_budget(3)
 async def create_task(
     task_data: TaskCreate,
     current_user: Annotated[User, Depends(get_current_active_user)],
@@ -210,10 +249,11 @@ async def create_task(
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
+@query_budget(2)
 async def get_task(
     task_id: UUID,
-    current_user: Annotated[User, Depends(get_current_active_user)],
-    session: AsyncSession = Depends(get_session),
+    current_user: Annotated[User, Depends(get_current_active_reader)],
+    session: AsyncSession = Depends(get_read_session),
 ) -> TaskResponse:
     """
     Get a specific task by ID.
@@ -246,6 +286,7 @@ async def get_task(
 
 
 @router.put("/{task_id}", response_model=TaskResponse)
+@query_budget(4)
 async def update_task(
     task_id: UUID,
     task_data: TaskUpdate,
@@ -297,6 +338,7 @@ async def update_task(
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(5)
 async def delete_task(
     task_id: UUID,
     current_user: Annotated[User, Depends(get_current_active_user)],
@@ -337,6 +379,7 @@ async def delete_task(
 
 
 @router.patch("/{task_id}/complete", response_model=TaskResponse)
+@query_budget(4)
 async def toggle_task_completion(
     task_id: UUID,
     current_user: Annotated[User, Depends(get_current_active_user)],
@@ -391,6 +434,7 @@ async def toggle_task_completion(
 # ============================================================================
 
 @router.post("/{task_id}/tags", response_model=TaskWithTags, status_code=status.HTTP_200_OK)
+@query_budget(3)
 async def assign_tag_to_task(
     task_id: UUID,
     tag_request: AssignTagRequest,
@@ -411,17 +455,30 @@ async def assign_tag_to_task(
         HTTPException 404: Task or tag not found
         HTTPException 403: Task or tag belongs to another user
     """
-    # Get task from database
-    statement = select(Task).where(Task.id == task_id)
+    # One query: the task, its assigned tags and the requested tag
+    requested = aliased(Tag)
+    assigned = aliased(Tag)
+    statement = (
+        select(Task, requested, assigned)
+        .select_from(Task)
+        .outerjoin(requested, requested.id == tag_request.tag_id)
+        .outerjoin(TaskTag, TaskTag.task_id == Task.id)
+        .outerjoin(assigned, assigned.id == TaskTag.tag_id)
+        .where(Task.id == task_id)
+        .order_by(TaskTag.created_at)
+    )
     result = await session.execute(statement)
-    task = result.scalar_one_or_none()
+    rows = result.all()
 
-    if not task:
+    if not rows:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
 
+    task, tag = rows[0][0], rows[0][1]
+    tags = [row[2] for row in rows if row[2] is not None]
+
     # Verify user owns this task
     if task.user_id != current_user.id:
         raise HTTPException(
@@ -429,11 +486,6 @@ async def assign_tag_to_task(
             detail="Not authorized to modify this task"
         )
 
-    # Get tag from database
-    statement = select(Tag).where(Tag.id == tag_request.tag_id)
-    result = await session.execute(statement)
-    tag = result.scalar_one_or_none()
-
     if not tag:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -447,25 +499,26 @@ async def assign_tag_to_task(
             detail="Not authorized to use this tag"
         )
 
-    # Check if tag is already assigned (idempotent)
-    statement = select(TaskTag).where(
-        TaskTag.task_id == task_id,
-        TaskTag.tag_id == tag_request.tag_id
-    )
-    result = await session.execute(statement)
-    existing = result.scalar_one_or_none()
-
-    if not existing:
-        # Create task-tag relationship
-        task_tag = TaskTag(task_id=task_id, tag_id=tag_request.tag_id)
-        session.add(task_tag)
+    # Create task-tag relationship unless already assigned (idempotent)
+    if all(assigned_tag.id != tag.id for assigned_tag in tags):
+        statement = (
+            insert_on_conflict(session, TaskTag)
+            .values(**TaskTag(task_id=task_id, tag_id=tag.id).model_dump())
+            .on_conflict_do_nothing()
+        )
+        await session.execute(statement)
         await session.commit()
+        tags.append(tag)
 
     # Return task with all tags
-    return await get_task_with_tags(task_id, session)
+    task_dict = TaskResponse.model_validate(task).model_dump()
+    task_dict["tags"] = [TagInResponse.model_validate(t) for t in tags]
+
+    return TaskWithTags(**task_dict)
 
 
 @router.delete("/{task_id}/tags/{tag_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(3)
 async def remove_tag_from_task(
     task_id: UUID,
     tag_id: UUID,
@@ -503,26 +556,23 @@ async def remove_tag_from_task(
             detail="Not authorized to modify this task"
         )
 
-    # Find and delete task-tag relationship
-    statement = select(TaskTag).where(
+    # Delete task-tag relationship (no-op if not assigned)
+    statement = delete(TaskTag).where(
         TaskTag.task_id == task_id,
         TaskTag.tag_id == tag_id
     )
-    result = await session.execute(statement)
-    task_tag = result.scalar_one_or_none()
-
-    if task_tag:
-        await session.delete(task_tag)
-        await session.commit()
+    await session.execute(statement)
+    await session.commit()
 
     return None
 
 
 @router.get("/{task_id}/tags", response_model=List[TagInResponse])
+@query_budget(2)
 async def get_task_tags(
     task_id: UUID,
-    current_user: Annotated[User, Depends(get_current_active_user)],
-    session: AsyncSession = Depends(get_session),
+    current_user: Annotated[User, Depends(get_current_active_reader)],
+    session: AsyncSession = Depends(get_read_session),
 ) -> List[TagInResponse]:
     """
     Get all tags assigned to a task.
@@ -533,17 +583,25 @@ async def get_task_tags(
         HTTPException 404: Task not found
         HTTPException 403: Task belongs to another user
     """
-    # Get task from database
-    statement = select(Task).where(Task.id == task_id)
+    # One query: the task and its tags
+    statement = (
+        select(Task, Tag)
+        .outerjoin(TaskTag, TaskTag.task_id == Task.id)
+        .outerjoin(Tag, Tag.id == TaskTag.tag_id)
+        .where(Task.id == task_id)
+        .order_by(TaskTag.created_at)
+    )
     result = await session.execute(statement)
-    task = result.scalar_one_or_none()
+    rows = result.all()
 
-    if not task:
+    if not rows:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
 
+    task = rows[0][0]
+
     # Verify user owns this task
     if task.user_id != current_user.id:
         raise HTTPException(
@@ -551,41 +609,6 @@ async def get_task_tags(
             detail="Not authorized to access this task"
         )
 
-    # Get tags for this task
-    statement = select(Tag).join(TaskTag).where(TaskTag.task_id == task_id)
-    result = await session.execute(statement)
-    tags = result.scalars().all()
+    tags = [row[1] for row in rows if row[1] is not None]
 
     return [TagInResponse.model_validate(tag) for tag in tags]
-
-
-# ============================================================================
-# HELPER FUNCTIONS
-# ============================================================================
-
-async def get_task_with_tags(task_id: UUID, session: AsyncSession) -> TaskWithTags:
-    """
-    Helper function to get a task with all its tags loaded.
-
-    Args:
-        task_id: Task UUID
-        session: Database session
-
-    Returns:
-        TaskWithTags with tags populated
-    """
-    # Get task
-    statement = select(Task).where(Task.id == task_id)
-    result = await session.execute(statement)
-    task = result.scalar_one()
-
-    # Get tags for this task
-    statement = select(Tag).join(TaskTag).where(TaskTag.task_id == task_id)
-    result = await session.execute(statement)
-    tags = result.scalars().all()
-
-    # Convert to TaskWithTags
-    task_dict = TaskResponse.model_validate(task).model_dump()
-    task_dict["tags"] = [TagInResponse.model_validate(tag) for tag in tags]
-
-    return TaskWithTags(**task_dict)
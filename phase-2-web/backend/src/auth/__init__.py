@@ -3,7 +3,13 @@ Authentication utilities for JWT and password management.
 """
 from src.auth.jwt import create_access_token, create_refresh_token, verify_token
 from src.auth.password import hash_password, verify_password
-from src.auth.dependencies import get_current_user, get_current_active_user
+from src.auth.dependencies import (
+    get_current_user,
+    get_current_active_user,
+    get_current_active_reader,
+    get_current_session_user,
+    get_current_session_reader,
+)
 
 __all__ = [
     "create_access_token",
@@ -13,4 +19,7 @@ __all__ = [
     "verify_password",
     "get_current_user",
     "get_current_active_user",
+    "get_current_active_reader",
+    "get_current_session_user",
+    "get_current_session_reader",
 ]
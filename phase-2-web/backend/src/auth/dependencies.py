@@ -1,16 +1,24 @@
 """
 FastAPI dependencies for authentication.
-Provides get_current_user dependency for protected routes.
+Provides get_current_user dependency for protected routes, and
+get_current_active_reader for read-only routes (shares the request's
+read-only session instead of opening a read-write one).
+
+Accepts either a JWT access token or a personal access token ("tdp_...").
+get_current_session_user and get_current_session_reader accept JWTs only,
+for endpoints a personal access token must not reach (managing tokens).
 """
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
 from typing import Optional
 
-from src.database import get_session
+from src.database import get_session, get_read_session, reads_from_replica, use_primary
 from src.models.user import User
 from src.auth.jwt import verify_token
+from src.auth.personal_tokens import is_personal_token, resolve_personal_token, required_scope
+from src.replication import record_write, route_reads
 
 
 # HTTP Bearer token scheme
@@ -18,11 +26,16 @@ security = HTTPBearer()
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     session: AsyncSession = Depends(get_session)
 ) -> User:
     """
-    Dependency to get the current authenticated user from JWT token.
+    Dependency to get the current authenticated user from JWT token
+    or personal access token.
+
+    Personal access tokens are limited by scope: "read" allows GET
+    requests, "write" allows everything else.
 
     Usage in FastAPI:
         @app.get("/protected")
@@ -30,6 +43,7 @@ async def get_current_user(
             return {"user": current_user.username}
 
     Args:
+        request: Current request (method decides the required PAT scope)
         credentials: HTTP Bearer token from Authorization header
         session: Database session
 
@@ -38,15 +52,60 @@ async def get_current_user(
 
     Raises:
         HTTPException 401: If token is invalid or user not found
+        HTTPException 403: If a personal access token lacks the required scope
+    """
+    user = await _authenticate(request, credentials.credentials, session)
+
+    # Keep this user's next reads on the primary (read replica routing)
+    if required_scope(request.method) == "write":
+        await record_write(user.id)
+
+    return user
+
+
+async def get_current_reader(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    session: AsyncSession = Depends(get_read_session)
+) -> User:
+    """
+    Same as get_current_user, but looks the user up on the request's
+    read-only session (see get_read_session), which is pinned to the
+    primary if the user wrote recently.
     """
+    return await _authenticate(request, credentials.credentials, session)
+
+
+async def _authenticate(request: Request, token: str, session: AsyncSession) -> User:
+    """Resolve a bearer token (JWT or personal access token) to its user."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    # Get token from credentials
-    token = credentials.credentials
+    # Personal access token: one indexed lookup (or cache hit)
+    if is_personal_token(token):
+        identity = await resolve_personal_token(token, session)
+        if identity is None and reads_from_replica(session):
+            # The token may be newer than the replica
+            use_primary(session)
+            identity = await resolve_personal_token(token, session)
+        if identity is None:
+            raise credentials_exception
+
+        if required_scope(request.method) not in identity.scopes:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Token lacks the '{required_scope(request.method)}' scope"
+            )
+
+        await route_reads(session, identity.user_id)
+        user = await session.get(User, identity.user_id)
+        if user is None:
+            raise credentials_exception
+
+        return user
 
     # Verify and decode token
     token_data = verify_token(token, token_type="access")
@@ -54,6 +113,7 @@ async def get_current_user(
         raise credentials_exception
 
     # Get user from database
+    await route_reads(session, token_data.user_id)
     statement = select(User).where(User.id == token_data.user_id)
     result = await session.execute(statement)
     user = result.scalar_one_or_none()
@@ -94,6 +154,68 @@ async def get_current_active_user(
     return current_user
 
 
+async def get_current_active_reader(
+    current_user: User = Depends(get_current_reader)
+) -> User:
+    """
+    Read-only counterpart of get_current_active_user for GET endpoints.
+
+    Usage in FastAPI:
+        @app.get("/items")
+        async def get_items(
+            user: User = Depends(get_current_active_reader),
+            session: AsyncSession = Depends(get_read_session)
+        ):
+            ...
+
+    Raises:
+        HTTPException 403: If user account is inactive
+    """
+    return await get_current_active_user(current_user)
+
+
+async def require_session_token(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> HTTPAuthorizationCredentials:
+    """
+    Reject personal access tokens before authenticating.
+
+    Raises:
+        HTTPException 403: If the bearer token is a personal access token
+    """
+    if is_personal_token(credentials.credentials):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Personal access tokens cannot be used here; sign in to manage tokens"
+        )
+    return credentials
+
+
+async def get_current_session_user(
+    _: HTTPAuthorizationCredentials = Depends(require_session_token),
+    current_user: User = Depends(get_current_active_user)
+) -> User:
+    """
+    Active user authenticated with a JWT access token (a signed-in session).
+
+    Used by the personal access token endpoints, so a leaked token cannot
+    mint new tokens that outlive its revocation.
+
+    Raises:
+        HTTPException 403: If authenticated with a personal access token,
+            or the user account is inactive
+    """
+    return current_user
+
+
+async def get_current_session_reader(
+    _: HTTPAuthorizationCredentials = Depends(require_session_token),
+    current_user: User = Depends(get_current_active_reader)
+) -> User:
+    """Read-only counterpart of get_current_session_user for GET endpoints."""
+    return current_user
+
+
 async def get_optional_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
     session: AsyncSession = Depends(get_session)
@@ -39,18 +39,26 @@ def create_access_token(user_id: UUID, username: str) -> str:
     return token
 
 
-def create_refresh_token(user_id: UUID, username: str) -> str:
+def create_refresh_token(
+    user_id: UUID,
+    username: str,
+    jti: Optional[str] = None,
+    expire: Optional[datetime] = None
+) -> str:
     """
     Create a JWT refresh token.
 
     Args:
         user_id: User's UUID
         username: User's username
+        jti: Token ID stored in the refresh_tokens table (enables revocation)
+        expire: Expiration override (defaults to 7 days from now)
 
     Returns:
         JWT refresh token string (valid for 7 days)
     """
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    if expire is None:
+        expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
 
     payload = {
         "user_id": str(user_id),
@@ -59,6 +67,9 @@ def create_refresh_token(user_id: UUID, username: str) -> str:
         "type": "refresh"
     }
 
+    if jti:
+        payload["jti"] = jti
+
     token = jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return token
 
@@ -97,7 +108,8 @@ def verify_token(token: str, token_type: str = "access") -> Optional[TokenData]:
         token_data = TokenData(
             user_id=UUID(user_id),
             username=username,
-            exp=exp_datetime
+            exp=exp_datetime,
+            jti=payload.get("jti")
         )
 
         return token_data
@@ -2,7 +2,12 @@
 OAuth integration for Google and GitHub authentication.
 
 Provides OAuth 2.0 login flows for third-party authentication.
+
+Provider API calls share one keep-alive httpx client (opened in the app
+lifespan), so repeated logins reuse TLS connections to Google/GitHub.
 """
+from typing import Optional
+import httpx
 from authlib.integrations.starlette_client import OAuth
 from src.config import settings
 
@@ -36,6 +41,35 @@ if settings.GITHUB_CLIENT_ID and settings.GITHUB_CLIENT_SECRET:
     )
 
 
+# Shared client for provider APIs (see start_oauth_http_client)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+async def start_oauth_http_client() -> None:
+    """Open the shared provider HTTP client. Called on app startup."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0)
+        )
+
+
+async def close_oauth_http_client() -> None:
+    """Close the shared provider HTTP client. Called on app shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def get_oauth_http_client() -> httpx.AsyncClient:
+    """Get the shared provider HTTP client (opened lazily outside the app lifespan)."""
+    if _http_client is None:
+        await start_oauth_http_client()
+    return _http_client
+
+
 async def get_google_user_info(token: dict) -> dict:
     """
     Get user information from Google using access token.
@@ -46,14 +80,12 @@ async def get_google_user_info(token: dict) -> dict:
     Returns:
         User info with email, name, picture
     """
-    import httpx
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            'https://www.googleapis.com/oauth2/v2/userinfo',
-            headers={'Authorization': f'Bearer {token["access_token"]}'}
-        )
-        return response.json()
+    client = await get_oauth_http_client()
+    response = await client.get(
+        'https://www.googleapis.com/oauth2/v2/userinfo',
+        headers={'Authorization': f'Bearer {token["access_token"]}'}
+    )
+    return response.json()
 
 
 async def get_github_user_info(token: dict) -> dict:
@@ -66,33 +98,24 @@ async def get_github_user_info(token: dict) -> dict:
     Returns:
         User info with email, login, name
     """
-    import httpx
-
-    async with httpx.AsyncClient() as client:
-        # Get user profile
-        user_response = await client.get(
-            'https://api.github.com/user',
-            headers={
-                'Authorization': f'Bearer {token["access_token"]}',
-                'Accept': 'application/json'
-            }
-        )
-        user_data = user_response.json()
-
-        # Get user emails if primary email is not public
-        if not user_data.get('email'):
-            emails_response = await client.get(
-                'https://api.github.com/user/emails',
-                headers={
-                    'Authorization': f'Bearer {token["access_token"]}',
-                    'Accept': 'application/json'
-                }
-            )
-            emails = emails_response.json()
-            # Find primary email
-            for email in emails:
-                if email.get('primary') and email.get('verified'):
-                    user_data['email'] = email['email']
-                    break
-
-        return user_data
+    client = await get_oauth_http_client()
+    headers = {
+        'Authorization': f'Bearer {token["access_token"]}',
+        'Accept': 'application/json'
+    }
+
+    # Get user profile
+    user_response = await client.get('https://api.github.com/user', headers=headers)
+    user_data = user_response.json()
+
+    # Get user emails if primary email is not public
+    if not user_data.get('email'):
+        emails_response = await client.get('https://api.github.com/user/emails', headers=headers)
+        emails = emails_response.json()
+        # Find primary email
+        for email in emails:
+            if email.get('primary') and email.get('verified'):
+                user_data['email'] = email['email']
+                break
+
+    return user_data
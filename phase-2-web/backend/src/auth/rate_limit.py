@@ -0,0 +1,202 @@
+"""
+Login throttling with token buckets.
+
+Every login attempt costs a cost-12 bcrypt verification (~250ms of CPU).
+The limiter runs before the user lookup and verify_password, keyed by:
+- Client IP (credential stuffing from one source)
+- username_or_email plus client IP (guessing one account's password from
+  one source), the tight per-account limit
+- username_or_email alone (a password spray against one account from many
+  sources); its limit is several times the per-source one, so a spray is
+  slowed down while locking the real user out takes a sustained attack
+
+The client IP is the address uvicorn reports, so deployments behind a
+proxy must run it with --proxy-headers and --forwarded-allow-ips (see
+Procfile); otherwise every user shares the proxy's bucket.
+
+Buckets live in-process by default. Set REDIS_URL to share them across
+workers and pods (requires the optional `redis` package); the local
+backend is used as a stand-in when Redis is not configured or unavailable.
+"""
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from src.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class LocalRateLimitBackend:
+    """
+    In-process token buckets.
+
+    Memory is bounded two ways: a bucket idle long enough to refill
+    completely carries no state and is dropped (sliding window), and the
+    total number of tracked keys is capped with LRU eviction.
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        # key -> (tokens, updated_at, full_at), ordered by last use
+        self._buckets: "OrderedDict[str, Tuple[float, float, float]]" = OrderedDict()
+
+    def _evict(self, now: float) -> None:
+        # Least recently used first; stop at the first bucket still refilling
+        while self._buckets:
+            _, _, full_at = next(iter(self._buckets.values()))
+            if full_at > now and len(self._buckets) <= self.max_keys:
+                break
+            self._buckets.popitem(last=False)
+
+    async def take(self, key: str, burst: int, rate: float) -> float:
+        """
+        Take one token from a bucket.
+
+        Args:
+            key: Bucket key
+            burst: Bucket capacity
+            rate: Refill rate in tokens per second
+
+        Returns:
+            0 if allowed, otherwise seconds until a token is available
+        """
+        now = time.monotonic()
+        tokens, updated_at, _ = self._buckets.pop(key, (float(burst), now, now))
+        tokens = min(float(burst), tokens + (now - updated_at) * rate)
+
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / rate
+
+        self._buckets[key] = (tokens, now, now + (burst - tokens) / rate)
+        self._evict(now)
+        return retry_after
+
+
+# Atomic token bucket: KEYS[1]=bucket, ARGV=burst, rate/s, now, ttl
+_REDIS_TOKEN_BUCKET = """
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local burst = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local tokens = tonumber(bucket[1]) or burst
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local retry = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    retry = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return tostring(retry)
+"""
+
+
+class RedisRateLimitBackend:
+    """Token buckets shared through Redis (one Lua call per check)."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url)
+        self._script = self._redis.register_script(_REDIS_TOKEN_BUCKET)
+
+    async def take(self, key: str, burst: int, rate: float) -> float:
+        """Take one token from a shared bucket (see LocalRateLimitBackend.take)."""
+        ttl = int(burst / rate) + 1
+        retry_after = await self._script(
+            keys=[f"ratelimit:{key}"],
+            args=[burst, rate, time.time(), ttl]
+        )
+        return float(retry_after)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+def _key(*parts: str) -> str:
+    """Fixed-size bucket key for arbitrarily long input"""
+    return hashlib.blake2b("\0".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class LoginRateLimiter:
+    """
+    Per-IP, per-account-and-IP and per-account login throttle.
+
+    Usage:
+        retry_after, scope = await login_rate_limiter.check(client_ip, username_or_email)
+        if scope:
+            raise HTTPException(429, headers={"Retry-After": ...})
+    """
+
+    def __init__(self):
+        self.local = LocalRateLimitBackend(settings.LOGIN_RATE_LIMIT_MAX_KEYS)
+        self.shared: Optional[RedisRateLimitBackend] = None
+
+        if settings.REDIS_URL:
+            try:
+                self.shared = RedisRateLimitBackend(settings.REDIS_URL)
+            except ImportError:
+                logger.warning("REDIS_URL is set but redis is not installed; using local rate limiting")
+
+    async def _take(self, key: str, burst: int, per_minute: int) -> float:
+        rate = per_minute / 60.0
+        if self.shared is not None:
+            try:
+                return await self.shared.take(key, burst, rate)
+            except Exception as e:
+                logger.warning("Shared rate limit backend unavailable, using local: %s", e)
+        return await self.local.take(key, burst, rate)
+
+    async def check(self, client_ip: str, username_or_email: str) -> Tuple[float, Optional[str]]:
+        """
+        Consume one attempt for the client IP, then for the account from
+        that IP, then for the account from any IP (each only if the
+        previous one allowed it).
+
+        Returns:
+            (retry_after_seconds, rejected_scope); (0, None) if allowed
+        """
+        retry_after = await self._take(
+            f"login:ip:{client_ip}",
+            settings.LOGIN_RATE_LIMIT_IP_BURST,
+            settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE
+        )
+        if retry_after:
+            return retry_after, "ip"
+
+        identifier = username_or_email.strip().lower()
+        retry_after = await self._take(
+            f"login:user:{_key(identifier, client_ip)}",
+            settings.LOGIN_RATE_LIMIT_USER_BURST,
+            settings.LOGIN_RATE_LIMIT_USER_PER_MINUTE
+        )
+        if retry_after:
+            return retry_after, "user"
+
+        retry_after = await self._take(
+            f"login:account:{_key(identifier)}",
+            settings.LOGIN_RATE_LIMIT_ACCOUNT_BURST,
+            settings.LOGIN_RATE_LIMIT_ACCOUNT_PER_MINUTE
+        )
+        if retry_after:
+            return retry_after, "account"
+
+        return 0.0, None
+
+    async def close(self) -> None:
+        """Close the shared backend connection. Called on app shutdown."""
+        if self.shared is not None:
+            await self.shared.close()
+
+
+# Global limiter instance (one per worker process)
+login_rate_limiter = LoginRateLimiter()
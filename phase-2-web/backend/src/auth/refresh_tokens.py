@@ -0,0 +1,130 @@
+"""
+Refresh token issuance, rotation and revocation.
+
+Every refresh JWT carries a `jti` backed by a row in refresh_tokens.
+Refreshing rotates the token: the presented jti is revoked and replaced
+by a new one, so each refresh token can be used exactly once.
+"""
+from datetime import datetime, timedelta
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+from sqlmodel import update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.config import settings
+from src.models.user import User
+from src.models.refresh_token import RefreshToken
+from src.auth.jwt import create_refresh_token
+from src.auth.revocation import revocation_filter, publish_revocations
+
+
+def issue_refresh_token(session: AsyncSession, user: User) -> str:
+    """
+    Create a refresh token and stage its row in the session.
+
+    The caller is responsible for committing the session.
+
+    Args:
+        session: Database session
+        user: User the token is issued to
+
+    Returns:
+        Encoded refresh JWT
+    """
+    jti = uuid4().hex
+    expires_at = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+    session.add(RefreshToken(jti=jti, user_id=user.id, expires_at=expires_at))
+
+    return create_refresh_token(user.id, user.username, jti=jti, expire=expires_at)
+
+
+async def rotate_refresh_token(session: AsyncSession, jti: str, user: User) -> Optional[str]:
+    """
+    Revoke a refresh token and issue its replacement in one transaction.
+
+    The revoke is conditional on the token still being active, so two
+    concurrent refreshes with the same token cannot both succeed.
+
+    Args:
+        session: Database session
+        jti: Token ID being exchanged
+        user: Token owner
+
+    Returns:
+        New refresh JWT, or None if the token was already revoked
+    """
+    new_jti = uuid4().hex
+    now = datetime.utcnow()
+    expires_at = now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
+    statement = (
+        update(RefreshToken)
+        .where(
+            RefreshToken.jti == jti,
+            RefreshToken.user_id == user.id,
+            RefreshToken.revoked_at.is_(None)
+        )
+        .values(revoked_at=now, replaced_by=new_jti)
+    )
+    result = await session.execute(statement)
+    if result.rowcount != 1:
+        return None
+
+    session.add(RefreshToken(jti=new_jti, user_id=user.id, expires_at=expires_at))
+    await publish_revocations(session, [jti])
+    await session.commit()
+
+    revocation_filter.add(jti)
+
+    return create_refresh_token(user.id, user.username, jti=new_jti, expire=expires_at)
+
+
+async def revoke_refresh_token(session: AsyncSession, jti: str) -> bool:
+    """
+    Revoke a single refresh token (logout).
+
+    Returns:
+        True if an active token was revoked
+    """
+    statement = (
+        update(RefreshToken)
+        .where(RefreshToken.jti == jti, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.utcnow())
+    )
+    result = await session.execute(statement)
+    if result.rowcount != 1:
+        return False
+
+    await publish_revocations(session, [jti])
+    await session.commit()
+
+    revocation_filter.add(jti)
+    return True
+
+
+async def revoke_user_refresh_tokens(session: AsyncSession, user_id: UUID) -> List[str]:
+    """
+    Revoke every active refresh token of a user.
+
+    Used when a revoked token is presented again (likely stolen) and
+    when the user's password changes.
+
+    Returns:
+        List of revoked token IDs
+    """
+    statement = (
+        update(RefreshToken)
+        .where(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.utcnow())
+        .returning(RefreshToken.jti)
+    )
+    result = await session.execute(statement)
+    jtis = list(result.scalars().all())
+
+    await publish_revocations(session, jtis)
+    await session.commit()
+
+    revocation_filter.add_many(jtis)
+    return jtis
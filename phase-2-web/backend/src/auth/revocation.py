@@ -0,0 +1,238 @@
+"""
+In-memory revocation filter for refresh tokens.
+
+Each worker keeps a Bloom filter of revoked refresh token IDs (jti) plus an
+LRU of recent exact answers. A negative Bloom answer is definitive, so the
+common case (an active token being refreshed) never touches PostgreSQL; only
+Bloom false positives (REVOCATION_BLOOM_ERROR_RATE) fall through to one
+primary-key lookup, whose result is then cached in the LRU.
+
+The filter is kept in sync by:
+- A full load of revoked, unexpired tokens on startup
+- PostgreSQL LISTEN/NOTIFY on the `refresh_token_revoked` channel
+- An incremental poll on refresh_tokens.revoked_at as a safety net
+"""
+import asyncio
+import hashlib
+import logging
+import math
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Optional
+
+from sqlalchemy import text
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.config import settings
+from src.database import engine, get_db_session
+from src.models.refresh_token import RefreshToken
+
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL NOTIFY channel used to broadcast revocations between workers
+REVOCATION_CHANNEL = "refresh_token_revoked"
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Sized for `capacity` items at `error_rate` false positives; uses double
+    hashing over a single BLAKE2b digest to derive the bit positions.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = max(1, capacity)
+        self.size = max(8, math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter."""
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class RevocationFilter:
+    """
+    Per-worker view of revoked refresh tokens.
+
+    Usage:
+        if await revocation_filter.is_revoked(token_data.jti, session):
+            raise HTTPException(401)
+    """
+
+    def __init__(self, capacity: int, error_rate: float, lru_size: int):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.lru_size = lru_size
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._lru: "OrderedDict[str, bool]" = OrderedDict()
+        self._synced_at: Optional[datetime] = None
+        self._poll_task: Optional[asyncio.Task] = None
+        self._listener = None
+        self.stats = {"checks": 0, "bloom_negative": 0, "lru_hits": 0, "db_lookups": 0}
+
+    def _remember(self, jti: str, revoked: bool) -> None:
+        """Cache an exact answer, evicting the least recently used entry."""
+        self._lru[jti] = revoked
+        self._lru.move_to_end(jti)
+        while len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+    def add(self, jti: str) -> None:
+        """Mark a token as revoked in this worker."""
+        if jti not in self._bloom:
+            self._bloom.add(jti)
+        self._remember(jti, True)
+
+    def add_many(self, jtis: Iterable[str]) -> None:
+        """Mark several tokens as revoked in this worker."""
+        for jti in jtis:
+            self.add(jti)
+
+    async def is_revoked(self, jti: str, session: AsyncSession) -> bool:
+        """
+        Check whether a refresh token has been revoked.
+
+        Args:
+            jti: Token ID from the refresh JWT
+            session: Database session, only used on a Bloom false positive
+
+        Returns:
+            True if revoked (or unknown to the database), False otherwise
+        """
+        self.stats["checks"] += 1
+
+        if jti not in self._bloom:
+            self.stats["bloom_negative"] += 1
+            return False
+
+        cached = self._lru.get(jti)
+        if cached is not None:
+            self._lru.move_to_end(jti)
+            self.stats["lru_hits"] += 1
+            return cached
+
+        self.stats["db_lookups"] += 1
+        statement = select(RefreshToken.revoked_at).where(RefreshToken.jti == jti)
+        result = await session.execute(statement)
+        row = result.first()
+
+        revoked = row is None or row[0] is not None
+        self._remember(jti, revoked)
+        return revoked
+
+    async def load(self, session: AsyncSession) -> None:
+        """Rebuild the filter from all revoked, unexpired tokens."""
+        now = datetime.utcnow()
+        statement = select(RefreshToken.jti).where(
+            RefreshToken.revoked_at.is_not(None),
+            RefreshToken.expires_at > now
+        )
+        result = await session.execute(statement)
+        jtis = result.scalars().all()
+
+        bloom = BloomFilter(max(self.capacity, len(jtis) * 2), self.error_rate)
+        for jti in jtis:
+            bloom.add(jti)
+
+        self._bloom = bloom
+        self._lru.clear()
+        self._synced_at = now
+        logger.info("Revocation filter loaded %d revoked refresh tokens", len(jtis))
+
+    async def sync(self, session: AsyncSession) -> None:
+        """Pull revocations made since the last sync (by any worker)."""
+        if self._synced_at is None or self._bloom.count > self._bloom.capacity:
+            await self.load(session)
+            return
+
+        now = datetime.utcnow()
+        # Overlap one interval to tolerate clock skew between workers
+        since = self._synced_at - timedelta(seconds=settings.REVOCATION_SYNC_SECONDS)
+        statement = select(RefreshToken.jti).where(RefreshToken.revoked_at > since)
+        result = await session.execute(statement)
+        self.add_many(result.scalars().all())
+        self._synced_at = now
+
+    async def _poll(self) -> None:
+        while True:
+            await asyncio.sleep(settings.REVOCATION_SYNC_SECONDS)
+            try:
+                async with get_db_session() as session:
+                    await self.sync(session)
+            except Exception as e:
+                logger.warning("Revocation filter sync failed: %s", e)
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        self.add_many(jti for jti in payload.split(",") if jti)
+
+    async def _listen(self) -> None:
+        import asyncpg
+
+        dsn = settings.async_database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+        self._listener = await asyncpg.connect(dsn)
+        await self._listener.add_listener(REVOCATION_CHANNEL, self._on_notify)
+
+    async def start(self) -> None:
+        """Load the filter and start background sync. Called on app startup."""
+        async with get_db_session() as session:
+            await self.load(session)
+
+        if engine.dialect.name == "postgresql":
+            try:
+                await self._listen()
+            except Exception as e:
+                logger.warning("Revocation LISTEN unavailable, relying on polling: %s", e)
+
+        self._poll_task = asyncio.create_task(self._poll())
+
+    async def stop(self) -> None:
+        """Stop background sync. Called on app shutdown."""
+        if self._poll_task:
+            self._poll_task.cancel()
+            self._poll_task = None
+        if self._listener is not None:
+            await self._listener.close()
+            self._listener = None
+
+
+async def publish_revocations(session: AsyncSession, jtis: List[str]) -> None:
+    """
+    Broadcast revoked token IDs to other workers.
+
+    NOTIFY is transactional, so listeners only see the revocation once the
+    surrounding transaction commits. No-op on non-PostgreSQL databases.
+    """
+    if not jtis or session.bind.dialect.name != "postgresql":
+        return
+
+    # NOTIFY payloads are limited to 8000 bytes; 32-char jtis batch safely in 200s
+    for i in range(0, len(jtis), 200):
+        await session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": REVOCATION_CHANNEL, "payload": ",".join(jtis[i:i + 200])}
+        )
+
+
+# Global filter instance (one per worker process)
+revocation_filter = RevocationFilter(
+    capacity=settings.REVOCATION_BLOOM_CAPACITY,
+    error_rate=settings.REVOCATION_BLOOM_ERROR_RATE,
+    lru_size=settings.REVOCATION_LRU_SIZE
+)
@@ -3,7 +3,7 @@ Application configuration using Pydantic Settings.
 Loads environment variables from .env file.
 """
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import List, Literal
 
 
 class Settings(BaseSettings):
@@ -15,24 +15,85 @@ class Settings(BaseSettings):
     @property
     def async_database_url(self) -> str:
         """Convert DATABASE_URL to async format for SQLAlchemy."""
-        url = self.DATABASE_URL
+        return self._to_async_url(self.DATABASE_URL)
+
+    # Optional read replica for GET endpoints (empty = disabled)
+    READ_REPLICA_URL: str = ""
+    # After a user's write, their reads stay on the primary for this long
+    # (tracked per worker unless REDIS_URL is set; see src/replication.py)
+    READ_YOUR_WRITES_SECONDS: int = 5
+
+    @property
+    def async_read_replica_url(self) -> str:
+        """Convert READ_REPLICA_URL to async format for SQLAlchemy."""
+        return self._to_async_url(self.READ_REPLICA_URL)
+
+    @staticmethod
+    def _to_async_url(url: str) -> str:
         # Railway/Heroku use postgresql://, convert to asyncpg format
         if url.startswith("postgresql://"):
             url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
         return url
 
+    # Database connection pool (per worker process)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced (-1 = never)
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP: int = 5  # Connections opened at startup
+    DB_STATEMENT_CACHE_SIZE: int = 100  # asyncpg prepared statements per connection (0 behind PgBouncer)
+    DB_ECHO: bool = False  # Log SQL statements
+
+    # Per-request SQL instrumentation
+    SLOW_QUERY_MS: float = 200  # Log statements slower than this (0 = off)
+    SERVER_TIMING: bool = True  # Add Server-Timing header (db time, query count)
+
+    # Event loop watchdog (logs the stack of code blocking the loop)
+    LOOP_MONITOR_ENABLED: bool = False
+    LOOP_MONITOR_INTERVAL_MS: float = 50  # How often the loop is probed
+    LOOP_LAG_THRESHOLD_MS: float = 100  # Capture a stack when blocked this long
+
+    # Startup schema check against the Alembic head ("fail", "warn" or "off")
+    SCHEMA_CHECK: Literal["fail", "warn", "off"] = "fail"
+
     # JWT Settings
     SECRET_KEY: str = "your-secret-key-change-this-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # Refresh token revocation (per-worker Bloom filter + LRU)
+    REVOCATION_BLOOM_CAPACITY: int = 100_000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+    REVOCATION_LRU_SIZE: int = 10_000
+    REVOCATION_SYNC_SECONDS: int = 30
+
+    # Personal access tokens (HMAC key defaults to SECRET_KEY)
+    PAT_HMAC_KEY: str = ""
+    PAT_CACHE_TTL_SECONDS: int = 60
+
+    # Login throttling (token buckets per client IP, per username/email + client IP,
+    # and per username/email from any IP)
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_RATE_LIMIT_IP_BURST: int = 20
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE: int = 10
+    LOGIN_RATE_LIMIT_USER_BURST: int = 5
+    LOGIN_RATE_LIMIT_USER_PER_MINUTE: int = 3
+    LOGIN_RATE_LIMIT_ACCOUNT_BURST: int = 30
+    LOGIN_RATE_LIMIT_ACCOUNT_PER_MINUTE: int = 10
+    LOGIN_RATE_LIMIT_MAX_KEYS: int = 100_000
+
+    # Redis (optional, shares rate limit state across workers/pods)
+    REDIS_URL: str = ""
+
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://127.0.0.1:3000", "http://localhost:3001", "http://127.0.0.1:3001"]
 
     # Application
     APP_NAME: str = "Todo App - Phase 2"
     DEBUG: bool = True
+    LOG_LEVEL: str = "INFO"
 
     # OAuth Settings
     GOOGLE_CLIENT_ID: str = ""
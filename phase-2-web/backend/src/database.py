@@ -2,25 +2,74 @@
 Database configuration and session management.
 Uses SQLModel with async PostgreSQL connection.
 """
-from sqlmodel import SQLModel
+from sqlmodel import SQLModel, Session
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.dialects import postgresql, sqlite
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
+import asyncio
+import time
 
 from src.config import settings
+from src.instrumentation import instrument_engine
+from src.metrics import DB_POOL_CHECKOUT_SECONDS, DB_POOL_IN_USE, DB_POOL_IDLE, DB_POOL_OVERFLOW
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long each checkout waits.
+
+    The pool's logging_name ("primary", ...) is used as the metric label.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.labels(self._orig_logging_name).observe(
+                time.perf_counter() - start
+            )
+
+
+def _engine_options(url: str, name: str) -> dict:
+    """Pool and driver options for create_async_engine, from Settings."""
+    options = dict(
+        echo=settings.DB_ECHO,  # Log SQL queries
+        future=True,
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name=name,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,  # Verify connections before using
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE
+    )
+    if make_url(url).get_driver_name() == "asyncpg":
+        options["connect_args"] = {"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    return options
+
+
+def _observe_pool(name: str, engine: AsyncEngine) -> None:
+    """Expose pool occupancy as gauges (read at scrape time)."""
+    # engine.pool is looked up on every scrape: dispose() replaces the pool
+    DB_POOL_IN_USE.labels(name).set_function(lambda: engine.pool.checkedout())
+    DB_POOL_IDLE.labels(name).set_function(lambda: engine.pool.checkedin())
+    DB_POOL_OVERFLOW.labels(name).set_function(lambda: engine.pool.overflow())
 
 
 # Create async engine (auto-converts postgresql:// to postgresql+asyncpg://)
 engine: AsyncEngine = create_async_engine(
     settings.async_database_url,
-    echo=settings.DEBUG,  # Log SQL queries in debug mode
-    future=True,
-    pool_pre_ping=True,  # Verify connections before using
-    pool_size=10,  # Connection pool size
-    max_overflow=20  # Max overflow connections
+    **_engine_options(settings.async_database_url, "primary")
 )
+_observe_pool("primary", engine)
+instrument_engine(engine)
 
 
 # Async session factory
@@ -33,6 +82,61 @@ async_session_maker = sessionmaker(
 )
 
 
+# Read-only view of the engine: same pool, but transactions start as
+# READ ONLY on PostgreSQL (ignored by other dialects)
+read_only_engine: AsyncEngine = engine.execution_options(postgresql_readonly=True)
+
+# Optional read replica (see RoutingSession)
+replica_pool_engine: Optional[AsyncEngine] = None
+replica_engine: Optional[AsyncEngine] = None
+if settings.READ_REPLICA_URL:
+    replica_pool_engine = create_async_engine(
+        settings.async_read_replica_url,
+        **_engine_options(settings.async_read_replica_url, "replica")
+    )
+    _observe_pool("replica", replica_pool_engine)
+    instrument_engine(replica_pool_engine)
+    replica_engine = replica_pool_engine.execution_options(postgresql_readonly=True)
+
+
+class RoutingSession(Session):
+    """
+    Session for read endpoints.
+
+    Statements go to the read replica when one is configured, unless the
+    session was pinned to the primary with use_primary() (read-your-writes).
+    The bind is chosen per statement, so pinning takes effect immediately.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if replica_engine is not None and not self.info.get("use_primary"):
+            return replica_engine.sync_engine
+        return read_only_engine.sync_engine
+
+
+def use_primary(session: AsyncSession) -> None:
+    """Pin a read session to the primary for the rest of the request."""
+    session.info["use_primary"] = True
+
+
+def reads_from_replica(session: AsyncSession) -> bool:
+    """Check whether a session's next statement would go to the replica."""
+    return (
+        replica_engine is not None
+        and isinstance(session.sync_session, RoutingSession)
+        and not session.info.get("use_primary")
+    )
+
+
+read_session_maker = sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False
+)
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency to get database session.
@@ -53,15 +157,95 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def insert_on_conflict(session: AsyncSession, model):
+    """
+    INSERT statement for the session's database that supports ON CONFLICT.
+
+    Lets write paths rely on unique constraints instead of pre-check
+    SELECTs: `.on_conflict_do_nothing()` turns a duplicate into a zero
+    rowcount in the same round trip.
+
+    Usage:
+        statement = insert_on_conflict(session, Tag).values(...).on_conflict_do_nothing()
+        result = await session.execute(statement)
+        if result.rowcount == 0:
+            ...  # duplicate
+    """
+    if session.bind.dialect.name == "sqlite":
+        return sqlite.insert(model)
+    return postgresql.insert(model)
+
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get a read-only database session (for GET endpoints).
+
+    A pool connection is only checked out when the first query runs, the
+    transaction is READ ONLY, and there is no commit: closing the session
+    ends the transaction and returns the connection to the pool.
+
+    Queries go to READ_REPLICA_URL when set (see RoutingSession).
+
+    Usage in FastAPI:
+        @app.get("/items")
+        async def get_items(session: AsyncSession = Depends(get_read_session)):
+            ...
+    """
+    async with read_session_maker() as session:
+        yield session
+
+
 async def create_db_and_tables():
-    """Create all database tables. Called on app startup."""
+    """Create missing database tables. Called by the schema init job (src/schema.py)."""
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
 
 
+async def warm_up_pool(
+    target: AsyncEngine = engine,
+    connections: int = settings.DB_POOL_WARMUP
+) -> int:
+    """
+    Open pool connections ahead of the first requests. Called on app startup.
+
+    Connections are opened concurrently and returned to the pool, so the
+    first requests after a deploy don't pay for TCP/TLS and auth setup.
+
+    Args:
+        target: Engine whose pool to warm (primary by default)
+        connections: Number of connections to open (capped at DB_POOL_SIZE)
+
+    Returns:
+        Number of connections opened
+    """
+    connections = min(connections, settings.DB_POOL_SIZE)
+    if connections <= 0:
+        return 0
+
+    async def open_connection():
+        conn = await target.connect()
+        await conn.execute(text("SELECT 1"))
+        return conn
+
+    results = await asyncio.gather(
+        *(open_connection() for _ in range(connections)),
+        return_exceptions=True
+    )
+
+    opened = 0
+    for result in results:
+        if isinstance(result, BaseException):
+            continue
+        await result.close()
+        opened += 1
+    return opened
+
+
 async def close_db():
     """Close database connections. Called on app shutdown."""
     await engine.dispose()
+    if replica_pool_engine is not None:
+        await replica_pool_engine.dispose()
 
 
 @asynccontextmanager
@@ -0,0 +1,138 @@
+"""
+Per-request SQL instrumentation.
+
+Engine event hooks count statements and accumulate database time into
+the QueryStats of the current request (a contextvar set by
+QueryStatsMiddleware, or by track_queries() in scripts and tests).
+Statements slower than SLOW_QUERY_MS are logged with normalized SQL.
+"""
+import logging
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.config import settings
+
+
+slow_query_logger = logging.getLogger("src.slow_query")
+
+
+@dataclass
+class QueryStats:
+    """Statements executed and time spent in the database."""
+    count: int = 0
+    seconds: float = 0.0
+    # Enclosing tracker, which also receives this tracker's statements
+    parent: Optional["QueryStats"] = None
+
+    @property
+    def milliseconds(self) -> float:
+        return self.seconds * 1000
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Collect QueryStats for the statements run inside the block.
+
+    Trackers nest: statements also count towards every enclosing tracker,
+    so a test can wrap a request that QueryStatsMiddleware tracks itself.
+
+    Usage:
+        with track_queries() as stats:
+            await session.execute(...)
+        print(stats.count, stats.milliseconds)
+    """
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])\d+(?:\.\d+)?\b")
+_PLACEHOLDER = r"(?:\?|\$\d+|%\([^)]*\)s|%s|:\w+)"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})+\s*\)")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Normalize SQL for grouping in logs.
+
+    Collapses whitespace, replaces literals with "?" and lists of bind
+    parameters (IN clauses, multi-row VALUES) with "(...)".
+    """
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    return _PLACEHOLDER_LIST.sub("(...)", statement)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+
+    stats = _current_stats.get()
+    while stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+        stats = stats.parent
+
+    if settings.SLOW_QUERY_MS > 0 and elapsed * 1000 >= settings.SLOW_QUERY_MS:
+        normalized = normalize_sql(statement)
+        slow_query_logger.warning(
+            "slow query duration_ms=%.1f statement=%s",
+            elapsed * 1000,
+            normalized,
+            extra={"duration_ms": round(elapsed * 1000, 1), "statement": normalized}
+        )
+
+
+def _handle_error(exception_context):
+    # Failed statements never reach after_cursor_execute
+    started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def query_budget(max_queries: int):
+    """
+    Declare the most SQL statements an endpoint may run per request,
+    including authentication. Enforced by the query-budget tests
+    (tests/test_query_budgets.py).
+
+    Usage:
+        @router.get("")
+        @query_budget(2)
+        async def list_items(...):
+            ...
+    """
+    def decorator(endpoint):
+        endpoint.query_budget = max_queries
+        return endpoint
+    return decorator
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Attach the statement hooks to an async engine (once per engine)."""
+    sync_engine = engine.sync_engine
+    if event.contains(sync_engine, "after_cursor_execute", _after_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
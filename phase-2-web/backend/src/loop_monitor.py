@@ -0,0 +1,114 @@
+"""
+Event loop lag monitor.
+
+A probe task on the event loop wakes up every LOOP_MONITOR_INTERVAL_MS
+and records how late it ran (EVENT_LOOP_LAG). Lag means something ran on
+the loop without awaiting: a blocking call such as bcrypt or a
+synchronous HTTP client.
+
+A watchdog thread checks the probe's heartbeat. When the loop has been
+stuck for longer than LOOP_LAG_THRESHOLD_MS it captures the loop
+thread's stack while the blocking call is still running, and logs it
+once per stall to the "src.loop_monitor" logger.
+
+Opt-in via LOOP_MONITOR_ENABLED; started and stopped by the app lifespan.
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from src.metrics import EVENT_LOOP_BLOCKED, EVENT_LOOP_LAG
+
+
+logger = logging.getLogger(__name__)
+
+
+class EventLoopMonitor:
+    """
+    Measures event loop lag and reports blocking calls with their stack.
+
+    Usage:
+        monitor = EventLoopMonitor(interval=0.05, threshold=0.1)
+        monitor.start()   # from a coroutine on the loop to watch
+        ...
+        await monitor.stop()
+    """
+
+    def __init__(self, interval: float, threshold: float, stack_limit: int = 30):
+        self.interval = interval
+        self.threshold = threshold
+        self.stack_limit = stack_limit
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat = 0.0
+        self._probe: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """Start probing the running loop and the watchdog thread."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+
+        self._probe = self._loop.create_task(self._run_probe(), name="event-loop-monitor")
+        self._watchdog = threading.Thread(target=self._run_watchdog, name="event-loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop the probe and the watchdog thread."""
+        self._stopped.set()
+        if self._probe is not None:
+            self._probe.cancel()
+            try:
+                await self._probe
+            except asyncio.CancelledError:
+                pass
+            self._probe = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=self.interval * 4)
+            self._watchdog = None
+
+    async def _run_probe(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            EVENT_LOOP_LAG.observe(max(0.0, now - expected))
+            self._heartbeat = now
+
+    def _run_watchdog(self) -> None:
+        reported_heartbeat = None
+        # Check often enough to catch a stall while it is still happening
+        check_every = min(self.interval, self.threshold / 2)
+
+        while not self._stopped.wait(check_every):
+            heartbeat = self._heartbeat
+            blocked_for = time.monotonic() - heartbeat - self.interval
+            if blocked_for < self.threshold or heartbeat == reported_heartbeat:
+                continue
+
+            # One report per stall: the heartbeat moves again once the loop recovers
+            reported_heartbeat = heartbeat
+            EVENT_LOOP_BLOCKED.inc()
+            self._report(blocked_for)
+
+    def _report(self, blocked_for: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame, limit=self.stack_limit)) if frame else "(unavailable)"
+
+        task = asyncio.current_task(self._loop) if self._loop else None
+        task_name = task.get_name() if task else "(callback)"
+
+        logger.warning(
+            "Event loop blocked for %.0fms+ in task %s\n%s",
+            blocked_for * 1000,
+            task_name,
+            stack,
+            extra={"blocked_ms": round(blocked_for * 1000), "task": task_name}
+        )
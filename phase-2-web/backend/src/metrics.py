@@ -0,0 +1,85 @@
+"""
+Prometheus metrics for the backend.
+
+Metrics are registered on the default prometheus_client registry and
+exposed at GET /metrics (see main.py).
+"""
+from prometheus_client import Counter, Gauge, Histogram
+
+
+# Login attempts rejected by the throttle before any password check
+LOGIN_RATE_LIMITED = Counter(
+    "auth_login_rate_limited_total",
+    "Login attempts rejected by the rate limiter",
+    ["scope"]  # "ip", "user" (account from one IP) or "account" (account from any IP)
+)
+
+
+# HTTP requests (route = path template such as /api/tasks/{task_id})
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route, method and status code",
+    ["method", "route", "status"]
+)
+HTTP_REQUEST_ERRORS = Counter(
+    "http_request_errors_total",
+    "HTTP requests that failed with a 5xx status or an unhandled exception",
+    ["method", "route"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served"
+)
+WEBSOCKET_CONNECTIONS = Gauge(
+    "websocket_connections_active",
+    "Open WebSocket connections by route",
+    ["route"]
+)
+
+# Database connection pool (labelled by pool name, e.g. "primary")
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pool connection (includes opening new ones)",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+DB_POOL_IN_USE = Gauge(
+    "db_pool_connections_in_use",
+    "Connections currently checked out of the pool",
+    ["pool"]
+)
+DB_POOL_IDLE = Gauge(
+    "db_pool_connections_idle",
+    "Open connections waiting in the pool",
+    ["pool"]
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections open beyond pool_size (negative while the pool is filling)",
+    ["pool"]
+)
+
+
+# Application lifecycle
+APP_STARTUP_SECONDS = Gauge(
+    "app_startup_seconds",
+    "Time from lifespan start until the app was ready to serve"
+)
+
+
+# Event loop health (see src/loop_monitor.py; only when LOOP_MONITOR_ENABLED)
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop ran a scheduled wake-up",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+)
+EVENT_LOOP_BLOCKED = Counter(
+    "event_loop_blocked_total",
+    "Times the event loop was blocked past LOOP_LAG_THRESHOLD_MS"
+)
@@ -0,0 +1,185 @@
+"""
+ASGI middleware for the backend.
+"""
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.middleware.sessions import SessionMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.instrumentation import track_queries
+from src.metrics import (
+    HTTP_REQUESTS,
+    HTTP_REQUEST_ERRORS,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_FLIGHT,
+    WEBSOCKET_CONNECTIONS,
+)
+
+
+request_logger = logging.getLogger("src.requests")
+
+
+class PathScopedSessionMiddleware(SessionMiddleware):
+    """
+    Session middleware that only runs under a path prefix.
+
+    Sessions are only needed by the OAuth flow (authlib stores the state
+    and nonce there). Every other request, including WebSockets, is passed
+    straight through without decoding or re-signing the session cookie.
+    The cookie itself is also scoped to the prefix, so browsers stop
+    sending it to the rest of the API.
+
+    Usage:
+        app.add_middleware(
+            PathScopedSessionMiddleware,
+            path_prefix="/api/auth/oauth",
+            secret_key=settings.SECRET_KEY
+        )
+    """
+
+    def __init__(self, app: ASGIApp, path_prefix: str, **kwargs):
+        kwargs.setdefault("path", path_prefix)
+        super().__init__(app, **kwargs)
+        self.path_prefix = path_prefix.rstrip("/")
+
+    def _in_scope(self, path: str) -> bool:
+        return path == self.path_prefix or path.startswith(self.path_prefix + "/")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._in_scope(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        await super().__call__(scope, receive, send)
+
+
+class QueryStatsMiddleware:
+    """
+    Per-request database statistics.
+
+    Counts SQL statements and database time for each HTTP request (see
+    src/instrumentation.py), adds them to the response as a Server-Timing
+    header and logs them with the request:
+
+        Server-Timing: db;dur=4.2;desc="3 queries", app;dur=11.8
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        with track_queries() as stats:
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    if self.server_timing:
+                        headers = MutableHeaders(scope=message)
+                        headers.append(
+                            "Server-Timing",
+                            f'db;dur={stats.milliseconds:.1f};desc="{stats.count} queries", '
+                            f"app;dur={(time.perf_counter() - started) * 1000:.1f}"
+                        )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                duration_ms = (time.perf_counter() - started) * 1000
+                request_logger.info(
+                    "%s %s status=%d duration_ms=%.1f db_queries=%d db_ms=%.1f",
+                    scope["method"],
+                    scope["path"],
+                    status_code,
+                    duration_ms,
+                    stats.count,
+                    stats.milliseconds,
+                    extra={
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status_code": status_code,
+                        "duration_ms": round(duration_ms, 1),
+                        "db_queries": stats.count,
+                        "db_ms": round(stats.milliseconds, 1)
+                    }
+                )
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Low-cardinality route label: the matched path template
+    (/api/tasks/{task_id}), never the raw path.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Prometheus metrics for HTTP requests and WebSocket connections.
+
+    Records per-route latency, request and error counts, in-flight
+    requests and open WebSockets. Should be the outermost middleware so
+    it sees every request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "websocket":
+            await self._websocket(scope, receive, send)
+            return
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception:
+            status_code = 500
+            raise
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            method = scope["method"]
+            route = route_template(scope)
+            HTTP_REQUEST_DURATION.labels(method, route).observe(time.perf_counter() - started)
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+            if status_code >= 500:
+                HTTP_REQUEST_ERRORS.labels(method, route).inc()
+
+    async def _websocket(self, scope: Scope, receive: Receive, send: Send) -> None:
+        gauge = None
+
+        async def send_tracking_accept(message: Message) -> None:
+            nonlocal gauge
+            if message["type"] == "websocket.accept" and gauge is None:
+                gauge = WEBSOCKET_CONNECTIONS.labels(route_template(scope))
+                gauge.inc()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking_accept)
+        finally:
+            if gauge is not None:
+                gauge.dec()
@@ -5,5 +5,7 @@ Import all models here to ensure they're registered with SQLModel.metadata.
 from src.models.user import User
 from src.models.task import Task
 from src.models.tag import Tag, TaskTag
+from src.models.refresh_token import RefreshToken
+from src.models.personal_access_token import PersonalAccessToken
 
-__all__ = ["User", "Task", "Tag", "TaskTag"]
+__all__ = ["User", "Task", "Tag", "TaskTag", "RefreshToken", "PersonalAccessToken"]
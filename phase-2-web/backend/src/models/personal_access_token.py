@@ -0,0 +1,48 @@
+"""
+Personal access token model for machine clients (e.g. the MCP chatbot).
+Only a keyed HMAC digest of the token is stored, never the token itself.
+"""
+from datetime import datetime
+from typing import Optional, List
+from uuid import UUID, uuid4
+from sqlmodel import SQLModel, Field
+
+
+class PersonalAccessToken(SQLModel, table=True):
+    """
+    Personal access token.
+
+    - token_digest: HMAC-SHA256 of the token (unique index, one lookup per request)
+    - token_prefix: first characters of the token, for display only
+    - scopes: space-separated ("read", "write")
+    """
+    __tablename__ = "personal_access_tokens"
+
+    # Primary Key
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+
+    # Foreign Key
+    user_id: UUID = Field(foreign_key="users.id", index=True)
+
+    # Token Fields
+    name: str = Field(max_length=100, description="Human readable label")
+    token_digest: str = Field(
+        max_length=64,
+        unique=True,
+        index=True,
+        description="HMAC-SHA256 hex digest of the token"
+    )
+    token_prefix: str = Field(max_length=16, description="Token prefix for display")
+    scopes: str = Field(default="read write", max_length=100, description="Space-separated scopes")
+
+    # Lifetime
+    expires_at: Optional[datetime] = Field(default=None, description="Expiration (null = never)")
+    revoked_at: Optional[datetime] = Field(default=None, description="Revocation timestamp")
+
+    # Timestamp
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+    @property
+    def scope_list(self) -> List[str]:
+        """Scopes as a list."""
+        return self.scopes.split()
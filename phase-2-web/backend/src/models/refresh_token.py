@@ -0,0 +1,47 @@
+"""
+Refresh token model for rotation and revocation.
+Each issued refresh JWT carries a `jti` that maps to one row here.
+"""
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from sqlmodel import SQLModel, Field
+
+
+class RefreshToken(SQLModel, table=True):
+    """
+    Issued refresh token.
+
+    Lifecycle:
+    - Created on login, registration and OAuth login
+    - Revoked when rotated (replaced_by points to the successor),
+      on logout, or when a revoked token is presented again (reuse)
+    """
+    __tablename__ = "refresh_tokens"
+
+    # Primary Key (JWT ID claim)
+    jti: str = Field(primary_key=True, max_length=64)
+
+    # Foreign Key
+    user_id: UUID = Field(foreign_key="users.id", index=True)
+
+    # Lifetime
+    expires_at: datetime = Field(description="Expiration timestamp (matches JWT exp)")
+    revoked_at: Optional[datetime] = Field(
+        default=None,
+        index=True,
+        description="Revocation timestamp (null while active)"
+    )
+    replaced_by: Optional[str] = Field(
+        default=None,
+        max_length=64,
+        description="jti of the token issued when this one was rotated"
+    )
+
+    # Timestamp
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+    @property
+    def is_active(self) -> bool:
+        """True if the token is neither revoked nor expired."""
+        return self.revoked_at is None and self.expires_at > datetime.utcnow()
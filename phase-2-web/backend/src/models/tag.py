@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
 from uuid import UUID, uuid4
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import UniqueConstraint
 import re
 
 if TYPE_CHECKING:
@@ -23,6 +24,10 @@ class Tag(SQLModel, table=True):
     - User-specific tags
     """
     __tablename__ = "tags"
+    # Each user can't have duplicate tag names (enforced by the database)
+    __table_args__ = (
+        UniqueConstraint("user_id", "name", name="uq_tags_user_id_name"),
+    )
 
     # Primary Key
     id: UUID = Field(default_factory=uuid4, primary_key=True)
@@ -61,11 +66,6 @@ class Tag(SQLModel, table=True):
 
     class Config:
         """SQLModel configuration."""
-        # Unique constraint on (user_id, name)
-        # This ensures each user can't have duplicate tag names
-        table_args = (
-            {"sqlite_autoincrement": True},
-        )
         json_schema_extra = {
             "example": {
                 "name": "urgent",
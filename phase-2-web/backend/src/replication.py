@@ -0,0 +1,112 @@
+"""
+Read-your-writes for read replica routing.
+
+GET endpoints read from READ_REPLICA_URL when it is configured. A replica
+lags the primary slightly, so a user who just wrote could read back stale
+data. Each write records the time of the user's latest write; for
+READ_YOUR_WRITES_SECONDS afterwards that user's read sessions are pinned
+to the primary.
+
+Limitations:
+- Routing is by time only. The replica's actual replay position is not
+  checked, so a replica lagging by more than READ_YOUR_WRITES_SECONDS
+  can still serve stale reads.
+- Without REDIS_URL the write times are per worker process: after a
+  write handled by one worker, the user's next read on another worker
+  may go to the replica. Set REDIS_URL (requires the optional `redis`
+  package) when running several workers with a replica.
+"""
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional
+from uuid import UUID
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.config import settings
+from src.database import replica_engine, reads_from_replica, use_primary
+
+
+logger = logging.getLogger(__name__)
+
+
+class RecentWriteTracker:
+    """
+    Time of each user's latest write.
+
+    Usage:
+        await write_tracker.record_write(user.id)
+        if await write_tracker.recently_wrote(user.id):
+            use_primary(session)
+    """
+
+    def __init__(self, window_seconds: int, max_users: int = 100_000):
+        self.window_seconds = window_seconds
+        self.max_users = max_users
+        # user_id -> written_at (monotonic), ordered by last write
+        self._writes: "OrderedDict[UUID, float]" = OrderedDict()
+        self._redis = None
+
+        if settings.REDIS_URL:
+            try:
+                import redis.asyncio as redis
+
+                self._redis = redis.from_url(settings.REDIS_URL)
+            except ImportError:
+                logger.warning("REDIS_URL is set but redis is not installed; tracking writes per worker")
+
+    async def record_write(self, user_id: UUID) -> None:
+        """Note that the user wrote just now."""
+        self._writes.pop(user_id, None)
+        self._writes[user_id] = time.monotonic()
+        while len(self._writes) > self.max_users:
+            self._writes.popitem(last=False)
+
+        if self._redis is not None:
+            try:
+                await self._redis.set(f"rw:{user_id}", 1, ex=self.window_seconds)
+            except Exception as e:
+                logger.warning("Shared write tracker unavailable: %s", e)
+
+    async def recently_wrote(self, user_id: UUID) -> bool:
+        """Check whether the user wrote within the read-your-writes window."""
+        written_at = self._writes.get(user_id)
+        if written_at is not None and time.monotonic() - written_at < self.window_seconds:
+            return True
+
+        if self._redis is not None:
+            try:
+                return bool(await self._redis.exists(f"rw:{user_id}"))
+            except Exception as e:
+                # Without the shared state, err on the side of the primary
+                logger.warning("Shared write tracker unavailable, reading from primary: %s", e)
+                return True
+
+        return False
+
+    async def close(self) -> None:
+        """Close the shared backend connection. Called on app shutdown."""
+        if self._redis is not None:
+            await self._redis.aclose()
+
+
+# Global tracker instance (one per worker process)
+write_tracker = RecentWriteTracker(settings.READ_YOUR_WRITES_SECONDS)
+
+
+async def record_write(user_id: UUID) -> None:
+    """Note a write by the user (no-op without a read replica)."""
+    if replica_engine is not None:
+        await write_tracker.record_write(user_id)
+
+
+async def route_reads(session: AsyncSession, user_id: Optional[UUID]) -> None:
+    """
+    Pin a read session to the primary if the user wrote recently.
+
+    Must run before the session's first query for that user's data.
+    """
+    if user_id is not None and reads_from_replica(session):
+        if await write_tracker.recently_wrote(user_id):
+            use_primary(session)
@@ -0,0 +1,155 @@
+"""
+Database schema version check and init job.
+
+Workers no longer create tables on startup. Instead they compare the
+database's Alembic revision with the head revision shipped in
+alembic/versions (one query) and fail fast or warn, per SCHEMA_CHECK.
+
+Tables are created and migrated by an explicit init job, run once per
+deploy before the web processes start:
+
+    python -m src.schema init     # create/migrate the schema
+    python -m src.schema check    # print the schema status
+"""
+import asyncio
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import DBAPIError
+
+from src.config import settings
+from src.database import engine, create_db_and_tables, close_db
+import src.models  # noqa: F401  (registers all tables with SQLModel.metadata)
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+class SchemaMismatchError(RuntimeError):
+    """The database schema revision does not match the code."""
+
+
+@dataclass(frozen=True)
+class SchemaStatus:
+    """Database revision(s) compared with the code's Alembic head(s)."""
+    current: Tuple[str, ...]
+    heads: Tuple[str, ...]
+
+    @property
+    def up_to_date(self) -> bool:
+        return bool(self.current) and set(self.current) == set(self.heads)
+
+    def describe(self) -> str:
+        expected = ", ".join(self.heads) or "none"
+        current = ", ".join(self.current)
+        if not self.current:
+            return f"database has no schema revision (expected {expected}); run `python -m src.schema init`"
+        if not self.up_to_date:
+            return f"database is at revision {current}, code expects {expected}; run `python -m src.schema init`"
+        return f"database schema is at head ({current})"
+
+
+def alembic_config() -> Config:
+    """Alembic config that works from any working directory."""
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    return config
+
+
+def head_revisions() -> Tuple[str, ...]:
+    """Head revision(s) of the migration scripts shipped with the code."""
+    return tuple(ScriptDirectory.from_config(alembic_config()).get_heads())
+
+
+async def current_revisions() -> Tuple[str, ...]:
+    """
+    Read the database's Alembic revision(s) (one query; empty if never stamped).
+
+    Usually one; a database upgraded along branched migrations has one per head.
+    """
+    async with engine.connect() as conn:
+        try:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+        except DBAPIError:
+            # alembic_version does not exist yet
+            return ()
+        return tuple(sorted(result.scalars().all()))
+
+
+async def check_schema() -> SchemaStatus:
+    """
+    Compare the database revision with the code. Called on app startup.
+
+    Raises:
+        SchemaMismatchError: If SCHEMA_CHECK is "fail" and they differ
+    """
+    status = SchemaStatus(current=await current_revisions(), heads=head_revisions())
+
+    if not status.up_to_date and settings.SCHEMA_CHECK == "fail":
+        raise SchemaMismatchError(status.describe())
+
+    return status
+
+
+async def _has_tables() -> bool:
+    async with engine.connect() as conn:
+        tables = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+    return "users" in tables
+
+
+def init_schema() -> None:
+    """
+    Create or migrate the schema (the init job).
+
+    - Fresh database: create all tables from the models and stamp the
+      Alembic head, so migrations aren't replayed on an empty schema.
+    - Existing database: upgrade to head. Every table added since the
+      original schema (users, tasks, tags, task_tags) has a migration.
+    """
+    async def prepare() -> bool:
+        try:
+            fresh = not await _has_tables()
+            if fresh:
+                await create_db_and_tables()
+            return fresh
+        finally:
+            await close_db()
+
+    fresh = asyncio.run(prepare())
+
+    # Alembic runs its own event loop (see alembic/env.py)
+    config = alembic_config()
+    if fresh:
+        command.stamp(config, "heads")
+    else:
+        command.upgrade(config, "heads")
+
+
+def main(argv: list) -> int:
+    action = argv[1] if len(argv) > 1 else "check"
+    if action not in ("init", "check"):
+        print(__doc__)
+        return 2
+
+    if action == "init":
+        init_schema()
+
+    async def status() -> SchemaStatus:
+        try:
+            return SchemaStatus(current=await current_revisions(), heads=head_revisions())
+        finally:
+            await close_db()
+
+    result = asyncio.run(status())
+    print(result.describe())
+    return 0 if result.up_to_date else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
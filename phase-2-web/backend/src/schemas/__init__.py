@@ -5,6 +5,7 @@ from src.schemas.user import UserCreate, UserLogin, UserResponse, Token, TokenDa
 from src.schemas.task import TaskCreate, TaskUpdate, TaskResponse, TaskWithTags
 from src.schemas.tag import TagCreate, TagUpdate, TagResponse
 from src.schemas.common import PaginatedResponse, MessageResponse
+from src.schemas.personal_token import PersonalTokenCreate, PersonalTokenResponse, PersonalTokenCreated
 
 __all__ = [
     # User schemas
@@ -25,4 +26,8 @@ __all__ = [
     # Common schemas
     "PaginatedResponse",
     "MessageResponse",
+    # Personal access token schemas
+    "PersonalTokenCreate",
+    "PersonalTokenResponse",
+    "PersonalTokenCreated",
 ]
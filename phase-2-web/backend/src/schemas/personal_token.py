@@ -0,0 +1,71 @@
+"""
+Pydantic schemas for personal access tokens.
+"""
+from pydantic import BaseModel, Field
+from uuid import UUID
+from datetime import datetime
+from typing import Optional, List, Literal
+
+
+class PersonalTokenCreate(BaseModel):
+    """
+    Schema for creating a personal access token.
+
+    Scopes:
+    - read: GET requests
+    - write: all other methods
+    """
+    name: str = Field(
+        min_length=1,
+        max_length=100,
+        description="Token label",
+        examples=["mcp-chatbot"]
+    )
+    scopes: List[Literal["read", "write"]] = Field(
+        default=["read", "write"],
+        min_length=1,
+        description="Granted scopes"
+    )
+    expires_in_days: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=365,
+        description="Lifetime in days (omit for no expiration)"
+    )
+
+
+class PersonalTokenResponse(BaseModel):
+    """
+    Schema for a personal access token in responses.
+    Never includes the token itself.
+    """
+    id: UUID
+    name: str
+    token_prefix: str
+    scopes: List[str]
+    created_at: datetime
+    expires_at: Optional[datetime]
+    revoked_at: Optional[datetime]
+
+
+class PersonalTokenCreated(PersonalTokenResponse):
+    """
+    Response for a newly created token.
+    The plaintext token is only returned once.
+    """
+    token: str = Field(description="Personal access token (shown once)")
+
+    class Config:
+        """Pydantic configuration."""
+        json_schema_extra = {
+            "example": {
+                "id": "123e4567-e89b-12d3-a456-426614174000",
+                "name": "mcp-chatbot",
+                "token_prefix": "tdp_a1b2c3d4",
+                "scopes": ["read", "write"],
+                "created_at": "2025-01-01T00:00:00",
+                "expires_at": None,
+                "revoked_at": None,
+                "token": "tdp_a1b2c3d4..."
+            }
+        }
@@ -131,6 +131,7 @@ class TokenData(BaseModel):
     user_id: UUID
     username: str
     exp: Optional[datetime] = None
+    jti: Optional[str] = None
 
     class Config:
         """Pydantic configuration."""
@@ -0,0 +1,66 @@
+"""
+Shared fixtures for backend tests
+
+Tests run against TEST_DATABASE_URL (e.g. a local Postgres) when it is
+set, otherwise against a temporary SQLite database as a stand-in.
+"""
+
+import os
+import tempfile
+
+# Configure the app before anything imports src.config
+os.environ["DATABASE_URL"] = os.environ.get("TEST_DATABASE_URL") or (
+    f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/test.db"
+)
+os.environ["READ_REPLICA_URL"] = ""
+os.environ["LOGIN_RATE_LIMIT_ENABLED"] = "false"
+os.environ["DB_ECHO"] = "false"
+
+import httpx
+import pytest
+from sqlmodel import SQLModel
+
+import main
+from src.database import engine, close_db
+from tests.query_budget import QueryBudgetClient
+
+
+@pytest.fixture(autouse=True)
+async def database():
+    """Create all tables for each test and drop them afterwards"""
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    yield
+
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+    # Pool connections belong to this test's event loop
+    await close_db()
+
+
+@pytest.fixture
+async def client():
+    """HTTP client calling the app in-process"""
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http_client:
+        yield http_client
+
+
+@pytest.fixture
+async def auth_headers(client):
+    """Register a user and return its Authorization header"""
+    response = await client.post("/api/auth/register", json={
+        "username": "budget_user",
+        "email": "budget@example.com",
+        "password": "Passw0rdX"
+    })
+    assert response.status_code == 201
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+async def query_budget():
+    """Client that fails the test when a request exceeds its route's query budget"""
+    async with QueryBudgetClient(main.app) as budget_client:
+        yield budget_client
@@ -0,0 +1,65 @@
+"""
+Query-budget assertions
+
+Endpoints declare how many SQL statements they may run per request with
+@query_budget(n) (src/instrumentation.py). These helpers look up the
+budget of the route a request hits and fail the test if the request runs
+more statements than that, which catches N+1 regressions.
+"""
+
+from typing import Optional
+
+import httpx
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.instrumentation import QueryStats, track_queries
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A request ran more SQL statements than its route's budget."""
+
+
+def assert_within_budget(stats: QueryStats, budget: int, label: str) -> None:
+    """Raise QueryBudgetExceeded if stats.count is over budget."""
+    if stats.count > budget:
+        raise QueryBudgetExceeded(
+            f"{label} ran {stats.count} SQL statements, budget is {budget}"
+        )
+
+
+class QueryBudgetClient(httpx.AsyncClient):
+    """
+    HTTP client that checks every request against the @query_budget of
+    the endpoint that handled it.
+
+    Usage:
+        async with QueryBudgetClient(app) as client:
+            response = await client.get("/api/tasks", headers=headers)
+            print(client.last.count)
+    """
+
+    def __init__(self, app: ASGIApp, **kwargs):
+        self._endpoint = None
+        self.last: Optional[QueryStats] = None
+
+        async def recording_app(scope: Scope, receive: Receive, send: Send) -> None:
+            await app(scope, receive, send)
+            # The router stores the matched endpoint in the request scope
+            self._endpoint = scope.get("endpoint")
+
+        kwargs.setdefault("base_url", "http://test")
+        super().__init__(transport=httpx.ASGITransport(app=recording_app), **kwargs)
+
+    async def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        self._endpoint = None
+        with track_queries() as stats:
+            response = await super().send(request, **kwargs)
+        self.last = stats
+
+        label = f"{request.method} {request.url.path}"
+        budget = getattr(self._endpoint, "query_budget", None)
+        if budget is None:
+            raise AssertionError(f"{label} was not handled by an endpoint with a @query_budget")
+
+        assert_within_budget(stats, budget, label)
+        return response
@@ -0,0 +1,158 @@
+"""
+Registration, login, logout and password changes
+
+Run tests with:
+    pytest tests/test_auth.py
+"""
+
+import pytest
+
+from src.api import auth
+from src.auth.rate_limit import LoginRateLimiter
+from src.config import settings
+
+PASSWORD = "Passw0rdX"
+
+
+async def register(client, username="auth_user", email="auth@example.com", password=PASSWORD):
+    return await client.post("/api/auth/register", json={
+        "username": username,
+        "email": email,
+        "password": password
+    })
+
+
+async def login(client, username_or_email="auth_user", password=PASSWORD):
+    return await client.post("/api/auth/login", json={
+        "username_or_email": username_or_email,
+        "password": password
+    })
+
+
+def bearer(response):
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def test_register_returns_tokens_and_user(client):
+    response = await register(client)
+
+    assert response.status_code == 201
+    body = response.json()
+    assert body["token_type"] == "bearer"
+    assert body["access_token"] and body["refresh_token"]
+    assert body["user"]["username"] == "auth_user"
+    assert "password_hash" not in body["user"]
+
+
+@pytest.mark.parametrize("username, email, detail", [
+    ("auth_user", "other@example.com", "Username already registered"),
+    ("other_user", "auth@example.com", "Email already registered"),
+])
+async def test_register_rejects_duplicates(client, username, email, detail):
+    await register(client)
+
+    response = await register(client, username=username, email=email)
+    assert response.status_code == 400
+    assert response.json()["detail"] == detail
+
+
+@pytest.mark.parametrize("username, password", [
+    ("bad name!", PASSWORD),
+    ("auth_user", "alllowercase1"),
+    ("auth_user", "NoDigitsHere"),
+    ("auth_user", "Sh0rt"),
+])
+async def test_register_validates_input(client, username, password):
+    response = await register(client, username=username, password=password)
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("identifier", ["auth_user", "auth@example.com"])
+async def test_login_with_username_or_email(client, identifier):
+    await register(client)
+
+    response = await login(client, identifier)
+    assert response.status_code == 200
+
+    response = await client.get("/api/auth/me", headers=bearer(response))
+    assert response.status_code == 200
+    assert response.json()["email"] == "auth@example.com"
+
+
+@pytest.mark.parametrize("identifier, password", [
+    ("auth_user", "Wr0ngPassword"),
+    ("nobody", PASSWORD),
+])
+async def test_login_rejects_bad_credentials(client, identifier, password):
+    await register(client)
+
+    response = await login(client, identifier, password)
+    assert response.status_code == 401
+
+
+async def test_login_is_throttled(client, monkeypatch):
+    monkeypatch.setattr(settings, "LOGIN_RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(settings, "LOGIN_RATE_LIMIT_USER_BURST", 2)
+    monkeypatch.setattr(settings, "REDIS_URL", "")
+    monkeypatch.setattr(auth, "login_rate_limiter", LoginRateLimiter())
+    await register(client)
+
+    for _ in range(2):
+        assert (await login(client, password="Wr0ngPassword")).status_code == 401
+
+    response = await login(client)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+
+async def test_logout_revokes_the_refresh_token(client):
+    refresh_token = (await register(client)).json()["refresh_token"]
+
+    response = await client.post("/api/auth/logout", params={"refresh_token": refresh_token})
+    assert response.status_code == 200
+
+    response = await client.post("/api/auth/refresh", params={"refresh_token": refresh_token})
+    assert response.status_code == 401
+
+
+async def test_change_password(client):
+    registered = await register(client)
+    other_session = await login(client)
+
+    response = await client.post("/api/auth/change-password", json={
+        "current_password": PASSWORD,
+        "new_password": "N3wPassword",
+        "confirm_password": "N3wPassword"
+    }, headers=bearer(registered))
+    assert response.status_code == 200
+
+    assert (await login(client)).status_code == 401
+    assert (await login(client, password="N3wPassword")).status_code == 200
+
+    # Every session ends, the caller's included
+    for session in (registered, other_session):
+        response = await client.post(
+            "/api/auth/refresh", params={"refresh_token": session.json()["refresh_token"]}
+        )
+        assert response.status_code == 401
+
+
+@pytest.mark.parametrize("current, new, confirm, status_code", [
+    ("Wr0ngPassword", "N3wPassword", "N3wPassword", 401),
+    (PASSWORD, "N3wPassword", "N3wPassw0rd", 400),
+    (PASSWORD, PASSWORD, PASSWORD, 400),
+])
+async def test_change_password_rejects_bad_input(client, current, new, confirm, status_code):
+    registered = await register(client)
+
+    response = await client.post("/api/auth/change-password", json={
+        "current_password": current,
+        "new_password": new,
+        "confirm_password": confirm
+    }, headers=bearer(registered))
+    assert response.status_code == status_code
+
+
+async def test_invalid_access_token_is_rejected(client):
+    response = await client.get("/api/auth/me", headers={"Authorization": "Bearer not-a-jwt"})
+    assert response.status_code == 401
@@ -0,0 +1,58 @@
+"""
+Login throttling per client IP, per account from that IP, and per account
+
+Run tests with:
+    pytest tests/test_login_rate_limit.py
+"""
+
+import pytest
+
+from src.auth.rate_limit import LoginRateLimiter
+from src.config import settings
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    monkeypatch.setattr(settings, "REDIS_URL", "")
+    monkeypatch.setattr(settings, "LOGIN_RATE_LIMIT_IP_BURST", 20)
+    monkeypatch.setattr(settings, "LOGIN_RATE_LIMIT_USER_BURST", 3)
+    monkeypatch.setattr(settings, "LOGIN_RATE_LIMIT_ACCOUNT_BURST", 10)
+    return LoginRateLimiter()
+
+
+async def test_account_is_throttled_per_source(limiter):
+    for _ in range(3):
+        assert await limiter.check("203.0.113.9", "victim@example.com") == (0.0, None)
+
+    retry_after, scope = await limiter.check("203.0.113.9", "Victim@example.com ")
+    assert scope == "user"
+    assert retry_after > 0
+
+
+async def test_other_sources_cannot_lock_an_account_out(limiter):
+    for _ in range(10):
+        await limiter.check("203.0.113.9", "victim@example.com")
+
+    assert await limiter.check("198.51.100.7", "victim@example.com") == (0.0, None)
+
+
+async def test_client_ip_is_throttled_across_accounts(limiter):
+    for i in range(20):
+        assert await limiter.check("203.0.113.9", f"user{i}@example.com") == (0.0, None)
+
+    retry_after, scope = await limiter.check("203.0.113.9", "another@example.com")
+    assert scope == "ip"
+    assert retry_after > 0
+
+
+async def test_account_is_throttled_across_sources(limiter):
+    """A password spray from many IPs still hits the per-account limit"""
+    for i in range(10):
+        assert await limiter.check(f"203.0.113.{i}", "victim@example.com") == (0.0, None)
+
+    retry_after, scope = await limiter.check("198.51.100.7", "victim@example.com")
+    assert scope == "account"
+    assert retry_after > 0
+
+    # Other accounts are unaffected
+    assert await limiter.check("198.51.100.7", "someone@example.com") == (0.0, None)
@@ -0,0 +1,40 @@
+"""
+Event loop lag monitor
+
+Run tests with:
+    pytest tests/test_loop_monitor.py
+"""
+
+import asyncio
+import logging
+import time
+
+from src.loop_monitor import EventLoopMonitor
+
+
+async def test_blocking_call_is_reported_once_with_its_stack(caplog):
+    monitor = EventLoopMonitor(interval=0.01, threshold=0.05)
+    monitor.start()
+    await asyncio.sleep(0.03)
+
+    with caplog.at_level(logging.WARNING, logger="src.loop_monitor"):
+        time.sleep(0.3)  # blocks the loop
+        await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    reports = [r for r in caplog.records if r.name == "src.loop_monitor"]
+    assert len(reports) == 1
+    assert reports[0].blocked_ms >= 50
+    assert "test_blocking_call_is_reported_once_with_its_stack" in reports[0].getMessage()
+
+
+async def test_idle_loop_is_not_reported(caplog):
+    monitor = EventLoopMonitor(interval=0.01, threshold=0.2)
+
+    with caplog.at_level(logging.WARNING, logger="src.loop_monitor"):
+        monitor.start()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+    assert not [r for r in caplog.records if r.name == "src.loop_monitor"]
+    assert monitor._probe is None and monitor._watchdog is None
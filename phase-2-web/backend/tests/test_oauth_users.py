@@ -0,0 +1,56 @@
+"""
+OAuth login: finding or creating the user for a provider email
+
+Run tests with:
+    pytest tests/test_oauth_users.py
+"""
+
+import pytest
+
+from src.api import auth
+from src.database import get_db_session
+
+
+@pytest.fixture
+def hashes(monkeypatch):
+    """Count bcrypt hashes made for OAuth users"""
+    calls = []
+
+    def hash_password(password):
+        calls.append(password)
+        return "not-a-real-hash"
+
+    monkeypatch.setattr(auth, "hash_password", hash_password)
+    return calls
+
+
+async def test_new_user_is_created_with_a_random_password(hashes):
+    async with get_db_session() as session:
+        user = await auth._get_or_create_oauth_user(session, "new@example.com", "new")
+        await session.commit()
+
+    assert user.username == "new"
+    assert user.password_hash == "not-a-real-hash"
+    assert len(hashes) == 1
+
+
+async def test_returning_user_skips_password_hashing(hashes):
+    async with get_db_session() as session:
+        first = await auth._get_or_create_oauth_user(session, "back@example.com", "back")
+        await session.commit()
+    hashes.clear()
+
+    async with get_db_session() as session:
+        user = await auth._get_or_create_oauth_user(session, "back@example.com", "back")
+
+    assert user.id == first.id
+    assert hashes == []
+
+
+async def test_taken_username_gets_a_suffix(hashes):
+    async with get_db_session() as session:
+        await auth._get_or_create_oauth_user(session, "one@example.com", "sam")
+        user = await auth._get_or_create_oauth_user(session, "two@example.com", "sam")
+        await session.commit()
+
+    assert user.username == "sam1"
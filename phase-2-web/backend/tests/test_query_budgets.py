@@ -0,0 +1,181 @@
+"""
+Query budgets for the task and tag endpoints
+
+Each request must stay within the @query_budget declared on its route,
+with enough rows seeded that an N+1 query pattern would exceed it.
+
+Run tests with:
+    pytest tests/test_query_budgets.py
+    TEST_DATABASE_URL=postgresql+asyncpg://... pytest tests/test_query_budgets.py
+"""
+
+import pytest
+
+from src.api.tasks import router as tasks_router
+from src.api.tags import router as tags_router
+from tests.query_budget import QueryBudgetExceeded, assert_within_budget
+from src.instrumentation import QueryStats
+
+
+async def create_tasks(client, headers, count):
+    ids = []
+    for i in range(count):
+        response = await client.post("/api/tasks", json={"title": f"Task {i}"}, headers=headers)
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+    return ids
+
+
+async def create_tags(client, headers, count):
+    ids = []
+    for i in range(count):
+        response = await client.post("/api/tags", json={"name": f"tag-{i}"}, headers=headers)
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+    return ids
+
+
+async def assign(client, headers, task_id, tag_ids):
+    for tag_id in tag_ids:
+        response = await client.post(f"/api/tasks/{task_id}/tags", json={"tag_id": tag_id}, headers=headers)
+        assert response.status_code == 200
+
+
+def test_every_task_and_tag_route_declares_a_budget():
+    """Budgets live next to the routes; none may be missing"""
+    for route in tasks_router.routes + tags_router.routes:
+        assert hasattr(route.endpoint, "query_budget"), f"{route.path} has no @query_budget"
+
+
+def test_budget_violation_is_reported():
+    """The assertion helper fails when a request is over budget"""
+    with pytest.raises(QueryBudgetExceeded):
+        assert_within_budget(QueryStats(count=3), 2, "GET /api/tasks")
+
+
+async def test_list_tasks_budget(client, auth_headers, query_budget):
+    """list_tasks: one query for the page and total, whatever the page size"""
+    task_ids = await create_tasks(client, auth_headers, 5)
+    tag_ids = await create_tags(client, auth_headers, 2)
+    for task_id in task_ids:
+        await assign(client, auth_headers, task_id, tag_ids)
+
+    response = await query_budget.get("/api/tasks", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["total"] == 5
+
+    response = await query_budget.get(
+        f"/api/tasks?search=task&tag_ids={tag_ids[0]}&tag_ids={tag_ids[1]}&limit=2",
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["total"] == 5
+    assert len(response.json()["items"]) == 2
+
+
+async def test_list_tasks_page_past_the_end_budget(client, auth_headers, query_budget):
+    """A page past the end still reports the total, in the same query"""
+    await create_tasks(client, auth_headers, 3)
+
+    response = await query_budget.get("/api/tasks?page=5&limit=2", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+    assert response.json()["total"] == 3
+    assert response.json()["total_pages"] == 2
+
+    response = await query_budget.get("/api/tasks?search=nothing-matches", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+    assert response.json()["total"] == 0
+
+
+async def test_list_tasks_pages_keep_their_order(client, auth_headers, query_budget):
+    await create_tasks(client, auth_headers, 5)
+
+    titles = []
+    for page in (1, 2, 3):
+        response = await query_budget.get(
+            f"/api/tasks?sort_by=title&sort_order=asc&limit=2&page={page}", headers=auth_headers
+        )
+        assert response.json()["total"] == 5
+        titles += [task["title"] for task in response.json()["items"]]
+
+    assert titles == [f"Task {i}" for i in range(5)]
+
+
+async def test_task_crud_budgets(client, auth_headers, query_budget):
+    """Create, get, update, toggle and delete a task"""
+    response = await query_budget.post("/api/tasks", json={"title": "Budget"}, headers=auth_headers)
+    assert response.status_code == 201
+    task_id = response.json()["id"]
+
+    response = await query_budget.get(f"/api/tasks/{task_id}", headers=auth_headers)
+    assert response.status_code == 200
+
+    response = await query_budget.put(f"/api/tasks/{task_id}", json={"title": "Renamed"}, headers=auth_headers)
+    assert response.status_code == 200
+
+    response = await query_budget.patch(f"/api/tasks/{task_id}/complete", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+
+    await assign(client, auth_headers, task_id, await create_tags(client, auth_headers, 3))
+
+    response = await query_budget.delete(f"/api/tasks/{task_id}", headers=auth_headers)
+    assert response.status_code == 204
+
+
+async def test_tag_assignment_budgets(client, auth_headers, query_budget):
+    """assign_tag_to_task stays at 3 queries however many tags the task has"""
+    task_id = (await create_tasks(client, auth_headers, 1))[0]
+    tag_ids = await create_tags(client, auth_headers, 5)
+
+    for tag_id in tag_ids:
+        response = await query_budget.post(
+            f"/api/tasks/{task_id}/tags", json={"tag_id": tag_id}, headers=auth_headers
+        )
+        assert response.status_code == 200
+    assert len(response.json()["tags"]) == 5
+
+    # Already assigned: idempotent
+    response = await query_budget.post(
+        f"/api/tasks/{task_id}/tags", json={"tag_id": tag_ids[0]}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert len(response.json()["tags"]) == 5
+
+    response = await query_budget.get(f"/api/tasks/{task_id}/tags", headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 5
+
+    response = await query_budget.delete(f"/api/tasks/{task_id}/tags/{tag_ids[0]}", headers=auth_headers)
+    assert response.status_code == 204
+
+    response = await client.get(f"/api/tasks/{task_id}/tags", headers=auth_headers)
+    assert len(response.json()) == 4
+
+
+async def test_tag_crud_budgets(client, auth_headers, query_budget):
+    """Create, list, get, update and delete a tag"""
+    await create_tags(client, auth_headers, 5)
+
+    response = await query_budget.post("/api/tags", json={"name": "budget"}, headers=auth_headers)
+    assert response.status_code == 201
+    tag_id = response.json()["id"]
+
+    response = await query_budget.get("/api/tags", headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 6
+
+    response = await query_budget.get(f"/api/tags/{tag_id}", headers=auth_headers)
+    assert response.status_code == 200
+
+    response = await query_budget.put(f"/api/tags/{tag_id}", json={"color": "#EF4444"}, headers=auth_headers)
+    assert response.status_code == 200
+
+    task_ids = await create_tasks(client, auth_headers, 3)
+    for task_id in task_ids:
+        await assign(client, auth_headers, task_id, [tag_id])
+
+    response = await query_budget.delete(f"/api/tags/{tag_id}", headers=auth_headers)
+    assert response.status_code == 204
@@ -0,0 +1,69 @@
+"""
+Refresh token rotation and reuse detection
+
+Run tests with:
+    pytest tests/test_refresh_tokens.py
+"""
+
+from sqlmodel import select
+
+from src.auth.jwt import verify_token
+from src.auth.revocation import revocation_filter
+from src.database import get_db_session
+from src.models.refresh_token import RefreshToken
+
+
+async def register(client):
+    response = await client.post("/api/auth/register", json={
+        "username": "refresh_user",
+        "email": "refresh@example.com",
+        "password": "Passw0rdX"
+    })
+    assert response.status_code == 201
+    return response.json()["refresh_token"]
+
+
+async def refresh(client, refresh_token):
+    return await client.post("/api/auth/refresh", params={"refresh_token": refresh_token})
+
+
+async def revoked_at(refresh_token):
+    jti = verify_token(refresh_token, token_type="refresh").jti
+    async with get_db_session() as session:
+        result = await session.execute(select(RefreshToken).where(RefreshToken.jti == jti))
+        return result.scalar_one().revoked_at
+
+
+async def test_refresh_rotates_the_token(client):
+    first = await register(client)
+
+    response = await refresh(client, first)
+    assert response.status_code == 200
+    second = response.json()["refresh_token"]
+    assert second != first
+    assert await revoked_at(first) is not None
+    assert await revoked_at(second) is None
+
+
+async def test_reused_token_revokes_the_family(client):
+    first = await register(client)
+    second = (await refresh(client, first)).json()["refresh_token"]
+
+    response = await refresh(client, first)
+    assert response.status_code == 401
+    assert await revoked_at(second) is not None
+
+
+async def test_reuse_is_detected_when_the_filter_is_stale(client, monkeypatch):
+    """A worker that hasn't heard of the rotation yet still revokes the family"""
+    first = await register(client)
+    second = (await refresh(client, first)).json()["refresh_token"]
+
+    async def not_revoked(jti, session):
+        return False
+
+    monkeypatch.setattr(revocation_filter, "is_revoked", not_revoked)
+
+    response = await refresh(client, first)
+    assert response.status_code == 401
+    assert await revoked_at(second) is not None
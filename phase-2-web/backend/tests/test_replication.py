@@ -0,0 +1,60 @@
+"""
+Read-your-writes tracking for read replica routing
+
+Run tests with:
+    pytest tests/test_replication.py
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from src.config import settings
+from src.replication import RecentWriteTracker
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    monkeypatch.setattr(settings, "REDIS_URL", "")
+    return RecentWriteTracker(window_seconds=5, max_users=2)
+
+
+async def test_recent_writer_reads_from_primary(tracker):
+    user_id = uuid4()
+    assert not await tracker.recently_wrote(user_id)
+
+    await tracker.record_write(user_id)
+    assert await tracker.recently_wrote(user_id)
+    assert not await tracker.recently_wrote(uuid4())
+
+
+async def test_window_expires(tracker):
+    user_id = uuid4()
+    await tracker.record_write(user_id)
+
+    tracker._writes[user_id] -= 10
+    assert not await tracker.recently_wrote(user_id)
+
+
+async def test_oldest_writers_are_evicted(tracker):
+    first, second, third = uuid4(), uuid4(), uuid4()
+    for user_id in (first, second, first, third):
+        await tracker.record_write(user_id)
+
+    assert list(tracker._writes) == [first, third]
+
+
+class UnavailableRedis:
+    async def set(self, *args, **kwargs):
+        raise ConnectionError("redis is down")
+
+    async def exists(self, *args):
+        raise ConnectionError("redis is down")
+
+
+async def test_shared_tracker_outage_falls_back_to_primary(tracker):
+    tracker._redis = UnavailableRedis()
+    user_id = uuid4()
+
+    await tracker.record_write(uuid4())
+    assert await tracker.recently_wrote(user_id)
@@ -0,0 +1,52 @@
+"""
+Startup schema check against the Alembic head(s)
+
+Run tests with:
+    pytest tests/test_schema.py
+"""
+
+import pytest
+from sqlalchemy import text
+
+from src.database import engine
+from src.schema import SchemaStatus, current_revisions, head_revisions
+
+
+@pytest.fixture
+async def stamp():
+    """Write revisions into alembic_version"""
+    async def stamp(*revisions):
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE IF NOT EXISTS alembic_version (version_num VARCHAR(32) PRIMARY KEY)"))
+            await conn.execute(text("DELETE FROM alembic_version"))
+            for revision in revisions:
+                await conn.execute(text("INSERT INTO alembic_version VALUES (:revision)"), {"revision": revision})
+
+    yield stamp
+
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+
+
+async def test_unstamped_database_is_not_up_to_date():
+    status = SchemaStatus(current=await current_revisions(), heads=head_revisions())
+
+    assert status.current == ()
+    assert not status.up_to_date
+    assert "no schema revision" in status.describe()
+
+
+async def test_database_at_head_is_up_to_date(stamp):
+    await stamp(*head_revisions())
+
+    status = SchemaStatus(current=await current_revisions(), heads=head_revisions())
+    assert status.up_to_date
+
+
+async def test_several_revisions_are_read(stamp):
+    await stamp(head_revisions()[0], "0000deadbeef")
+
+    status = SchemaStatus(current=await current_revisions(), heads=head_revisions())
+    assert len(status.current) == 2
+    assert not status.up_to_date
+    assert "0000deadbeef" in status.describe()
@@ -27,6 +27,8 @@ export default function ChatWidget() {
   const wsRef = useRef<WebSocket | null>(null);
   const recognitionRef = useRef<any>(null);
   const messagesEndRef = useRef<HTMLDivElement>(null);
+  // Assistant message being streamed (filled by "delta" frames)
+  const streamingIdRef = useRef<string | null>(null);
 
   // Initialize Speech Recognition
   useEffect(() => {
@@ -69,9 +71,23 @@ export default function ChatWidget() {
     ws.onmessage = (event) => {
       const data = JSON.parse(event.data);
 
-      if (data.type === "message") {
+      if (data.type === "delta") {
+        if (data.content) {
+          setIsTyping(false);
+          appendToStreamingMessage(data.content);
+        }
+      } else if (data.type === "message") {
         setIsTyping(false);
-        addMessage(data.content, "assistant");
+        const streamingId = streamingIdRef.current;
+        streamingIdRef.current = null;
+        if (streamingId) {
+          // Final text replaces the streamed pieces
+          setMessages((prev) =>
+            prev.map((m) => (m.id === streamingId ? { ...m, content: data.content } : m))
+          );
+        } else {
+          addMessage(data.content, "assistant");
+        }
 
         // Text-to-speech
         if ("speechSynthesis" in window) {
@@ -123,6 +139,22 @@ export default function ChatWidget() {
     setMessages((prev) => [...prev, newMessage]);
   };
 
+  const appendToStreamingMessage = (text: string) => {
+    const streamingId = streamingIdRef.current;
+    if (streamingId) {
+      setMessages((prev) =>
+        prev.map((m) => (m.id === streamingId ? { ...m, content: m.content + text } : m))
+      );
+      return;
+    }
+    const id = `stream-${Date.now()}`;
+    streamingIdRef.current = id;
+    setMessages((prev) => [
+      ...prev,
+      { id, role: "assistant", content: text, timestamp: new Date() },
+    ]);
+  };
+
   const sendMessage = () => {
     if (!input.trim() || !wsRef.current || !isConnected) return;
 
@@ -23,6 +23,8 @@ export default function ChatInterface({
   const [isConnected, setIsConnected] = useState(false);
   const [isTyping, setIsTyping] = useState(false);
   const wsRef = useRef<WebSocket | null>(null);
+  // Assistant message being streamed (filled by "delta" frames)
+  const streamingIdRef = useRef<string | null>(null);
 
   // WebSocket connection
   useEffect(() => {
@@ -38,8 +40,27 @@ export default function ChatInterface({
       const data = JSON.parse(event.data);
       console.log("Received:", data);
 
-      if (data.type === "message") {
-        // Add assistant message
+      if (data.type === "delta") {
+        if (data.content) {
+          setIsTyping(false);
+          const streamingId = streamingIdRef.current;
+          if (streamingId) {
+            setMessages((prev) =>
+              prev.map((m) =>
+                m.id === streamingId ? { ...m, content: m.content + data.content } : m
+              )
+            );
+          } else {
+            const id = `stream-${Date.now()}`;
+            streamingIdRef.current = id;
+            setMessages((prev) => [
+              ...prev,
+              { id, role: "assistant", content: data.content, timestamp: new Date() },
+            ]);
+          }
+        }
+      } else if (data.type === "message") {
+        // Add assistant message (replacing the streamed pieces, if any)
         const newMessage: Message = {
           id: Date.now().toString(),
           role: data.role,
@@ -47,7 +68,13 @@ export default function ChatInterface({
           tool_calls: data.tool_calls,
           timestamp: new Date(data.timestamp),
         };
-        setMessages((prev) => [...prev, newMessage]);
+        const streamingId = streamingIdRef.current;
+        streamingIdRef.current = null;
+        setMessages((prev) =>
+          streamingId
+            ? prev.map((m) => (m.id === streamingId ? newMessage : m))
+            : [...prev, newMessage]
+        );
         setIsTyping(false);
       } else if (data.type === "typing") {
         setIsTyping(data.is_typing);
@@ -34,9 +34,10 @@ export interface Conversation {
 }
 
 export interface WebSocketMessage {
-  type: "chat" | "tool_call" | "message" | "typing" | "tool_result";
+  type: "chat" | "tool_call" | "message" | "typing" | "tool_result" | "delta";
   message?: string;
   conversation_id?: string;
+  stream?: boolean;
   tool?: string;
   parameters?: Record<string, any>;
   role?: "user" | "assistant";
@@ -44,5 +45,14 @@ export interface WebSocketMessage {
   tool_calls?: ToolCall[];
   is_typing?: boolean;
   result?: any;
+  tool_call?: ToolCallDelta;
   timestamp?: string;
 }
+
+// Piece of a streamed tool call ("delta" frames)
+export interface ToolCallDelta {
+  index: number;
+  id?: string | null;
+  name?: string | null;
+  arguments: string;
+}
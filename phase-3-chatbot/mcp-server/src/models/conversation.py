@@ -55,6 +55,17 @@ class ConversationResponse(BaseModel):
     updated_at: datetime
     message_count: int
     messages: List[dict] = []  # List of Message objects
+    has_more: bool = False  # Older messages exist (pass before= to load them)
 
     class Config:
         from_attributes = True
+
+
+class ConversationList(BaseModel):
+    """Paginated list of a user's conversations, most recently updated first"""
+
+    items: List[Conversation]
+    total: int
+    page: int
+    limit: int
+    total_pages: int
@@ -18,6 +18,7 @@ class Message(BaseModel):
     content: str
     tool_calls: Optional[List[Dict[str, Any]]] = None
     tool_results: Optional[List[Dict[str, Any]]] = None
+    token_count: int = 0  # Approximate prompt tokens of this message
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
     class Config:
@@ -29,6 +30,7 @@ class Message(BaseModel):
                 "content": "Create a high priority task to review code",
                 "tool_calls": None,
                 "tool_results": None,
+                "token_count": 12,
                 "created_at": "2024-01-01T12:00:00Z"
             }
         }
@@ -53,6 +55,7 @@ class MessageResponse(BaseModel):
     content: str
     tool_calls: Optional[List[Dict[str, Any]]] = None
     tool_results: Optional[List[Dict[str, Any]]] = None
+    token_count: int = 0
     created_at: datetime
 
     class Config:
@@ -9,12 +9,15 @@ import os
 # Load environment variables from .env file
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Depends
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Depends, Response, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Dict, Any, List
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, Optional
 import json
+import httpx
 import logging
 from datetime import datetime
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -26,12 +29,80 @@ from tools.list_tasks import list_tasks_handler
 from tools.update_task import update_task_handler
 from tools.delete_task import delete_task_handler
 from tools.search_tasks import search_tasks_handler
-from utils.mock_ai_client import MockAIClient  # Using mock AI due to API credit issues
+from utils.ai_provider import UnifiedAIClient
+from utils.metrics import CHAT_TURNS, MetricsMiddleware
+from utils.loop_monitor import EventLoopMonitor
+from utils.backend_client import start_backend_client, close_backend_client, get_backend_client
+from utils.tool_scheduler import ToolScheduler, ResultCallback, max_concurrent_tools_per_user
+from utils.connections import create_connection_manager
+from utils.streaming import DeltaCallback
+from utils.intent_parser import Intent, intent_parser
+from utils.conversation_store import (
+    ConversationStoreUnavailable, start_conversation_store, close_conversation_store, get_conversation_store
+)
+from utils.auth import AuthenticationError, authenticate, get_current_user_id
+from models.conversation import ConversationList, ConversationResponse
+from models.message import Message, MessageCreate
+
+
+# Shared AI client (created in lifespan, see create_ai_client)
+ai_client: Optional[UnifiedAIClient] = None
+
+
+def create_ai_client() -> UnifiedAIClient:
+    """AI client for AI_PROVIDER (default mock, as the paid APIs have no credits)"""
+    return UnifiedAIClient(provider=os.getenv("AI_PROVIDER", "mock"))
+
+
+def get_ai_client() -> UnifiedAIClient:
+    """Shared AI client (created lazily outside the server lifespan)"""
+    global ai_client
+    if ai_client is None:
+        ai_client = create_ai_client()
+    return ai_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop background services"""
+    global ai_client
+
+    # Keep-alive client shared by all tool handlers
+    await start_backend_client()
+
+    # Conversation history (tables are created on first start). If the
+    # database is unreachable this logs and disables history; chat still works
+    await start_conversation_store()
+
+    # One AI client for all conversations (prompt and tool schemas prepared once)
+    ai_client = create_ai_client()
+    if os.getenv("AI_WARMUP", "true").lower() == "true":
+        await ai_client.warm_up()
+
+    loop_monitor = None
+    if os.getenv("LOOP_MONITOR_ENABLED", "false").lower() == "true":
+        threshold_ms = float(os.getenv("LOOP_LAG_THRESHOLD_MS", "100"))
+        loop_monitor = EventLoopMonitor(
+            interval=float(os.getenv("LOOP_MONITOR_INTERVAL_MS", "50")) / 1000,
+            threshold=threshold_ms / 1000
+        )
+        loop_monitor.start()
+        logger.info(f"Event loop monitor started (threshold {threshold_ms:.0f}ms)")
+
+    yield
+
+    if loop_monitor is not None:
+        await loop_monitor.stop()
+    await ai_client.close()
+    await close_conversation_store()
+    await close_backend_client()
+
 
 app = FastAPI(
     title="MCP Task Management Server",
     description="Model Context Protocol server for AI-powered task management",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS configuration
@@ -43,6 +114,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Prometheus request metrics (outermost, sees every request)
+app.add_middleware(MetricsMiddleware)
+
 # Tool registry
 TOOLS = {
     "create_task": create_task_handler,
@@ -52,32 +126,8 @@ TOOLS = {
     "search_tasks": search_tasks_handler,
 }
 
-# Active WebSocket connections
-active_connections: List[WebSocket] = []
-
-
-class ConnectionManager:
-    """Manages WebSocket connections"""
-
-    def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
-
-    async def connect(self, websocket: WebSocket, user_id: str):
-        await websocket.accept()
-        self.active_connections[user_id] = websocket
-        logger.info(f"User {user_id} connected")
-
-    def disconnect(self, user_id: str):
-        if user_id in self.active_connections:
-            del self.active_connections[user_id]
-            logger.info(f"User {user_id} disconnected")
-
-    async def send_message(self, user_id: str, message: dict):
-        if user_id in self.active_connections:
-            await self.active_connections[user_id].send_json(message)
-
-
-manager = ConnectionManager()
+# Open WebSockets: per-socket send queues, several sockets per user
+manager = create_connection_manager()
 
 
 @app.get("/")
@@ -91,6 +141,12 @@ async def root():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus metrics endpoint"""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 @app.get("/tools")
 async def list_tools():
     """List available MCP tools"""
@@ -118,23 +174,76 @@ async def list_tools():
             },
             {
                 "name": "search_tasks",
-                "description": "Search tasks by keyword",
-                "parameters": ["query"]
+                "description": "Search tasks by keyword (ranked, paginated)",
+                "parameters": ["query", "status", "limit", "page"]
             }
         ]
     }
 
 
+async def conversation_store_or_503():
+    """The conversation store, or 503 while history is disabled"""
+    try:
+        return await get_conversation_store()
+    except ConversationStoreUnavailable:
+        raise HTTPException(status_code=503, detail="Conversation history is unavailable")
+
+
+@app.get("/conversations", response_model=ConversationList)
+async def list_conversations(
+    user_id: str = Depends(get_current_user_id),
+    page: int = Query(1, ge=1),
+    limit: int = Query(20, ge=1, le=100)
+):
+    """List the caller's conversations, most recently updated first"""
+    store = await conversation_store_or_503()
+    return await store.list_conversations(user_id, page=page, limit=limit)
+
+
+@app.get("/conversations/{conversation_id}", response_model=ConversationResponse)
+async def get_conversation(
+    conversation_id: str,
+    user_id: str = Depends(get_current_user_id),
+    limit: int = Query(50, ge=1, le=200),
+    before: Optional[datetime] = Query(None, description="Only messages older than this (created_at of the oldest loaded message)")
+):
+    """Read one of the caller's conversations with its latest messages (page back with before=)"""
+    store = await conversation_store_or_503()
+    conversation = await store.get_conversation(conversation_id, user_id=user_id)
+    if conversation is None:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+
+    messages, has_more = await store.get_messages(conversation_id, limit=limit, before=before)
+    return ConversationResponse(
+        **conversation.model_dump(),
+        messages=[message.model_dump(mode="json") for message in messages],
+        has_more=has_more
+    )
+
+
 @app.websocket("/ws/chat")
 async def websocket_chat(websocket: WebSocket):
     """
     WebSocket endpoint for chat interface
     Handles bidirectional communication between client and MCP server
     """
-    # TODO: Get user_id from authentication
+    # With ?token= (a backend access token) history is kept under that user
+    # and readable through /conversations
+    # TODO: Require authentication
     user_id = "demo_user"  # Placeholder for demo
-
-    await manager.connect(websocket, user_id)
+    token = websocket.query_params.get("token")
+    if token:
+        try:
+            user_id = await authenticate(token)
+        except AuthenticationError:
+            await websocket.close(code=1008)  # policy violation
+            return
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not verify WebSocket token: {e}")
+            await websocket.close(code=1013)  # try again later
+            return
+
+    connection = await manager.connect(websocket, user_id)
 
     try:
         while True:
@@ -150,24 +259,54 @@ async def websocket_chat(websocket: WebSocket):
                 conversation_id = data.get("conversation_id")
 
                 # Send typing indicator
-                await manager.send_message(user_id, {
+                manager.send(connection, {
                     "type": "typing",
                     "is_typing": True
                 })
 
+                # Stream each tool result as soon as it finishes
+                async def send_tool_result(index: int, tool_result: Dict[str, Any]) -> None:
+                    manager.send(connection, {
+                        "type": "tool_result",
+                        "index": index,
+                        "tool": tool_result["tool"],
+                        "input": tool_result["input"],
+                        "result": tool_result["result"],
+                        "timestamp": datetime.utcnow().isoformat()
+                    })
+
+                # Stream the reply as it is generated (unless the client sends "stream": false);
+                # pieces the writer hasn't sent yet are merged into one frame
+                async def send_delta(event: Dict[str, Any]) -> None:
+                    if event["type"] == "text":
+                        manager.send_delta(connection, {"type": "delta", "content": event["text"]})
+                    else:
+                        manager.send_delta(connection, {
+                            "type": "delta",
+                            "tool_call": {
+                                "index": event["index"],
+                                "id": event["id"],
+                                "name": event["name"],
+                                "arguments": event["arguments"]
+                            }
+                        })
+
                 # Process with Claude AI (will implement)
                 response = await process_chat_message(
                     user_message=user_message,
                     user_id=user_id,
-                    conversation_id=conversation_id
+                    conversation_id=conversation_id,
+                    on_tool_result=send_tool_result,
+                    on_delta=send_delta if data.get("stream", True) else None
                 )
 
                 # Send response
-                await manager.send_message(user_id, {
+                manager.send(connection, {
                     "type": "message",
                     "role": "assistant",
                     "content": response["content"],
                     "tool_calls": response.get("tool_calls", []),
+                    "conversation_id": response.get("conversation_id"),
                     "timestamp": datetime.utcnow().isoformat()
                 })
 
@@ -178,7 +317,7 @@ async def websocket_chat(websocket: WebSocket):
 
                 result = await execute_tool(tool_name, tool_params, user_id)
 
-                await manager.send_message(user_id, {
+                manager.send(connection, {
                     "type": "tool_result",
                     "tool": tool_name,
                     "result": result,
@@ -186,80 +325,182 @@ async def websocket_chat(websocket: WebSocket):
                 })
 
     except WebSocketDisconnect:
-        manager.disconnect(user_id)
-        logger.info(f"User {user_id} disconnected")
+        pass
     except Exception as e:
         logger.error(f"Error in WebSocket connection: {e}")
-        manager.disconnect(user_id)
+    finally:
+        await manager.disconnect(connection)
 
 
 async def process_chat_message(
     user_message: str,
     user_id: str,
-    conversation_id: str = None
+    conversation_id: str = None,
+    on_tool_result: Optional[ResultCallback] = None,
+    on_delta: Optional[DeltaCallback] = None
 ) -> Dict[str, Any]:
     """
     Process chat message with Claude AI
     Returns assistant response with potential tool calls
-    """
-    try:
-        # Initialize Mock AI client (fallback due to API credit issues)
-        ai_client = MockAIClient()
 
-        # Prepare messages for AI
-        messages = [
-            {
-                "role": "user",
-                "content": user_message
-            }
-        ]
+    The recent history of the conversation, fitted to the model's token
+    budget (see utils/context.py), is sent along and the turn is saved
+    afterwards (see utils/conversation_store.py). With on_delta the reply
+    is streamed: on_delta is awaited with each text and tool call piece as
+    the model produces it (see utils/streaming.py). Tool calls run
+    concurrently (see utils/tool_scheduler.py); on_tool_result is awaited
+    with each result as soon as that call finishes.
 
-        # Get system prompt and tools
-        system_prompt = ai_client.get_system_prompt()
-        tools = ai_client.get_tool_definitions()
-
-        # Call Mock AI
-        logger.info(f"Calling Mock AI for user: {user_id}")
-        response = await ai_client.chat(
-            messages=messages,
-            system_prompt=system_prompt,
-            tools=tools,
-            max_tokens=2048
+    Plain commands ("show my pending tasks", "create a task to ...") are
+    recognised locally (see utils/intent_parser.py) and skip the model.
+    """
+    conversation = None
+    try:
+        intent = intent_parser.parse(user_message) if intent_fast_path_enabled() else None
+        if intent is not None:
+            return await process_intent(intent, user_message, user_id, conversation_id, on_tool_result)
+        CHAT_TURNS.labels(path="llm").inc()
+
+        client = get_ai_client()
+        max_tokens = 2048
+
+        # Tokens the model's context window leaves for history
+        max_history_tokens = os.getenv("HISTORY_MAX_TOKENS")
+        budget = client.context.history_budget(
+            user_message,
+            reply_tokens=max_tokens,
+            max_history_tokens=int(max_history_tokens) if max_history_tokens else None
         )
 
+        # Load the recent history (chat still works, without memory, if the store is down)
+        history: List[Message] = []
+        try:
+            store = await get_conversation_store()
+            conversation = await store.get_or_create_conversation(
+                user_id, conversation_id, title=user_message[:60]
+            )
+            history = await store.load_history(
+                conversation.id,
+                max_turns=int(os.getenv("HISTORY_MAX_TURNS", "10")),
+                max_tokens=budget
+            )
+        except Exception as e:
+            logger.warning(f"Could not load conversation history: {e}")
+
+        # Prepare messages for AI: newest history within budget, then the new message
+        messages = client.context.build(history, budget)
+        messages.append({
+            "role": "user",
+            "content": user_message
+        })
+
+        # Call the AI provider (system prompt and tools were prepared at startup)
+        logger.info(f"Calling {client.provider.value} AI for user: {user_id}")
+        if on_delta is None:
+            response = await client.chat(
+                messages=messages,
+                max_tokens=max_tokens
+            )
+        else:
+            response = {}
+            async for event in client.stream(messages=messages, max_tokens=max_tokens):
+                if event["type"] == "done":
+                    response = event["response"]
+                else:
+                    await on_delta(event)
+
         # Process tool calls if any
         executed_tools = []
         if response.get("tool_calls"):
-            logger.info(f"Mock AI requested {len(response['tool_calls'])} tool calls")
-
-            for tool_call in response["tool_calls"]:
-                tool_name = tool_call["name"]
-                tool_input = tool_call["input"]
-
-                logger.info(f"Executing tool: {tool_name} with input: {tool_input}")
-
-                # Execute the tool
-                tool_result = await execute_tool(tool_name, tool_input, user_id)
-                executed_tools.append({
-                    "tool": tool_name,
-                    "input": tool_input,
-                    "result": tool_result
-                })
+            logger.info(f"AI requested {len(response['tool_calls'])} tool calls")
+
+            executed_tools = await tool_scheduler.run(
+                response["tool_calls"],
+                user_id,
+                on_result=on_tool_result
+            )
+
+        content = response.get("content", "I'm here to help with your tasks!")
+
+        if conversation is not None:
+            try:
+                await store.append_messages(conversation.id, [
+                    MessageCreate(conversation_id=conversation.id, role="user", content=user_message),
+                    MessageCreate(
+                        conversation_id=conversation.id,
+                        role="assistant",
+                        content=content or "",
+                        tool_calls=response.get("tool_calls") or None,
+                        tool_results=executed_tools or None
+                    )
+                ])
+            except Exception as e:
+                logger.warning(f"Could not save conversation turn: {e}")
 
         return {
-            "content": response.get("content", "I'm here to help with your tasks!"),
+            "content": content,
             "tool_calls": executed_tools,
-            "stop_reason": response.get("stop_reason")
+            "stop_reason": response.get("stop_reason"),
+            "conversation_id": conversation.id if conversation else conversation_id
         }
 
     except Exception as e:
         logger.error(f"Error processing chat message: {e}")
         return {
             "content": f"I encountered an error: {str(e)}. Please try again.",
-            "tool_calls": []
+            "tool_calls": [],
+            "conversation_id": conversation.id if conversation else conversation_id
         }
 
 
+def intent_fast_path_enabled() -> bool:
+    return os.getenv("INTENT_FAST_PATH", "true").lower() == "true"
+
+
+async def process_intent(
+    intent: Intent,
+    user_message: str,
+    user_id: str,
+    conversation_id: str = None,
+    on_tool_result: Optional[ResultCallback] = None
+) -> Dict[str, Any]:
+    """Run a recognised command's tool call directly and reply with its result"""
+    CHAT_TURNS.labels(path="fast").inc()
+    logger.info(f"Intent fast path for user {user_id}: {intent.tool}")
+
+    tool_call = intent.tool_call()
+    executed_tools = await tool_scheduler.run([tool_call], user_id, on_result=on_tool_result)
+    result = executed_tools[0]["result"]
+    if result.get("success"):
+        content = result["data"].get("message", "Done.")
+    else:
+        content = f"Sorry, that didn't work: {result.get('error')}"
+
+    conversation = None
+    try:
+        store = await get_conversation_store()
+        conversation = await store.get_or_create_conversation(user_id, conversation_id, title=user_message[:60])
+        await store.append_messages(conversation.id, [
+            MessageCreate(conversation_id=conversation.id, role="user", content=user_message),
+            MessageCreate(
+                conversation_id=conversation.id,
+                role="assistant",
+                content=content,
+                tool_calls=[tool_call],
+                tool_results=executed_tools
+            )
+        ])
+    except Exception as e:
+        logger.warning(f"Could not save conversation turn: {e}")
+
+    return {
+        "content": content,
+        "tool_calls": executed_tools,
+        "stop_reason": "intent",
+        "conversation_id": conversation.id if conversation else conversation_id
+    }
+
+
 async def execute_tool(
     tool_name: str,
     parameters: Dict[str, Any],
@@ -275,7 +516,7 @@ async def execute_tool(
 
     try:
         handler = TOOLS[tool_name]
-        result = await handler(parameters, user_id)
+        result = await handler(parameters, user_id, await get_backend_client())
         return {
             "success": True,
             "data": result
@@ -288,6 +529,10 @@ async def execute_tool(
         }
 
 
+# Runs each turn's tool calls concurrently, bounded per user
+tool_scheduler = ToolScheduler(execute_tool, max_concurrent_per_user=max_concurrent_tools_per_user())
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -5,15 +5,16 @@ Handles task creation requests from the chatbot
 
 from typing import Dict, Any
 import httpx
-import os
 from datetime import datetime
 
-# Phase 2 backend URL
-BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
-BACKEND_AUTH_TOKEN = os.getenv("BACKEND_AUTH_TOKEN", "")
+from utils.backend_client import request_timeout
 
 
-async def create_task_handler(parameters: Dict[str, Any], user_id: str) -> Dict[str, Any]:
+async def create_task_handler(
+    parameters: Dict[str, Any],
+    user_id: str,
+    client: httpx.AsyncClient
+) -> Dict[str, Any]:
     """
     Create a new task via Phase 2 backend API
 
@@ -24,6 +25,7 @@ async def create_task_handler(parameters: Dict[str, Any], user_id: str) -> Dict[
             - priority (optional): Task priority (low, medium, high)
             - due_date (optional): Due date in ISO format
         user_id: ID of the user creating the task
+        client: Shared backend client (see utils/backend_client.py)
 
     Returns:
         Created task object
@@ -51,27 +53,22 @@ async def create_task_handler(parameters: Dict[str, Any], user_id: str) -> Dict[
         task_data["due_date"] = due_date
 
     # Call Phase 2 backend API
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                f"{BACKEND_URL}/api/tasks",
-                json=task_data,
-                headers={
-                    "Authorization": f"Bearer {BACKEND_AUTH_TOKEN}",
-                    "Content-Type": "application/json"
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
+    try:
+        response = await client.post(
+            "/api/tasks",
+            json=task_data,
+            timeout=request_timeout("write")
+        )
+        response.raise_for_status()
 
-            task = response.json()
+        task = response.json()
 
-            return {
-                "message": f"✅ Created task: {title}",
-                "task": task
-            }
+        return {
+            "message": f"✅ Created task: {title}",
+            "task": task
+        }
 
-        except httpx.HTTPStatusError as e:
-            raise Exception(f"Failed to create task: {e.response.text}")
-        except httpx.RequestError as e:
-            raise Exception(f"Error connecting to backend: {str(e)}")
+    except httpx.HTTPStatusError as e:
+        raise Exception(f"Failed to create task: {e.response.text}")
+    except httpx.RequestError as e:
+        raise Exception(f"Error connecting to backend: {str(e)}")
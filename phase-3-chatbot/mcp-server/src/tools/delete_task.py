@@ -5,12 +5,15 @@ Deletes a task by ID
 
 from typing import Dict, Any
 import httpx
-import os
 
-BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
+from utils.backend_client import request_timeout
 
 
-async def delete_task_handler(parameters: Dict[str, Any], user_id: str) -> Dict[str, Any]:
+async def delete_task_handler(
+    parameters: Dict[str, Any],
+    user_id: str,
+    client: httpx.AsyncClient
+) -> Dict[str, Any]:
     """
     Delete a task by ID
 
@@ -18,6 +21,7 @@ async def delete_task_handler(parameters: Dict[str, Any], user_id: str) -> Dict[
         parameters: Delete parameters
             - task_id (required): ID of task to delete
         user_id: ID of the user
+        client: Shared backend client (see utils/backend_client.py)
 
     Returns:
         Deletion confirmation
@@ -29,26 +33,18 @@ async def delete_task_handler(parameters: Dict[str, Any], user_id: str) -> Dict[
         raise ValueError("Task ID is required")
 
     # Call Phase 2 backend API
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.delete(
-                f"{BACKEND_URL}/api/tasks/{task_id}",
-                headers={
-                    # TODO: Add authentication token
-                    "Content-Type": "application/json"
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
-
-            return {
-                "message": f"🗑️ Task deleted successfully",
-                "task_id": task_id
-            }
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise Exception(f"Task with ID {task_id} not found")
-            raise Exception(f"Failed to delete task: {e.response.text}")
-        except httpx.RequestError as e:
-            raise Exception(f"Error connecting to backend: {str(e)}")
+    try:
+        response = await client.delete(f"/api/tasks/{task_id}", timeout=request_timeout("write"))
+        response.raise_for_status()
+
+        return {
+            "message": f"🗑️ Task deleted successfully",
+            "task_id": task_id
+        }
+
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            raise Exception(f"Task with ID {task_id} not found")
+        raise Exception(f"Failed to delete task: {e.response.text}")
+    except httpx.RequestError as e:
+        raise Exception(f"Error connecting to backend: {str(e)}")
@@ -5,13 +5,15 @@ Retrieves and filters tasks
 
 from typing import Dict, Any, Optional
 import httpx
-import os
 
-BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
-BACKEND_AUTH_TOKEN = os.getenv("BACKEND_AUTH_TOKEN", "")
+from utils.backend_client import request_timeout
 
 
-async def list_tasks_handler(parameters: Dict[str, Any], user_id: str) -> Dict[str, Any]:
+async def list_tasks_handler(
+    parameters: Dict[str, Any],
+    user_id: str,
+    client: httpx.AsyncClient
+) -> Dict[str, Any]:
     """
     List tasks with optional filters
 
@@ -21,6 +23,7 @@ async def list_tasks_handler(parameters: Dict[str, Any], user_id: str) -> Dict[s
             - priority (optional): Filter by priority (low, medium, high)
             - limit (optional): Maximum number of tasks to return
         user_id: ID of the user
+        client: Shared backend client (see utils/backend_client.py)
 
     Returns:
         List of tasks
@@ -41,50 +44,49 @@ async def list_tasks_handler(parameters: Dict[str, Any], user_id: str) -> Dict[s
         params["limit"] = limit
 
     # Call Phase 2 backend API
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"{BACKEND_URL}/api/tasks",
-                params=params,
-                headers={
-                    "Authorization": f"Bearer {BACKEND_AUTH_TOKEN}",
-                    "Content-Type": "application/json"
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
+    try:
+        response = await client.get(
+            "/api/tasks",
+            params=params,
+            timeout=request_timeout("query")
+        )
+        response.raise_for_status()
 
-            tasks = response.json()
+        # The backend returns one page ({"items", "total", ...})
+        result = response.json()
+        tasks = result["items"]
 
-            # Format response
-            if not tasks:
-                return {
-                    "message": "You have no tasks.",
-                    "tasks": []
-                }
+        # Format response
+        if not tasks:
+            return {
+                "message": "You have no tasks.",
+                "tasks": []
+            }
 
-            # Create summary
-            total = len(tasks)
-            pending_count = sum(1 for t in tasks if t.get("status") == "pending")
-            completed_count = sum(1 for t in tasks if t.get("status") == "completed")
+        # Create summary (pending / completed counts cover this page)
+        total = result["total"]
+        pending_count = sum(1 for t in tasks if t.get("status") == "pending")
+        completed_count = sum(1 for t in tasks if t.get("status") == "completed")
 
-            message = f"📋 You have {total} task(s)"
-            if status:
-                message += f" with status '{status}'"
-            if priority:
-                message += f" and priority '{priority}'"
+        message = f"📋 You have {total} task(s)"
+        if status:
+            message += f" with status '{status}'"
+        if priority:
+            message += f" and priority '{priority}'"
+        if total > len(tasks):
+            message += f" (showing {len(tasks)})"
 
-            return {
-                "message": message,
-                "tasks": tasks,
-                "summary": {
-                    "total": total,
-                    "pending": pending_count,
-                    "completed": completed_count
-                }
+        return {
+            "message": message,
+            "tasks": tasks,
+            "summary": {
+                "total": total,
+                "pending": pending_count,
+                "completed": completed_count
             }
+        }
 
-        except httpx.HTTPStatusError as e:
-            raise Exception(f"Failed to list tasks: {e.response.text}")
-        except httpx.RequestError as e:
-            raise Exception(f"Error connecting to backend: {str(e)}")
+    except httpx.HTTPStatusError as e:
+        raise Exception(f"Failed to list tasks: {e.response.text}")
+    except httpx.RequestError as e:
+        raise Exception(f"Error connecting to backend: {str(e)}")
@@ -1,72 +1,96 @@
 """
 Search Tasks Tool Handler
-Searches tasks by keyword
+Searches tasks by keyword (filtered, ranked and paginated by the backend)
 """
 
 from typing import Dict, Any
 import httpx
-import os
 
-BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
+from utils.backend_client import request_timeout
 
+# Matches per page (the backend allows up to 100)
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
 
-async def search_tasks_handler(parameters: Dict[str, Any], user_id: str) -> Dict[str, Any]:
+
+async def search_tasks_handler(
+    parameters: Dict[str, Any],
+    user_id: str,
+    client: httpx.AsyncClient
+) -> Dict[str, Any]:
     """
     Search tasks by keyword in title or description
 
+    Matches are ranked by the backend: title starts with the keyword,
+    then title contains it, then description contains it.
+
     Args:
         parameters: Search parameters
             - query (required): Search keyword
+            - status (optional): Filter by status (pending, in_progress, completed)
+            - limit (optional): Matches per page (default 10, max 50)
+            - page (optional): Page number (default 1)
         user_id: ID of the user
+        client: Shared backend client (see utils/backend_client.py)
 
     Returns:
-        List of matching tasks
+        Matching tasks for the page, with total and paging info
     """
 
     # Extract and validate parameters
-    query = parameters.get("query")
+    query = str(parameters.get("query") or "").strip()
     if not query:
         raise ValueError("Search query is required")
 
-    # Call Phase 2 backend API (using list with filter)
-    # Note: Phase 2 might not have search endpoint, so we filter client-side
-    async with httpx.AsyncClient() as client:
-        try:
-            # Get all user tasks
-            response = await client.get(
-                f"{BACKEND_URL}/api/tasks",
-                params={"user_id": user_id},
-                headers={
-                    # TODO: Add authentication token
-                    "Content-Type": "application/json"
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
-
-            all_tasks = response.json()
-
-            # Filter tasks by query (case-insensitive)
-            query_lower = query.lower()
-            matching_tasks = [
-                task for task in all_tasks
-                if query_lower in task.get("title", "").lower()
-                or query_lower in task.get("description", "").lower()
-            ]
-
-            if not matching_tasks:
-                return {
-                    "message": f"🔍 No tasks found matching '{query}'",
-                    "tasks": []
-                }
+    limit = min(max(int(parameters.get("limit") or DEFAULT_LIMIT), 1), MAX_LIMIT)
+    page = max(int(parameters.get("page") or 1), 1)
+
+    params = {
+        "search": query,
+        "sort_by": "relevance",
+        "page": page,
+        "limit": limit
+    }
+    if parameters.get("status"):
+        params["status"] = parameters["status"]
+
+    # Call Phase 2 backend API (search runs in the database)
+    try:
+        response = await client.get("/api/tasks", params=params, timeout=request_timeout("query"))
+        response.raise_for_status()
 
+        result = response.json()
+        tasks = result["items"]
+        total = result["total"]
+        total_pages = result["total_pages"]
+
+        if not tasks:
+            message = f"🔍 No tasks found matching '{query}'"
+            if total:
+                message += f" on page {page} (there are {total_pages} page(s))"
             return {
-                "message": f"🔍 Found {len(matching_tasks)} task(s) matching '{query}'",
-                "tasks": matching_tasks,
-                "query": query
+                "message": message,
+                "tasks": [],
+                "query": query,
+                "total": total,
+                "page": page,
+                "has_more": False
             }
 
-        except httpx.HTTPStatusError as e:
-            raise Exception(f"Failed to search tasks: {e.response.text}")
-        except httpx.RequestError as e:
-            raise Exception(f"Error connecting to backend: {str(e)}")
+        message = f"🔍 Found {total} task(s) matching '{query}'"
+        if total > len(tasks):
+            message += f" (showing {len(tasks)}, page {page} of {total_pages})"
+
+        return {
+            "message": message,
+            "tasks": tasks,
+            "query": query,
+            "total": total,
+            "page": page,
+            "has_more": page < total_pages
+        }
+
+    except httpx.HTTPStatusError as e:
+        raise Exception(f"Failed to search tasks: {e.response.text}")
+    except httpx.RequestError as e:
+        raise Exception(f"Error connecting to backend: {str(e)}")
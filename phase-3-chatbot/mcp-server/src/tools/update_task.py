@@ -5,12 +5,15 @@ Updates existing task properties
 
 from typing import Dict, Any
 import httpx
-import os
 
-BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
+from utils.backend_client import request_timeout
 
 
-async def update_task_handler(parameters: Dict[str, Any], user_id: str) -> Dict[str, Any]:
+async def update_task_handler(
+    parameters: Dict[str, Any],
+    user_id: str,
+    client: httpx.AsyncClient
+) -> Dict[str, Any]:
     """
     Update an existing task
 
@@ -22,6 +25,7 @@ async def update_task_handler(parameters: Dict[str, Any], user_id: str) -> Dict[
             - priority (optional): New priority
             - status (optional): New status
         user_id: ID of the user
+        client: Shared backend client (see utils/backend_client.py)
 
     Returns:
         Updated task object
@@ -49,40 +53,35 @@ async def update_task_handler(parameters: Dict[str, Any], user_id: str) -> Dict[
         raise ValueError("No update fields provided")
 
     # Call Phase 2 backend API
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.put(
-                f"{BACKEND_URL}/api/tasks/{task_id}",
-                json=update_data,
-                headers={
-                    # TODO: Add authentication token
-                    "Content-Type": "application/json"
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
+    try:
+        response = await client.put(
+            f"/api/tasks/{task_id}",
+            json=update_data,
+            timeout=request_timeout("write")
+        )
+        response.raise_for_status()
 
-            task = response.json()
+        task = response.json()
 
-            # Create descriptive message
-            updates = []
-            if "title" in update_data:
-                updates.append(f"title to '{update_data['title']}'")
-            if "status" in update_data:
-                updates.append(f"status to '{update_data['status']}'")
-            if "priority" in update_data:
-                updates.append(f"priority to '{update_data['priority']}'")
+        # Create descriptive message
+        updates = []
+        if "title" in update_data:
+            updates.append(f"title to '{update_data['title']}'")
+        if "status" in update_data:
+            updates.append(f"status to '{update_data['status']}'")
+        if "priority" in update_data:
+            updates.append(f"priority to '{update_data['priority']}'")
 
-            update_msg = ", ".join(updates) if updates else "task"
+        update_msg = ", ".join(updates) if updates else "task"
 
-            return {
-                "message": f"✅ Updated {update_msg}",
-                "task": task
-            }
+        return {
+            "message": f"✅ Updated {update_msg}",
+            "task": task
+        }
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise Exception(f"Task with ID {task_id} not found")
-            raise Exception(f"Failed to update task: {e.response.text}")
-        except httpx.RequestError as e:
-            raise Exception(f"Error connecting to backend: {str(e)}")
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            raise Exception(f"Task with ID {task_id} not found")
+        raise Exception(f"Failed to update task: {e.response.text}")
+    except httpx.RequestError as e:
+        raise Exception(f"Error connecting to backend: {str(e)}")
@@ -3,11 +3,18 @@ Unified AI Provider
 Supports multiple AI backends: Groq (FREE), Claude, OpenAI, Mock
 """
 
+import json
 import os
-from typing import List, Dict, Any, Optional
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 import logging
 from enum import Enum
 
+from utils.context import ContextBuilder, ModelInfo, estimate_tokens
+from utils.metrics import LLM_TIME_TO_FIRST_TOKEN, observe_llm
+from utils.streaming import done_event
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,6 +27,15 @@ class AIProvider(Enum):
     MOCK = "mock"           # Fallback - No API needed
 
 
+@dataclass(frozen=True)
+class PreparedPrompt:
+    """System prompt and tool schemas, built once per client"""
+    system_prompt: str
+    tools: Tuple[Dict, ...]           # Tool definitions (Claude-style input_schema)
+    provider_tools: Tuple[Dict, ...]  # The same tools in the provider's request format
+    prompt_tokens: int                # Approximate tokens of the system prompt and tools
+
+
 class UnifiedAIClient:
     """
     Unified AI Client that supports multiple providers
@@ -29,6 +45,11 @@ class UnifiedAIClient:
     2. Claude (if ANTHROPIC_API_KEY is set)
     3. OpenAI (if OPENAI_API_KEY is set)
     4. Mock (fallback)
+
+    Meant to be created once (at server startup) and shared: the system
+    prompt and provider-formatted tool schemas are prepared in __init__
+    and reused by every chat call. `context` fits conversation history
+    into the model's context window (see utils/context.py).
     """
 
     def __init__(self, provider: Optional[str] = None):
@@ -41,8 +62,26 @@ class UnifiedAIClient:
         """
         self.provider = self._detect_provider(provider)
         self.client = self._initialize_client()
+        self.prepared = self._prepare()
+        self.model_info: ModelInfo = getattr(self.client, "model_info", None) or ModelInfo(
+            getattr(self.client, "model", self.provider.value)
+        )
+        self.context = ContextBuilder(self.model_info, prompt_tokens=self.prepared.prompt_tokens)
         logger.info(f"Initialized AI provider: {self.provider.value}")
 
+    def _prepare(self) -> PreparedPrompt:
+        """Build the system prompt and convert tool schemas for the provider"""
+        tools = tuple(self.client.get_tool_definitions())
+        format_tools = getattr(self.client, "format_tools", None)
+        provider_tools = tuple(format_tools(list(tools))) if format_tools else tools
+        system_prompt = self.client.get_system_prompt()
+        return PreparedPrompt(
+            system_prompt=system_prompt,
+            tools=tools,
+            provider_tools=provider_tools,
+            prompt_tokens=estimate_tokens(system_prompt) + estimate_tokens(json.dumps(provider_tools))
+        )
+
     def _detect_provider(self, provider: Optional[str]) -> AIProvider:
         """Detect which provider to use based on env vars or preference"""
 
@@ -118,27 +157,99 @@ class UnifiedAIClient:
 
         Args:
             messages: List of message dicts with 'role' and 'content'
-            system_prompt: Optional system prompt
-            tools: Optional list of tool definitions
+            system_prompt: Optional system prompt (default: the prepared prompt)
+            tools: Optional list of tool definitions (default: the prepared tools)
             max_tokens: Maximum tokens in response
 
         Returns:
             Dict with response content and potential tool calls
         """
-        return await self.client.chat(
-            messages=messages,
-            system_prompt=system_prompt,
-            tools=tools,
-            max_tokens=max_tokens
-        )
+        tools, formatted_tools = self._tools(tools)
+
+        with observe_llm(self.provider.value):
+            return await self.client.chat(
+                messages=messages,
+                system_prompt=system_prompt or self.prepared.system_prompt,
+                tools=tools,
+                max_tokens=max_tokens,
+                formatted_tools=formatted_tools
+            )
+
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict]] = None,
+        max_tokens: int = 2048
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Send chat message and yield the reply as it is generated
+
+        Yields text and tool call pieces, then {"type": "done", "response": ...}
+        with the dict chat() would return (see utils/streaming.py). Providers
+        without streaming yield only the done event.
+        """
+        client_stream = getattr(self.client, "stream", None)
+        if client_stream is None:
+            yield done_event(await self.chat(messages, system_prompt, tools, max_tokens))
+            return
+
+        tools, formatted_tools = self._tools(tools)
+        started = time.perf_counter()
+        first_piece = True
+
+        with observe_llm(self.provider.value):
+            async for event in client_stream(
+                messages=messages,
+                system_prompt=system_prompt or self.prepared.system_prompt,
+                tools=tools,
+                max_tokens=max_tokens,
+                formatted_tools=formatted_tools
+            ):
+                if first_piece and event["type"] != "done":
+                    LLM_TIME_TO_FIRST_TOKEN.labels(self.provider.value).observe(time.perf_counter() - started)
+                    first_piece = False
+                yield event
+
+    def _tools(self, tools: Optional[List[Dict]]) -> Tuple[List[Dict], Optional[List[Dict]]]:
+        """Tool definitions and their provider format (default: the prepared tools)"""
+        if tools is None:
+            # Prepared tools are already in the provider's format
+            return list(self.prepared.tools), list(self.prepared.provider_tools)
+        return tools, None
+
+    async def warm_up(self) -> bool:
+        """
+        Send a minimal request so the first user message doesn't pay for
+        connection setup (DNS, TLS) and key validation. Returns success.
+        """
+        started = time.perf_counter()
+        try:
+            await self.chat(
+                messages=[{"role": "user", "content": "ping"}],
+                tools=[],
+                max_tokens=1
+            )
+        except Exception as e:
+            logger.warning(f"AI provider warm-up failed ({self.provider.value}): {e}")
+            return False
+
+        logger.info(f"AI provider warmed up in {(time.perf_counter() - started) * 1000:.0f}ms")
+        return True
+
+    async def close(self) -> None:
+        """Close the provider's HTTP connections"""
+        aclose = getattr(self.client, "aclose", None)
+        if aclose is not None:
+            await aclose()
 
     def get_system_prompt(self) -> str:
-        """Get system prompt from the client"""
-        return self.client.get_system_prompt()
+        """Get the prepared system prompt"""
+        return self.prepared.system_prompt
 
     def get_tool_definitions(self) -> List[Dict]:
-        """Get tool definitions from the client"""
-        return self.client.get_tool_definitions()
+        """Get the prepared tool definitions"""
+        return list(self.prepared.tools)
 
     def get_provider_info(self) -> Dict[str, Any]:
         """Get information about the current provider"""
@@ -168,6 +279,7 @@ class UnifiedAIClient:
             info["description"] = "Mock AI - Limited pattern matching (no API needed)"
             info["get_key_url"] = "https://console.groq.com"
 
+        info["context_window"] = self.model_info.context_window
         return info
 
 
@@ -0,0 +1,77 @@
+"""
+Caller Authentication
+Resolves the user behind a request through the Phase 2 backend
+
+The MCP server keeps no users of its own. A bearer token (a backend JWT
+access token or a personal access token with the read scope) is checked
+by calling the backend's GET /api/auth/me with it; the returned user id
+scopes the caller's conversations. Client-supplied user ids are never
+trusted.
+"""
+
+import logging
+from typing import Optional
+
+import httpx
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from utils.backend_client import get_backend_client
+
+logger = logging.getLogger(__name__)
+
+# Token is optional here so a missing one gets the same 401 as a bad one
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+class AuthenticationError(Exception):
+    """The token was rejected by the backend"""
+
+
+async def authenticate(token: str) -> str:
+    """
+    Verify a bearer token with the backend
+
+    Returns:
+        The id of the user the token belongs to
+
+    Raises:
+        AuthenticationError: If the backend rejects the token
+        httpx.HTTPError: If the backend can't be reached or fails
+    """
+    client = await get_backend_client()
+    response = await client.get("/api/auth/me", headers={"Authorization": f"Bearer {token}"})
+    if response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN):
+        raise AuthenticationError(response.text)
+    response.raise_for_status()
+    return str(response.json()["id"])
+
+
+async def get_current_user_id(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
+) -> str:
+    """
+    Dependency: id of the authenticated caller
+
+    Raises:
+        HTTPException 401: Missing or invalid token
+        HTTPException 503: Backend unavailable
+    """
+    unauthorized = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"}
+    )
+    if credentials is None:
+        raise unauthorized
+
+    try:
+        return await authenticate(credentials.credentials)
+    except AuthenticationError:
+        raise unauthorized
+    except httpx.HTTPError as e:
+        logger.warning(f"Could not verify token with the backend: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication is temporarily unavailable"
+        )
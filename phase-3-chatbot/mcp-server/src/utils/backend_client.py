@@ -0,0 +1,91 @@
+"""
+Shared Phase 2 Backend Client
+One keep-alive httpx client for all tool handlers, opened in the server lifespan
+
+Reusing pooled connections saves a TCP (and TLS) handshake per tool call.
+Configured from the environment:
+- BACKEND_URL, BACKEND_AUTH_TOKEN: backend base URL and credentials
+- BACKEND_TIMEOUT / BACKEND_CONNECT_TIMEOUT: default timeouts in seconds
+- BACKEND_WRITE_TIMEOUT / BACKEND_QUERY_TIMEOUT: per-request timeouts the
+  tool handlers pass (see request_timeout): short for single-task
+  create / update / delete, longer for list and search
+- BACKEND_MAX_CONNECTIONS / BACKEND_MAX_KEEPALIVE: pool limits
+- BACKEND_HTTP2: use HTTP/2 (requires the `h2` package, i.e. httpx[http2])
+"""
+
+import importlib.util
+import logging
+import os
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Shared client (see start_backend_client)
+_client: Optional[httpx.AsyncClient] = None
+
+# Request kind -> (environment variable, default seconds)
+REQUEST_TIMEOUTS = {
+    "write": ("BACKEND_WRITE_TIMEOUT", "5"),
+    "query": ("BACKEND_QUERY_TIMEOUT", "15"),
+}
+
+
+def create_backend_client() -> httpx.AsyncClient:
+    """Build a pooled client for the Phase 2 backend from the environment"""
+    http2 = os.getenv("BACKEND_HTTP2", "false").lower() == "true"
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning("BACKEND_HTTP2 is set but h2 is not installed; using HTTP/1.1")
+        http2 = False
+
+    headers = {"Content-Type": "application/json"}
+    token = os.getenv("BACKEND_AUTH_TOKEN", "")
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+
+    return httpx.AsyncClient(
+        base_url=os.getenv("BACKEND_URL", "http://localhost:8000"),
+        headers=headers,
+        http2=http2,
+        timeout=httpx.Timeout(
+            float(os.getenv("BACKEND_TIMEOUT", "10")),
+            connect=float(os.getenv("BACKEND_CONNECT_TIMEOUT", "5"))
+        ),
+        limits=httpx.Limits(
+            max_connections=int(os.getenv("BACKEND_MAX_CONNECTIONS", "50")),
+            max_keepalive_connections=int(os.getenv("BACKEND_MAX_KEEPALIVE", "20")),
+            keepalive_expiry=60.0
+        )
+    )
+
+
+def request_timeout(kind: str) -> httpx.Timeout:
+    """Timeout for one backend request of this kind ("write" or "query")"""
+    name, default = REQUEST_TIMEOUTS[kind]
+    return httpx.Timeout(
+        float(os.getenv(name, default)),
+        connect=float(os.getenv("BACKEND_CONNECT_TIMEOUT", "5"))
+    )
+
+
+async def start_backend_client() -> None:
+    """Open the shared backend client. Called on server startup."""
+    global _client
+    if _client is None:
+        _client = create_backend_client()
+
+
+async def close_backend_client() -> None:
+    """Close the shared backend client. Called on server shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def get_backend_client() -> httpx.AsyncClient:
+    """Get the shared backend client (opened lazily outside the server lifespan)"""
+    if _client is None:
+        await start_backend_client()
+    return _client
@@ -1,25 +1,34 @@
 """
 Claude AI Client
 Handles communication with Anthropic's Claude API
+
+Uses the SDK's async client: requests never block the event loop, the
+client's connection pool is reused across calls (create one ClaudeClient
+and share it), and cancelling the awaiting task aborts the request.
+ANTHROPIC_TIMEOUT and ANTHROPIC_MAX_RETRIES bound each call.
 """
 
 import os
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 import anthropic
 import logging
 
+from utils.context import ModelInfo
+from utils.streaming import ToolCallBuffer, done_event, text_event, tool_call_event
+
 logger = logging.getLogger(__name__)
 
 
 class ClaudeClient:
     """Client for interacting with Claude AI API"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
         """
         Initialize Claude client
 
         Args:
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
+            base_url: API base URL (defaults to ANTHROPIC_BASE_URL env var, then the public API)
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
@@ -28,15 +37,23 @@ class ClaudeClient:
                 "Set ANTHROPIC_API_KEY environment variable or pass api_key parameter."
             )
 
-        self.client = anthropic.Anthropic(api_key=self.api_key)
-        self.model = "claude-3-5-sonnet-20241022"  # Latest Claude model
+        self.client = anthropic.AsyncAnthropic(
+            api_key=self.api_key,
+            base_url=base_url or os.getenv("ANTHROPIC_BASE_URL") or None,
+            # Seconds per request (each retry gets the full timeout)
+            timeout=float(os.getenv("ANTHROPIC_TIMEOUT", "60")),
+            max_retries=int(os.getenv("ANTHROPIC_MAX_RETRIES", "2"))
+        )
+        self.model_info = ModelInfo("claude-3-5-sonnet-20241022", context_window=200000)  # Latest Claude model
+        self.model = self.model_info.name
 
     async def chat(
         self,
         messages: List[Dict[str, str]],
         system_prompt: Optional[str] = None,
         tools: Optional[List[Dict]] = None,
-        max_tokens: int = 1024
+        max_tokens: int = 1024,
+        formatted_tools: Optional[List[Dict]] = None
     ) -> Dict[str, Any]:
         """
         Send chat message to Claude and get response
@@ -46,27 +63,17 @@ class ClaudeClient:
             system_prompt: Optional system prompt
             tools: Optional list of tool definitions
             max_tokens: Maximum tokens in response
+            formatted_tools: Tools from format_tools (used instead of tools)
 
         Returns:
             Dict with response content and potential tool calls
         """
 
         try:
-            # Build request parameters
-            request_params = {
-                "model": self.model,
-                "max_tokens": max_tokens,
-                "messages": messages
-            }
-
-            if system_prompt:
-                request_params["system"] = system_prompt
-
-            if tools:
-                request_params["tools"] = tools
+            request_params = self._request_params(messages, system_prompt, tools, max_tokens, formatted_tools)
 
             # Call Claude API
-            response = self.client.messages.create(**request_params)
+            response = await self.client.messages.create(**request_params)
 
             # Parse response
             result = {
@@ -90,10 +97,102 @@ class ClaudeClient:
 
             return result
 
+        except anthropic.APITimeoutError:
+            logger.error("Claude API timeout")
+            raise Exception("Claude API request timed out")
+        except anthropic.APIError as e:
+            logger.error(f"Claude API error: {e}")
+            raise Exception(f"Failed to get response from Claude: {str(e)}")
+
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict]] = None,
+        max_tokens: int = 1024,
+        formatted_tools: Optional[List[Dict]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Like chat, but yields the reply as it is generated (Messages event stream)
+
+        Yields text and tool call pieces, then the full response
+        (see utils/streaming.py for the event shapes).
+        """
+        request_params = self._request_params(messages, system_prompt, tools, max_tokens, formatted_tools)
+
+        content = ""
+        tool_calls = ToolCallBuffer()
+        # Content block index -> tool call index (text blocks are interleaved)
+        tool_blocks: Dict[int, int] = {}
+        stop_reason = None
+
+        try:
+            events = await self.client.messages.create(**request_params, stream=True)
+            async for event in events:
+                if event.type == "content_block_start" and event.content_block.type == "tool_use":
+                    index = tool_blocks[event.index] = len(tool_blocks)
+                    block = event.content_block
+                    tool_calls.add(index, id=block.id, name=block.name)
+                    yield tool_call_event(index, id=block.id, name=block.name)
+
+                elif event.type == "content_block_delta":
+                    if event.delta.type == "text_delta":
+                        content += event.delta.text
+                        yield text_event(event.delta.text)
+                    elif event.delta.type == "input_json_delta" and event.index in tool_blocks:
+                        index = tool_blocks[event.index]
+                        tool_calls.add(index, arguments=event.delta.partial_json)
+                        yield tool_call_event(index, arguments=event.delta.partial_json)
+
+                elif event.type == "message_delta" and event.delta.stop_reason:
+                    stop_reason = event.delta.stop_reason
+
+        except anthropic.APITimeoutError:
+            logger.error("Claude API timeout")
+            raise Exception("Claude API request timed out")
         except anthropic.APIError as e:
             logger.error(f"Claude API error: {e}")
             raise Exception(f"Failed to get response from Claude: {str(e)}")
 
+        logger.info(f"Claude streamed response: {content[:100]}...")
+        yield done_event({
+            "content": content,
+            "tool_calls": tool_calls.tool_calls(),
+            "stop_reason": stop_reason
+        })
+
+    def _request_params(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str],
+        tools: Optional[List[Dict]],
+        max_tokens: int,
+        formatted_tools: Optional[List[Dict]]
+    ) -> Dict[str, Any]:
+        """Messages API parameters (shared by chat and stream)"""
+        request_params = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": messages
+        }
+
+        if system_prompt:
+            request_params["system"] = system_prompt
+
+        if formatted_tools is None:
+            formatted_tools = tools
+        if formatted_tools:
+            request_params["tools"] = formatted_tools
+        return request_params
+
+    async def aclose(self) -> None:
+        """Close the HTTP client"""
+        await self.client.close()
+
+    def format_tools(self, tools: List[Dict]) -> List[Dict]:
+        """Tool definitions are already in Claude's format"""
+        return tools
+
     def get_system_prompt(self) -> str:
         """
         Get system prompt for task management chatbot
@@ -234,13 +333,26 @@ Always use these tools to perform actions on tasks instead of just describing wh
             },
             {
                 "name": "search_tasks",
-                "description": "Search tasks by keyword in title or description",
+                "description": "Search tasks by keyword in title or description (best matches first, paginated)",
                 "input_schema": {
                     "type": "object",
                     "properties": {
                         "query": {
                             "type": "string",
                             "description": "Search query keyword"
+                        },
+                        "status": {
+                            "type": "string",
+                            "enum": ["pending", "in_progress", "completed"],
+                            "description": "Only return tasks with this status"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Maximum matches to return (default 10, max 50)"
+                        },
+                        "page": {
+                            "type": "integer",
+                            "description": "Page of results to return when there are more matches (default 1)"
                         }
                     },
                     "required": ["query"]
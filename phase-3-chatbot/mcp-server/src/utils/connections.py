@@ -0,0 +1,220 @@
+"""
+WebSocket Connection Manager
+Registry of open sockets, keyed by connection id and grouped by user
+
+Each socket gets a bounded outbound queue drained by its own writer task,
+so handlers never wait on a slow client. When a client falls behind
+(queue full, or one send takes longer than the send timeout) the slow
+consumer policy applies:
+- "disconnect": close the socket (code 1013, try again later); the client
+  reconnects and reloads the conversation
+- "drop": discard the message and keep the socket
+
+Streamed reply pieces (send_delta) are merged into the delta frame still
+waiting in the queue, so a burst of tokens from one network read takes a
+single queue slot instead of filling the queue.
+"""
+
+import asyncio
+import logging
+import os
+import uuid
+from typing import Any, Dict, List, Optional, Set
+
+from fastapi import WebSocket
+
+from utils.metrics import WEBSOCKET_MESSAGES_DROPPED, WEBSOCKET_SLOW_DISCONNECTS
+
+logger = logging.getLogger(__name__)
+
+# WebSocket close code: server overloaded / try again later
+TRY_AGAIN_LATER = 1013
+
+
+class Connection:
+    """One open WebSocket with its outbound queue and writer task"""
+
+    __slots__ = ("id", "user_id", "websocket", "queue", "writer", "closed", "pending_delta")
+
+    def __init__(self, websocket: WebSocket, user_id: str, queue_size: int):
+        self.id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.writer: Optional[asyncio.Task] = None
+        self.closed = False
+        # Last queued delta frame, until the writer takes it (see send_delta)
+        self.pending_delta: Optional[Dict[str, Any]] = None
+
+
+class ConnectionManager:
+    """
+    Manages WebSocket connections
+
+    Usage:
+        connection = await manager.connect(websocket, user_id)
+        manager.send(connection, {"type": "typing", "is_typing": True})
+        manager.send_delta(connection, {"type": "delta", "content": "Hel"})
+        manager.send_to_user(user_id, {...})   # every socket of the user
+        await manager.disconnect(connection)
+    """
+
+    def __init__(self, queue_size: int = 64, send_timeout: float = 10.0, slow_consumer_policy: str = "disconnect"):
+        if slow_consumer_policy not in ("disconnect", "drop"):
+            raise ValueError(f"Unknown slow consumer policy: {slow_consumer_policy}")
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        self.slow_consumer_policy = slow_consumer_policy
+        self.connections: Dict[str, Connection] = {}
+        self.user_connections: Dict[str, Set[str]] = {}
+        # Close tasks for slow clients (referenced until done)
+        self._closing: Set[asyncio.Task] = set()
+
+    async def connect(self, websocket: WebSocket, user_id: str) -> Connection:
+        """Accept the socket, register it and start its writer"""
+        await websocket.accept()
+        connection = Connection(websocket, user_id, self.queue_size)
+        self.connections[connection.id] = connection
+        self.user_connections.setdefault(user_id, set()).add(connection.id)
+        connection.writer = asyncio.create_task(self._write(connection), name=f"ws-writer-{connection.id}")
+        logger.info(f"User {user_id} connected ({connection.id}, {len(self.connections)} open)")
+        return connection
+
+    async def disconnect(self, connection: Connection) -> None:
+        """Unregister the socket and stop its writer"""
+        self._unregister(connection)
+        if connection.writer is not None and connection.writer is not asyncio.current_task():
+            connection.writer.cancel()
+            try:
+                await connection.writer
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    def _unregister(self, connection: Connection) -> None:
+        if connection.closed:
+            return
+        connection.closed = True
+        self.connections.pop(connection.id, None)
+        user_sockets = self.user_connections.get(connection.user_id)
+        if user_sockets is not None:
+            user_sockets.discard(connection.id)
+            if not user_sockets:
+                del self.user_connections[connection.user_id]
+        logger.info(f"User {connection.user_id} disconnected ({connection.id})")
+
+    def send(self, connection: Connection, message: Dict[str, Any]) -> bool:
+        """
+        Queue a message for one socket without waiting
+
+        Returns:
+            False if the socket is closed or the message was dropped
+        """
+        if connection.closed:
+            return False
+        try:
+            connection.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self._slow_consumer(connection, "send queue full")
+            return False
+        # Later deltas must not jump ahead of this message
+        connection.pending_delta = None
+        return True
+
+    def send_delta(self, connection: Connection, message: Dict[str, Any]) -> bool:
+        """
+        Queue a streamed reply piece ({"type": "delta", "content"} or
+        {"type": "delta", "tool_call"}), merged into the previous delta
+        frame if the writer hasn't taken it yet
+
+        Returns:
+            False if the socket is closed or the message was dropped
+        """
+        if connection.closed:
+            return False
+        if connection.pending_delta is not None and _merge_delta(connection.pending_delta, message):
+            return True
+        message = {**message, "tool_call": dict(message["tool_call"])} if "tool_call" in message else dict(message)
+        if not self.send(connection, message):
+            return False
+        connection.pending_delta = message
+        return True
+
+    def send_to_user(self, user_id: str, message: Dict[str, Any]) -> int:
+        """Queue a message for every socket of a user. Returns how many accepted it."""
+        return sum(
+            self.send(self.connections[connection_id], message)
+            for connection_id in list(self.user_connections.get(user_id, ()))
+        )
+
+    def get_user_connections(self, user_id: str) -> List[Connection]:
+        """Open connections of a user"""
+        return [self.connections[connection_id] for connection_id in self.user_connections.get(user_id, ())]
+
+    def _slow_consumer(self, connection: Connection, reason: str) -> None:
+        if self.slow_consumer_policy == "drop":
+            WEBSOCKET_MESSAGES_DROPPED.inc()
+            logger.warning(f"Dropped message for slow client {connection.id}: {reason}")
+            return
+
+        WEBSOCKET_SLOW_DISCONNECTS.inc()
+        logger.warning(f"Disconnecting slow client {connection.id}: {reason}")
+        self._unregister(connection)
+        task = asyncio.create_task(self._close(connection))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _close(self, connection: Connection) -> None:
+        # Stop the writer first so it doesn't race the close frame
+        if connection.writer is not None and connection.writer is not asyncio.current_task():
+            connection.writer.cancel()
+        try:
+            await asyncio.wait_for(
+                connection.websocket.close(code=TRY_AGAIN_LATER),
+                timeout=self.send_timeout
+            )
+        except Exception:
+            pass
+
+    async def _write(self, connection: Connection) -> None:
+        """Writer task: drain the queue to the socket, one message at a time"""
+        while True:
+            message = await connection.queue.get()
+            if message is connection.pending_delta:
+                connection.pending_delta = None
+            try:
+                await asyncio.wait_for(connection.websocket.send_json(message), timeout=self.send_timeout)
+            except asyncio.TimeoutError:
+                self._slow_consumer(connection, f"send took over {self.send_timeout:g}s")
+                if connection.closed:
+                    return
+            except Exception as e:
+                # Socket already gone; the receive loop will see the disconnect
+                logger.info(f"Send to {connection.id} failed: {e}")
+                self._unregister(connection)
+                return
+
+
+def _merge_delta(pending: Dict[str, Any], message: Dict[str, Any]) -> bool:
+    """Append message to the queued delta frame if it continues it"""
+    if "content" in message and "content" in pending:
+        pending["content"] += message["content"]
+        return True
+
+    tool_call, pending_call = message.get("tool_call"), pending.get("tool_call")
+    if (
+        tool_call is not None and pending_call is not None
+        and tool_call["index"] == pending_call["index"]
+        and not tool_call.get("id") and not tool_call.get("name")
+    ):
+        pending_call["arguments"] += tool_call.get("arguments") or ""
+        return True
+    return False
+
+
+def create_connection_manager() -> ConnectionManager:
+    """Connection manager configured from the environment"""
+    return ConnectionManager(
+        queue_size=int(os.getenv("WS_SEND_QUEUE_SIZE", "64")),
+        send_timeout=float(os.getenv("WS_SEND_TIMEOUT", "10")),
+        slow_consumer_policy=os.getenv("WS_SLOW_CONSUMER_POLICY", "disconnect")
+    )
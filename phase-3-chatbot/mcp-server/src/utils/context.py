@@ -0,0 +1,161 @@
+"""
+Context Assembly
+Fits conversation history into the model's context window
+
+- Token counts are approximate (~4 characters per token). Each message
+  stores its count when saved, so assembling a context needs no counting
+- The history budget is what the model's context window leaves after the
+  system prompt, tool schemas, the new user message and the reply
+- History is added newest to oldest until the budget is spent; the
+  window always starts at a user message
+- Tool results are sent in full for the latest turn only; older ones
+  collapse into one-line summaries (result message and task ids)
+"""
+
+import json
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from models.message import Message
+
+# Used for providers that don't declare their model's window
+DEFAULT_CONTEXT_WINDOW = 8192
+
+# Share of the budget kept free because token counts are estimates
+SAFETY_MARGIN = 0.1
+
+# Full tool results longer than this are summarized even in the latest turn
+MAX_FULL_RESULT_CHARS = 6000
+
+# Tasks listed by id in a tool result summary
+SUMMARY_TASKS = 5
+
+
+@dataclass(frozen=True)
+class ModelInfo:
+    """A model and its context window in tokens (prompt and reply together)"""
+    name: str
+    context_window: int = DEFAULT_CONTEXT_WINDOW
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count (~4 characters per token, plus per-message overhead)"""
+    return math.ceil(len(text or "") / 4) + 4
+
+
+def _compact_json(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def summarize_tool_result(tool_result: Dict[str, Any]) -> str:
+    """One line for an executed tool call: call, outcome and the tasks it touched"""
+    call = f"{tool_result.get('tool')}({_compact_json(tool_result.get('input') or {})})"
+    result = tool_result.get("result") or {}
+    if not result.get("success"):
+        return f"{call} failed: {result.get('error')}"
+
+    data = result.get("data") or {}
+    line = f"{call} -> {data.get('message') or 'done'}"
+
+    tasks = data.get("tasks")
+    if tasks is None and isinstance(data.get("task"), dict):
+        tasks = [data["task"]]
+    if tasks:
+        refs = ", ".join(f"{task.get('id')} \"{task.get('title')}\"" for task in tasks[:SUMMARY_TASKS])
+        if len(tasks) > SUMMARY_TASKS:
+            refs += f", +{len(tasks) - SUMMARY_TASKS} more"
+        line += f" [tasks: {refs}]"
+    return line
+
+
+def render_content(
+    content: str,
+    tool_results: Optional[List[Dict[str, Any]]] = None,
+    full_tool_results: bool = False
+) -> str:
+    """Message text as sent to the model, with its tool results appended"""
+    if not tool_results:
+        return content or ""
+
+    lines = []
+    for tool_result in tool_results:
+        line = None
+        if full_tool_results:
+            line = f"{tool_result.get('tool')}({_compact_json(tool_result.get('input') or {})}) -> "
+            line += _compact_json(tool_result.get("result"))
+            if len(line) > MAX_FULL_RESULT_CHARS:
+                line = None
+        lines.append("- " + (line or summarize_tool_result(tool_result)))
+
+    tool_text = "[tool results]\n" + "\n".join(lines)
+    return f"{content}\n\n{tool_text}" if content else tool_text
+
+
+def message_tokens(content: str, tool_results: Optional[List[Dict[str, Any]]] = None) -> int:
+    """Tokens of a message in its compact form (stored with the message)"""
+    return estimate_tokens(render_content(content, tool_results))
+
+
+class ContextBuilder:
+    """
+    Assembles chat history within a model's token budget
+
+    Usage:
+        builder = ContextBuilder(ModelInfo("llama-3.3-70b-versatile", 131072), prompt_tokens=900)
+        budget = builder.history_budget(user_message, reply_tokens=2048)
+        messages = builder.build(history, budget) + [{"role": "user", "content": user_message}]
+    """
+
+    def __init__(self, model: ModelInfo, prompt_tokens: int = 0):
+        self.model = model
+        self.prompt_tokens = prompt_tokens
+
+    def history_budget(
+        self,
+        user_message: str,
+        reply_tokens: int,
+        max_history_tokens: Optional[int] = None
+    ) -> int:
+        """Tokens left for history (optionally capped by max_history_tokens)"""
+        available = self.model.context_window - self.prompt_tokens - reply_tokens - estimate_tokens(user_message)
+        budget = max(0, int(available * (1 - SAFETY_MARGIN)))
+        if max_history_tokens is not None:
+            budget = min(budget, max_history_tokens)
+        return budget
+
+    def build(self, history: List[Message], budget: int) -> List[Dict[str, str]]:
+        """
+        Newest history that fits in budget, as {"role", "content"} dicts
+
+        Returns:
+            Messages in chronological order, starting at a user message
+        """
+        selected: List[Dict[str, str]] = []
+        used = 0
+        latest_turn = True
+
+        for message in reversed(history):
+            content = None
+            tokens = 0
+            if latest_turn and message.tool_results:
+                content = render_content(message.content, message.tool_results, full_tool_results=True)
+                tokens = estimate_tokens(content)
+                if used + tokens > budget:
+                    content = None
+            if content is None:
+                content = render_content(message.content, message.tool_results)
+                tokens = message.token_count or estimate_tokens(content)
+
+            if used + tokens > budget:
+                break
+            used += tokens
+            if content:
+                selected.append({"role": message.role, "content": content})
+            if message.role == "user":
+                latest_turn = False
+
+        selected.reverse()
+        while selected and selected[0]["role"] != "user":
+            selected.pop(0)
+        return selected
@@ -0,0 +1,346 @@
+"""
+Conversation Store
+Persists chat conversations and messages in SQLite or Postgres
+
+- Appending a turn is one INSERT of its messages plus one UPDATE of the
+  conversation's counters, in a single transaction; each message stores
+  its approximate token count (see utils/context.py)
+- History is read newest-first through the (conversation_id, created_at)
+  index and stops at the last N turns or a token budget, so a request
+  never loads the whole conversation
+- CONVERSATION_DATABASE_URL (or DATABASE_URL) selects the database;
+  without either a local SQLite file is used. Tables are created on startup.
+"""
+
+import logging
+import math
+import os
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import (
+    JSON, Column, DateTime, ForeignKey, Index, Integer, MetaData, String, Table, Text,
+    event, func, select, update
+)
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from models.conversation import Conversation, ConversationList
+from models.message import Message, MessageCreate
+from utils.context import message_tokens
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATABASE_URL = "sqlite+aiosqlite:///./conversations.db"
+
+# Upper bound on messages read for one history window
+MAX_HISTORY_MESSAGES = 200
+
+metadata = MetaData()
+
+# Prefixed so they can live in the database shared with Phase 2
+conversations_table = Table(
+    "chat_conversations",
+    metadata,
+    Column("id", String(64), primary_key=True),
+    Column("user_id", String(255), nullable=False),
+    Column("title", String(200), nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Column("updated_at", DateTime, nullable=False),
+    Column("message_count", Integer, nullable=False, default=0),
+    Index("ix_chat_conversations_user_updated", "user_id", "updated_at"),
+)
+
+messages_table = Table(
+    "chat_messages",
+    metadata,
+    Column("id", String(36), primary_key=True),
+    Column(
+        "conversation_id",
+        String(64),
+        ForeignKey("chat_conversations.id", ondelete="CASCADE"),
+        nullable=False
+    ),
+    Column("role", String(20), nullable=False),
+    Column("content", Text, nullable=False),
+    Column("tool_calls", JSON),
+    Column("tool_results", JSON),
+    Column("token_count", Integer, nullable=False, default=0),
+    Column("created_at", DateTime, nullable=False),
+    Index("ix_chat_messages_conversation_created", "conversation_id", "created_at"),
+)
+
+
+def async_database_url(url: str) -> str:
+    """Use the async driver for postgresql:// and sqlite:// URLs"""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url
+
+
+def _enable_sqlite_wal(dbapi_connection, connection_record) -> None:
+    # WAL lets reads run alongside the appends; NORMAL syncs on checkpoints only
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def _conversation(row) -> Conversation:
+    return Conversation(**row._mapping)
+
+
+def _message(row) -> Message:
+    return Message(**row._mapping)
+
+
+class ConversationStore:
+    """
+    Conversations and messages in a SQL database
+
+    Usage:
+        store = ConversationStore("sqlite+aiosqlite:///./conversations.db")
+        await store.init()
+        conversation = await store.get_or_create_conversation(user_id, conversation_id)
+        history = await store.load_history(conversation.id, max_turns=10, max_tokens=4000)
+        await store.append_messages(conversation.id, [MessageCreate(...), ...])
+    """
+
+    def __init__(self, database_url: str):
+        url = async_database_url(database_url)
+        self.engine: AsyncEngine = create_async_engine(url, pool_pre_ping=True)
+        if make_url(url).get_backend_name() == "sqlite":
+            event.listen(self.engine.sync_engine, "connect", _enable_sqlite_wal)
+
+    async def init(self) -> None:
+        """Create the tables and indexes if they don't exist"""
+        async with self.engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+
+    async def close(self) -> None:
+        await self.engine.dispose()
+
+    async def get_or_create_conversation(
+        self,
+        user_id: str,
+        conversation_id: Optional[str] = None,
+        title: Optional[str] = None
+    ) -> Conversation:
+        """
+        Get the user's conversation, creating it on first use
+
+        Clients pick their own conversation ids; an id that belongs to
+        another user gets a new conversation under a fresh id.
+        """
+        if conversation_id:
+            conversation = await self.get_conversation(conversation_id)
+            if conversation is not None:
+                if conversation.user_id == user_id:
+                    return conversation
+                logger.warning(f"Conversation {conversation_id} belongs to another user; starting a new one")
+                conversation_id = None
+
+        conversation = Conversation(
+            id=conversation_id or str(uuid.uuid4()),
+            user_id=user_id,
+            title=(title or "New Conversation")[:200]
+        )
+        try:
+            async with self.engine.begin() as conn:
+                await conn.execute(conversations_table.insert().values(**conversation.model_dump()))
+        except IntegrityError:
+            # Created concurrently (e.g. by a second socket)
+            existing = await self.get_conversation(conversation.id)
+            if existing is None or existing.user_id != user_id:
+                raise
+            return existing
+        return conversation
+
+    async def get_conversation(self, conversation_id: str, user_id: Optional[str] = None) -> Optional[Conversation]:
+        """Conversation by id (only if owned by user_id, when given)"""
+        query = select(conversations_table).where(conversations_table.c.id == conversation_id)
+        if user_id is not None:
+            query = query.where(conversations_table.c.user_id == user_id)
+        async with self.engine.connect() as conn:
+            row = (await conn.execute(query)).first()
+        return _conversation(row) if row else None
+
+    async def list_conversations(self, user_id: str, page: int = 1, limit: int = 20) -> ConversationList:
+        """A user's conversations, most recently updated first"""
+        async with self.engine.connect() as conn:
+            total = (await conn.execute(
+                select(func.count()).select_from(conversations_table)
+                .where(conversations_table.c.user_id == user_id)
+            )).scalar_one()
+            rows = (await conn.execute(
+                select(conversations_table)
+                .where(conversations_table.c.user_id == user_id)
+                .order_by(conversations_table.c.updated_at.desc())
+                .offset((page - 1) * limit)
+                .limit(limit)
+            )).all()
+
+        return ConversationList(
+            items=[_conversation(row) for row in rows],
+            total=total,
+            page=page,
+            limit=limit,
+            total_pages=math.ceil(total / limit) if total else 0
+        )
+
+    async def append_messages(self, conversation_id: str, new_messages: List[MessageCreate]) -> List[Message]:
+        """Append messages (e.g. a user message and its reply) in one transaction"""
+        now = datetime.utcnow()
+        stored = [
+            Message(
+                conversation_id=conversation_id,
+                role=new_message.role,
+                content=new_message.content,
+                tool_calls=new_message.tool_calls,
+                tool_results=new_message.tool_results,
+                token_count=message_tokens(new_message.content, new_message.tool_results),
+                # Distinct timestamps keep the messages of a turn in order
+                created_at=now + timedelta(microseconds=offset)
+            )
+            for offset, new_message in enumerate(new_messages)
+        ]
+        if not stored:
+            return []
+
+        async with self.engine.begin() as conn:
+            await conn.execute(messages_table.insert(), [message.model_dump() for message in stored])
+            await conn.execute(
+                update(conversations_table)
+                .where(conversations_table.c.id == conversation_id)
+                .values(
+                    message_count=conversations_table.c.message_count + len(stored),
+                    updated_at=stored[-1].created_at
+                )
+            )
+        return stored
+
+    async def get_messages(
+        self,
+        conversation_id: str,
+        limit: int = 50,
+        before: Optional[datetime] = None
+    ) -> Tuple[List[Message], bool]:
+        """
+        One page of messages, walking back from the newest (or from before)
+
+        Returns:
+            Messages in chronological order, and whether older ones exist
+        """
+        query = select(messages_table).where(messages_table.c.conversation_id == conversation_id)
+        if before is not None:
+            query = query.where(messages_table.c.created_at < before)
+        query = query.order_by(messages_table.c.created_at.desc()).limit(limit + 1)
+
+        async with self.engine.connect() as conn:
+            rows = (await conn.execute(query)).all()
+
+        has_more = len(rows) > limit
+        return [_message(row) for row in reversed(rows[:limit])], has_more
+
+    async def load_history(
+        self,
+        conversation_id: str,
+        max_turns: Optional[int] = None,
+        max_tokens: Optional[int] = None
+    ) -> List[Message]:
+        """
+        Most recent messages that fit in max_turns and max_tokens
+
+        A turn is a user message and the assistant's reply. The window always
+        starts at a user message. Returns messages in chronological order.
+        """
+        limit = MAX_HISTORY_MESSAGES
+        if max_turns is not None:
+            limit = min(limit, max_turns * 2)
+        if limit <= 0:
+            return []
+
+        async with self.engine.connect() as conn:
+            rows = (await conn.execute(
+                select(messages_table)
+                .where(messages_table.c.conversation_id == conversation_id)
+                .order_by(messages_table.c.created_at.desc())
+                .limit(limit)
+            )).all()
+
+        window: List[Message] = []
+        tokens = 0
+        for row in rows:
+            if max_tokens is not None and tokens + row.token_count > max_tokens:
+                break
+            tokens += row.token_count
+            window.append(_message(row))
+
+        window.reverse()
+        while window and window[0].role != "user":
+            window.pop(0)
+        return window
+
+
+# Shared store (see start_conversation_store)
+_store: Optional[ConversationStore] = None
+
+# Why the store could not be opened (history is then off for this process)
+_disabled_reason: Optional[str] = None
+
+
+class ConversationStoreUnavailable(RuntimeError):
+    """Conversation history is disabled because the database could not be opened"""
+
+
+def conversation_database_url() -> str:
+    return os.getenv("CONVERSATION_DATABASE_URL") or os.getenv("DATABASE_URL") or DEFAULT_DATABASE_URL
+
+
+async def start_conversation_store() -> None:
+    """
+    Open the shared store and create its tables. Called on server startup.
+
+    If the database can't be reached the error is logged and history is
+    disabled until restart: chat keeps working without memory and
+    get_conversation_store raises ConversationStoreUnavailable instead of
+    retrying the connection on every message.
+    """
+    global _store, _disabled_reason
+    if _store is not None or _disabled_reason is not None:
+        return
+
+    store = None
+    try:
+        store = ConversationStore(conversation_database_url())
+        await store.init()
+    except Exception as e:
+        if store is not None:
+            await store.close()
+        _disabled_reason = f"{type(e).__name__}: {e}"
+        logger.error(f"Conversation store unavailable, chat history is disabled: {_disabled_reason}")
+        return
+    _store = store
+
+
+async def close_conversation_store() -> None:
+    """Close the shared store. Called on server shutdown."""
+    global _store, _disabled_reason
+    _disabled_reason = None
+    if _store is not None:
+        await _store.close()
+        _store = None
+
+
+async def get_conversation_store() -> ConversationStore:
+    """Get the shared store (opened lazily outside the server lifespan)"""
+    if _store is None:
+        await start_conversation_store()
+    if _store is None:
+        raise ConversationStoreUnavailable(_disabled_reason)
+    return _store
@@ -5,11 +5,14 @@ Get your free API key at: https://console.groq.com
 """
 
 import os
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 import httpx
 import json
 import logging
 
+from utils.context import ModelInfo
+from utils.streaming import ToolCallBuffer, done_event, sse_data, text_event, tool_call_event
+
 logger = logging.getLogger(__name__)
 
 # Groq API endpoint
@@ -36,14 +39,25 @@ class GroqClient:
                 "Set GROQ_API_KEY environment variable or pass api_key parameter."
             )
 
-        # Available models (all free!)
+        # Available models (all free!), with context windows for history budgets
         self.models = {
-            "llama": "llama-3.3-70b-versatile",      # Best quality
-            "mixtral": "mixtral-8x7b-32768",          # Good for long context
-            "gemma": "gemma2-9b-it",                  # Fast and efficient
-            "llama-small": "llama-3.1-8b-instant",    # Fastest
+            "llama": ModelInfo("llama-3.3-70b-versatile", context_window=131072),  # Best quality
+            "mixtral": ModelInfo("mixtral-8x7b-32768", context_window=32768),      # Good for long context
+            "gemma": ModelInfo("gemma2-9b-it", context_window=8192),               # Fast and efficient
+            "llama-small": ModelInfo("llama-3.1-8b-instant", context_window=131072),  # Fastest
         }
-        self.model = self.models["llama"]  # Default to best model
+        self.model_info = self.models["llama"]  # Default to best model
+        self.model = self.model_info.name
+
+        # Keep-alive client reused across requests (see aclose)
+        self._http = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            },
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0)
+        )
 
     async def chat(
         self,
@@ -51,7 +65,8 @@ class GroqClient:
         system_prompt: Optional[str] = None,
         tools: Optional[List[Dict]] = None,
         max_tokens: int = 2048,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        formatted_tools: Optional[List[Dict]] = None
     ) -> Dict[str, Any]:
         """
         Send chat message to Groq and get response
@@ -62,52 +77,24 @@ class GroqClient:
             tools: Optional list of tool definitions (OpenAI format)
             max_tokens: Maximum tokens in response
             model: Optional model override
+            formatted_tools: Tools already converted with format_tools (used instead of tools)
 
         Returns:
             Dict with response content and potential tool calls
         """
 
         try:
-            # Build messages with system prompt
-            full_messages = []
-            if system_prompt:
-                full_messages.append({
-                    "role": "system",
-                    "content": system_prompt
-                })
-            full_messages.extend(messages)
-
-            # Build request
-            request_body = {
-                "model": model or self.model,
-                "messages": full_messages,
-                "max_tokens": max_tokens,
-                "temperature": 0.7,
-            }
-
-            # Add tools if provided (Groq supports OpenAI-compatible function calling)
-            if tools:
-                request_body["tools"] = self._convert_tools_to_openai_format(tools)
-                request_body["tool_choice"] = "auto"
+            request_body = self._request_body(messages, system_prompt, tools, max_tokens, model, formatted_tools)
 
             # Call Groq API
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    GROQ_API_URL,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json=request_body,
-                    timeout=60.0
-                )
+            response = await self._http.post(GROQ_API_URL, json=request_body)
 
-                if response.status_code != 200:
-                    error_detail = response.text
-                    logger.error(f"Groq API error: {response.status_code} - {error_detail}")
-                    raise Exception(f"Groq API error: {response.status_code}")
+            if response.status_code != 200:
+                error_detail = response.text
+                logger.error(f"Groq API error: {response.status_code} - {error_detail}")
+                raise Exception(f"Groq API error: {response.status_code}")
 
-                data = response.json()
+            data = response.json()
 
             # Parse response
             choice = data["choices"][0]
@@ -141,6 +128,122 @@ class GroqClient:
             logger.error(f"Groq API error: {e}")
             raise Exception(f"Failed to get response from Groq: {str(e)}")
 
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict]] = None,
+        max_tokens: int = 2048,
+        model: Optional[str] = None,
+        formatted_tools: Optional[List[Dict]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Like chat, but yields the reply as it is generated (server-sent events)
+
+        Yields text and tool call pieces, then the full response
+        (see utils/streaming.py for the event shapes).
+        """
+        request_body = self._request_body(messages, system_prompt, tools, max_tokens, model, formatted_tools)
+        request_body["stream"] = True
+
+        content = ""
+        tool_calls = ToolCallBuffer()
+        stop_reason = "stop"
+        response_model = request_body["model"]
+
+        try:
+            async with self._http.stream("POST", GROQ_API_URL, json=request_body) as response:
+                if response.status_code != 200:
+                    error_detail = (await response.aread()).decode(errors="replace")
+                    logger.error(f"Groq API error: {response.status_code} - {error_detail}")
+                    raise Exception(f"Groq API error: {response.status_code}")
+
+                async for chunk in sse_data(response.aiter_lines()):
+                    response_model = chunk.get("model", response_model)
+                    if not chunk.get("choices"):
+                        continue
+                    choice = chunk["choices"][0]
+                    delta = choice.get("delta") or {}
+
+                    if delta.get("content"):
+                        content += delta["content"]
+                        yield text_event(delta["content"])
+
+                    for tool_call in delta.get("tool_calls") or []:
+                        function = tool_call.get("function") or {}
+                        tool_calls.add(
+                            tool_call["index"],
+                            id=tool_call.get("id"),
+                            name=function.get("name"),
+                            arguments=function.get("arguments", "")
+                        )
+                        yield tool_call_event(
+                            tool_call["index"],
+                            arguments=function.get("arguments", ""),
+                            id=tool_call.get("id"),
+                            name=function.get("name")
+                        )
+
+                    if choice.get("finish_reason"):
+                        stop_reason = choice["finish_reason"]
+
+        except httpx.TimeoutException:
+            logger.error("Groq API timeout")
+            raise Exception("Groq API request timed out")
+        except httpx.HTTPError as e:
+            logger.error(f"Groq API error: {e}")
+            raise Exception(f"Failed to get response from Groq: {str(e)}")
+
+        logger.info(f"Groq streamed response ({response_model}): {content[:100]}...")
+        yield done_event({
+            "content": content,
+            "tool_calls": tool_calls.tool_calls(),
+            "stop_reason": stop_reason,
+            "model": response_model
+        })
+
+    def _request_body(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str],
+        tools: Optional[List[Dict]],
+        max_tokens: int,
+        model: Optional[str],
+        formatted_tools: Optional[List[Dict]]
+    ) -> Dict[str, Any]:
+        """Chat completion request body (shared by chat and stream)"""
+        # Build messages with system prompt
+        full_messages = []
+        if system_prompt:
+            full_messages.append({
+                "role": "system",
+                "content": system_prompt
+            })
+        full_messages.extend(messages)
+
+        request_body = {
+            "model": model or self.model,
+            "messages": full_messages,
+            "max_tokens": max_tokens,
+            "temperature": 0.7,
+        }
+
+        # Add tools if provided (Groq supports OpenAI-compatible function calling)
+        if formatted_tools is None and tools:
+            formatted_tools = self.format_tools(tools)
+        if formatted_tools:
+            request_body["tools"] = formatted_tools
+            request_body["tool_choice"] = "auto"
+        return request_body
+
+    def format_tools(self, tools: List[Dict]) -> List[Dict]:
+        """Convert tool definitions to the format sent to Groq (do once, reuse)"""
+        return self._convert_tools_to_openai_format(tools)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client"""
+        await self._http.aclose()
+
     def _convert_tools_to_openai_format(self, tools: List[Dict]) -> List[Dict]:
         """Convert Claude-style tools to OpenAI format for Groq"""
         openai_tools = []
@@ -302,13 +405,26 @@ When a user searches for tasks, use the search_tasks tool."""
             },
             {
                 "name": "search_tasks",
-                "description": "Search tasks by keyword in title or description",
+                "description": "Search tasks by keyword in title or description (best matches first, paginated)",
                 "input_schema": {
                     "type": "object",
                     "properties": {
                         "query": {
                             "type": "string",
                             "description": "Search query keyword"
+                        },
+                        "status": {
+                            "type": "string",
+                            "enum": ["pending", "in_progress", "completed"],
+                            "description": "Only return tasks with this status"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Maximum matches to return (default 10, max 50)"
+                        },
+                        "page": {
+                            "type": "integer",
+                            "description": "Page of results to return when there are more matches (default 1)"
                         }
                     },
                     "required": ["query"]
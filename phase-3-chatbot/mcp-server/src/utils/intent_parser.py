@@ -0,0 +1,350 @@
+"""
+Intent Parser
+Answers common, unambiguous task commands without calling the LLM
+
+Compiled patterns recognise whole-message commands in English, Roman Urdu
+and Urdu script (the command phrases come from utils/urdu_translator.py):
+- create: "create a high priority task to review code by friday",
+  "add buy milk to my tasks", "task banao: hackathon submit karo"
+- list:   "show my pending tasks", "what are my high priority tasks",
+  "mere tasks", "تمام ٹاسک دکھائیں"
+- search: "find tasks about testing", "search for report in my tasks",
+  "dhundo: report"
+
+Title, priority, status and simple due dates (today, tomorrow, a weekday,
+in N days, next week, YYYY-MM-DD) are extracted. A create command needs an
+explicit separator before the title (":", "-", "to", "called", "named").
+Anything else (updates and deletes, which need a task id, several commands
+in one message, a missing title or query, create requests phrased as a
+question, a title with a date that doesn't resolve or that stands for
+several tasks) returns None and goes to the model.
+"""
+
+import re
+import unicodedata
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+from utils.urdu_translator import URDU_COMMANDS
+
+# Longer messages are usually more than a command
+MAX_MESSAGE_LENGTH = 200
+
+
+@dataclass(frozen=True)
+class Intent:
+    """A recognised command and the tool call that answers it"""
+    tool: str
+    input: Dict[str, Any] = field(default_factory=dict)
+
+    def tool_call(self) -> Dict[str, Any]:
+        """Tool call in the shape the AI clients return ({"id", "name", "input"})"""
+        return {"id": f"intent_{uuid.uuid4().hex[:12]}", "name": self.tool, "input": dict(self.input)}
+
+
+def _commands(*meanings: str) -> str:
+    """Regex alternation of the Urdu / Roman Urdu phrases for these English meanings"""
+    phrases = sorted((urdu for urdu, english in URDU_COMMANDS.items() if english in meanings), key=len, reverse=True)
+    return "|".join(re.escape(phrase).replace(r"\ ", r"\s+") for phrase in phrases)
+
+
+def _compile(pattern: str) -> Pattern:
+    return re.compile(pattern, re.IGNORECASE | re.VERBOSE)
+
+
+URDU_CREATE = _commands("create task", "new task", "add task")
+URDU_LIST = _commands("show all tasks", "my tasks", "task list", "pending tasks")
+URDU_SEARCH = _commands("search")
+URDU_HIGH_PRIORITY = "|".join(
+    re.escape(urdu) for urdu, english in URDU_COMMANDS.items() if english == "high priority" and urdu != english
+)
+
+# Words that filter a task list
+FILTERS = {
+    "pending": ("status", "pending"),
+    "open": ("status", "pending"),
+    "incomplete": ("status", "pending"),
+    "unfinished": ("status", "pending"),
+    "in progress": ("status", "in_progress"),
+    "in-progress": ("status", "in_progress"),
+    "completed": ("status", "completed"),
+    "complete": ("status", "completed"),
+    "done": ("status", "completed"),
+    "finished": ("status", "completed"),
+    "mukammal": ("status", "completed"),
+    "مکمل": ("status", "completed"),
+    "high": ("priority", "high"),
+    "urgent": ("priority", "high"),
+    "important": ("priority", "high"),
+    "medium": ("priority", "medium"),
+    "low": ("priority", "low"),
+}
+FILTER = (
+    r"(?:pending|open|incomplete|unfinished|in[\s-]progress|completed|complete|done|finished|mukammal|مکمل"
+    rf"|(?:high|medium|low)(?:[\s-]+priority)?|urgent|important|{URDU_HIGH_PRIORITY})"
+)
+
+TASKS = r"(?:tasks|todos|to-dos|task\s+list|todo\s+list)"
+
+LIST_PATTERNS: List[Pattern] = [
+    # show / list / what are + [all] [my] [filters] tasks [that are <filter>]
+    _compile(rf"""
+        (?:(?:show|list|display|view|see|get|give|fetch)(?:\s+me)?\s+|what(?:'s|\s+is|\s+are)\s+|which\s+are\s+)?
+        (?:all\s+)?(?:of\s+)?(?:my\s+|the\s+)?(?:all\s+)?
+        (?:(?P<filter1>{FILTER})\s+)?(?:(?P<filter2>{FILTER})\s+)?
+        {TASKS}
+        (?:\s+(?:that\s+are\s+|which\s+are\s+)?(?P<filter3>{FILTER}))?
+    """),
+    _compile(rf"(?:what|which)\s+(?:(?P<filter1>{FILTER})\s+)?tasks\s+do\s+i\s+have"),
+    _compile(rf"do\s+i\s+have\s+any\s+(?:(?P<filter1>{FILTER})\s+)?tasks"),
+    # Roman Urdu: mere sare pending tasks dikhao, zaroori tasks kya hain
+    _compile(rf"""
+        (?=.*\b(?:mere|meray|sare|saare|sab|tamam|dikhao|dikhaen|dikhayen|batao|kya\s+hain)\b)
+        (?:mere\s+|meray\s+)?(?:sare\s+|saare\s+|sab\s+|tamam\s+)?
+        (?:(?P<filter1>{FILTER})\s+)?(?:tasks?|kaam)
+        (?:\s+(?:dikhao|dikhaen|dikhayen|batao|kya\s+hain))?
+    """),
+    # Urdu script: میرے ٹاسک, تمام ٹاسک دکھائیں, ضروری ٹاسک کیا ہیں
+    _compile(rf"""
+        (?:میرے\s*)?(?:تمام\s*|سارے\s*)?(?:(?P<filter1>{FILTER})\s*)?ٹاسک
+        (?:\s*(?:دکھائیں|دکھاؤ|کیا\s+ہیں))?
+    """),
+    _compile(URDU_LIST),
+]
+
+CREATE_PATTERNS: List[Pattern] = [
+    _compile(r"""
+        (?:create|add|make)\s+(?:me\s+)?(?:a\s+|an\s+|one\s+)?(?:new\s+)?
+        (?:(?P<priority>high|medium|low)(?:[\s-]+priority)?\s+|(?P<urgent>urgent|important)\s+)?
+        (?:task|todo|to-do|reminder)
+        (?:\s*[:\-–]\s*|\s+(?:to|called|named)\s+)
+        (?P<title>.+)
+    """),
+    _compile(r"add\s+(?P<title>.+?)\s+to\s+(?:my\s+)?(?:tasks?|task\s+list|todo\s+list|todos|list)"),
+    _compile(r"remind\s+me\s+to\s+(?P<title>.+)"),
+    # task banao: ..., naya task banao - ..., نیا ٹاسک بنائیں: ...
+    _compile(rf"(?:{URDU_CREATE})(?:\s*(?:banao|banaen|banayen|بنائیں))?\s*[:\-–۔]\s*(?P<title>.+)"),
+]
+
+SEARCH_PATTERNS: List[Pattern] = [
+    # Only with "tasks" ("search the web for X" is not a task search)
+    _compile(rf"""
+        search\s+(?:for\s+)?(?:(?:my|all|the)\s+)?
+        (?:(?P<filter1>{FILTER})\s+)?(?:tasks?|todos?)\s+
+        (?:(?:about|with|containing|matching|mentioning|named|called|titled|for|related\s+to|on)\s+)?
+        (?P<query>.+)
+    """),
+    # ... or scoped to them: "search for X in my tasks"
+    _compile(r"""
+        (?:search|find|look\s+up|look\s+for)\s+(?:for\s+)?(?P<query>.+?)
+        \s+in\s+(?:my\s+|the\s+)?(?:tasks?|todos?|task\s+list|todo\s+list)
+    """),
+    _compile(rf"""
+        (?:find|look\s+up|look\s+for)\s+(?:(?:my|all|the)\s+)?
+        (?:(?P<filter1>{FILTER})\s+)?(?:tasks?|todos?)\s+
+        (?:about|with|containing|matching|mentioning|named|called|titled|for|related\s+to|on)\s+
+        (?P<query>.+)
+    """),
+    _compile(rf"(?:{URDU_SEARCH})\s*[:\-–]?\s*(?P<query>.+)"),
+    _compile(rf"(?P<query>.+?)\s+(?:wale\s+|wala\s+|ke\s+)?(?:tasks?\s+)?(?:{URDU_SEARCH})"),
+]
+
+# Politeness and punctuation around a command
+POLITE_PREFIX = _compile(r"^(?:(?:please|pls|plz|kindly|hey|hi)[\s,]+|(?:can|could|would|will)\s+you\s+(?:please\s+)?)+")
+POLITE_SUFFIX = _compile(r"[\s,]+(?:please|pls|plz|thanks|thank\s+you)$")
+TRAILING_PUNCTUATION = re.compile(r"[\s.!?۔؟]+$")
+
+# A date the due date parser couldn't read, or a title that stands for
+# several tasks ("... for each of my meetings"): the model should decide
+UNREAD_DATE = re.compile(r"\b\d{4}-\d{1,2}-\d{1,2}\b")
+SEVERAL_TASKS = _compile(r"\b(?:each|every|all\s+of)\b")
+
+# A second command in the same message ("... and show my tasks")
+ANOTHER_COMMAND = _compile(
+    r"\b(?:and|then|also)\s+(?:show|list|delete|remove|update|edit|mark|complete|search|find|create|add)\b"
+)
+
+# Priority and due date phrases at either end of a title
+TITLE_PRIORITY = _compile(rf"""
+    (?:^|[\s,;(\-]+)(?:with\s+|as\s+|at\s+)?(?:a\s+)?
+    (?:(?P<level>high|medium|low)[\s-]+priority|(?P<urgent>urgent(?:ly)?|asap|{URDU_HIGH_PRIORITY}))
+    \)?$
+""")
+TITLE_PRIORITY_PREFIX = _compile(rf"^(?:(?P<level>high|medium|low)[\s-]+priority|(?P<urgent>urgent|{URDU_HIGH_PRIORITY}))[\s,:;\-]+")
+WHEN = r"""
+    (?P<when>today|tonight|tomorrow|day\s+after\s+tomorrow|next\s+week
+    |in\s+\d{1,3}\s+(?:day|days|week|weeks)
+    |(?:next\s+|this\s+)?(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday)
+    |\d{4}-\d{2}-\d{2}|aaj|aj|kal|parson)
+"""
+TITLE_DUE = _compile(rf"(?:^|[\s,;(\-]+)(?:(?:due|by|on|before|until)\s+)?{WHEN}(?:\s+tak)?\)?$")
+TITLE_DUE_PREFIX = _compile(rf"^(?:(?:due|by|on|before)\s+)?{WHEN}(?:\s+tak)?[\s,:;\-]+")
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+# Queries that mean "all tasks" rather than a keyword
+NOT_A_QUERY = {"task", "tasks", "my tasks", "all tasks", "all", "everything", "todos"}
+
+
+def _normalize(message: str) -> str:
+    text = unicodedata.normalize("NFKC", message)
+    text = " ".join(text.split())
+    text = TRAILING_PUNCTUATION.sub("", text)
+    text = POLITE_PREFIX.sub("", text)
+    text = POLITE_SUFFIX.sub("", text)
+    return TRAILING_PUNCTUATION.sub("", text)
+
+
+def _resolve_date(when: str, today: date) -> Optional[date]:
+    when = " ".join(when.lower().split())
+    if when in ("today", "tonight", "aaj", "aj"):
+        return today
+    if when in ("tomorrow", "kal"):
+        return today + timedelta(days=1)
+    if when in ("day after tomorrow", "parson"):
+        return today + timedelta(days=2)
+    if when == "next week":
+        return today + timedelta(days=7)
+
+    match = re.fullmatch(r"in (\d+) (day|week)s?", when)
+    if match:
+        count = int(match.group(1))
+        return today + timedelta(days=count * 7 if match.group(2) == "week" else count)
+
+    weekday = when.split()[-1]
+    if weekday in WEEKDAYS:
+        # Next occurrence after today
+        return today + timedelta(days=(WEEKDAYS.index(weekday) - today.weekday() - 1) % 7 + 1)
+
+    try:
+        return date.fromisoformat(when)
+    except ValueError:
+        return None
+
+
+def _filters(match: re.Match) -> Dict[str, str]:
+    filters: Dict[str, str] = {}
+    for name in ("filter1", "filter2", "filter3"):
+        word = match.groupdict().get(name)
+        if not word:
+            continue
+        word = re.sub(r"[\s-]+priority$", "", " ".join(word.lower().split()))
+        key, value = FILTERS.get(word) or (("priority", "high") if re.fullmatch(URDU_HIGH_PRIORITY, word) else (None, None))
+        if key is None or filters.get(key, value) != value:
+            return {"conflict": "true"}
+        filters[key] = value
+    return filters
+
+
+class IntentParser:
+    """
+    Recognises high-confidence task commands
+
+    Usage:
+        intent = intent_parser.parse("create a high priority task to review code")
+        if intent:
+            tool_calls = [intent.tool_call()]   # no LLM needed
+    """
+
+    def parse(self, message: str, today: Optional[date] = None) -> Optional[Intent]:
+        """The command in message, or None when the model should handle it"""
+        if not message or len(message) > MAX_MESSAGE_LENGTH:
+            return None
+        text = _normalize(message)
+        if not text or ANOTHER_COMMAND.search(text):
+            return None
+
+        # "new task ideas?" asks something; only list commands may be questions
+        question = "?" in message or "؟" in message
+        return (
+            (None if question else self._create(text, today or date.today()))
+            or self._list(text)
+            or self._search(text)
+        )
+
+    def _list(self, text: str) -> Optional[Intent]:
+        for pattern in LIST_PATTERNS:
+            match = pattern.fullmatch(text)
+            if match:
+                filters = _filters(match)
+                if "conflict" in filters:
+                    return None
+                return Intent("list_tasks", filters)
+        return None
+
+    def _create(self, text: str, today: date) -> Optional[Intent]:
+        for pattern in CREATE_PATTERNS:
+            match = pattern.fullmatch(text)
+            if not match:
+                continue
+
+            groups = match.groupdict()
+            priority = (groups.get("priority") or "").lower() or ("high" if groups.get("urgent") else None)
+            title, title_priority, due_date = self._title_details(match.group("title"), today)
+            if title_priority:
+                if priority and priority != title_priority:
+                    return None
+                priority = title_priority
+            if not title or len(title) > MAX_MESSAGE_LENGTH:
+                return None
+            if UNREAD_DATE.search(title) or SEVERAL_TASKS.search(title):
+                return None
+
+            task: Dict[str, Any] = {"title": title}
+            if priority:
+                task["priority"] = priority
+            if due_date:
+                task["due_date"] = due_date.isoformat()
+            return Intent("create_task", task)
+        return None
+
+    def _search(self, text: str) -> Optional[Intent]:
+        for pattern in SEARCH_PATTERNS:
+            match = pattern.fullmatch(text)
+            if not match:
+                continue
+
+            query = match.group("query").strip(" \"'“”‘’")
+            if not query or query.lower() in NOT_A_QUERY or len(query) > 100:
+                return None
+
+            search: Dict[str, Any] = {"query": query}
+            filters = _filters(match)
+            if "conflict" in filters or "priority" in filters:
+                return None
+            search.update(filters)
+            return Intent("search_tasks", search)
+        return None
+
+    @staticmethod
+    def _title_details(title: str, today: date) -> Tuple[str, Optional[str], Optional[date]]:
+        """Strip priority and due date phrases off both ends of a title"""
+        priority = None
+        due_date = None
+        title = title.strip(" \"'“”‘’")
+
+        # Each phrase can be at either end, in either order
+        for _ in range(2):
+            for pattern in (TITLE_PRIORITY, TITLE_PRIORITY_PREFIX):
+                match = pattern.search(title)
+                if match and priority is None:
+                    priority = (match.group("level") or "high").lower()
+                    title = (title[:match.start()] + title[match.end():]).strip(" ,;:-")
+            for pattern in (TITLE_DUE, TITLE_DUE_PREFIX):
+                match = pattern.search(title)
+                if match and due_date is None:
+                    resolved = _resolve_date(match.group("when"), today)
+                    if resolved is not None:
+                        due_date = resolved
+                        title = (title[:match.start()] + title[match.end():]).strip(" ,;:-")
+
+        title = title.strip(" \"'“”‘’")
+        if title:
+            title = title[0].upper() + title[1:]
+        return title, priority, due_date
+
+
+# Global parser instance
+intent_parser = IntentParser()
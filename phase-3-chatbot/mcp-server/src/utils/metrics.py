@@ -0,0 +1,161 @@
+"""
+Prometheus metrics for the MCP server
+Exposed at GET /metrics (see server.py)
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from prometheus_client import Counter, Gauge, Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# HTTP requests (route = path template, never the raw path)
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route, method and status code",
+    ["method", "route", "status"]
+)
+HTTP_REQUEST_ERRORS = Counter(
+    "http_request_errors_total",
+    "HTTP requests that failed with a 5xx status or an unhandled exception",
+    ["method", "route"]
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served"
+)
+WEBSOCKET_CONNECTIONS = Gauge(
+    "websocket_connections_active",
+    "Open WebSocket connections by route",
+    ["route"]
+)
+WEBSOCKET_MESSAGES_DROPPED = Counter(
+    "websocket_messages_dropped_total",
+    "Outbound WebSocket messages dropped for slow clients"
+)
+WEBSOCKET_SLOW_DISCONNECTS = Counter(
+    "websocket_slow_disconnects_total",
+    "WebSockets closed because the client could not keep up"
+)
+
+# LLM calls by provider (groq, claude, openai, mock, ...)
+LLM_REQUEST_DURATION = Histogram(
+    "llm_request_duration_seconds",
+    "LLM chat completion latency by provider",
+    ["provider", "outcome"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 4, 8, 15, 30, 60)
+)
+LLM_TIME_TO_FIRST_TOKEN = Histogram(
+    "llm_time_to_first_token_seconds",
+    "Time until a streamed LLM reply produced its first text or tool call piece",
+    ["provider"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 0.75, 1, 1.5, 2, 4, 8, 15)
+)
+
+# Chat turns answered by the intent parser ("fast") or the model ("llm")
+CHAT_TURNS = Counter(
+    "chat_turns_total",
+    "Chat turns by how the reply was produced",
+    ["path"]
+)
+
+# Event loop health (see utils/loop_monitor.py; only when LOOP_MONITOR_ENABLED)
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop ran a scheduled wake-up",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+)
+EVENT_LOOP_BLOCKED = Counter(
+    "event_loop_blocked_total",
+    "Times the event loop was blocked past LOOP_LAG_THRESHOLD_MS"
+)
+
+
+@contextmanager
+def observe_llm(provider: str) -> Iterator[None]:
+    """
+    Time an LLM call
+
+    Usage:
+        with observe_llm("groq"):
+            response = await client.chat(...)
+    """
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        LLM_REQUEST_DURATION.labels(provider, outcome).observe(time.perf_counter() - started)
+
+
+def route_template(scope: Scope) -> str:
+    """Matched route path (e.g. /ws/chat), or "unmatched" """
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Records per-route latency, request and error counts, in-flight
+    requests and open WebSockets. Add it last so it wraps everything.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "websocket":
+            await self._websocket(scope, receive, send)
+            return
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception:
+            status_code = 500
+            raise
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            method = scope["method"]
+            route = route_template(scope)
+            HTTP_REQUEST_DURATION.labels(method, route).observe(time.perf_counter() - started)
+            HTTP_REQUESTS.labels(method, route, str(status_code)).inc()
+            if status_code >= 500:
+                HTTP_REQUEST_ERRORS.labels(method, route).inc()
+
+    async def _websocket(self, scope: Scope, receive: Receive, send: Send) -> None:
+        gauge = None
+
+        async def send_tracking_accept(message: Message) -> None:
+            nonlocal gauge
+            if message["type"] == "websocket.accept" and gauge is None:
+                gauge = WEBSOCKET_CONNECTIONS.labels(route_template(scope))
+                gauge.inc()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking_accept)
+        finally:
+            if gauge is not None:
+                gauge.dec()
@@ -3,10 +3,14 @@ Mock AI Client - Fallback when API keys have no credits
 Uses simple keyword matching to simulate AI responses
 """
 
+import json
 import logging
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 import re
 
+from utils.intent_parser import intent_parser
+from utils.streaming import done_event, text_event, tool_call_event
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,7 +27,8 @@ class MockAIClient:
         messages: List[Dict[str, str]],
         system_prompt: Optional[str] = None,
         tools: Optional[List[Dict]] = None,
-        max_tokens: int = 1024
+        max_tokens: int = 1024,
+        formatted_tools: Optional[List[Dict]] = None
     ) -> Dict[str, Any]:
         """
         Mock chat that uses keyword matching
@@ -33,6 +38,7 @@ class MockAIClient:
             system_prompt: Optional system prompt (ignored)
             tools: Optional list of tool definitions (ignored)
             max_tokens: Maximum tokens in response (ignored)
+            formatted_tools: Formatted tool definitions (ignored)
 
         Returns:
             Dict with response content and potential tool calls
@@ -47,8 +53,13 @@ class MockAIClient:
                 "stop_reason": "end_turn"
             }
 
-            # Keyword-based tool detection
-            if any(word in user_message for word in ["create", "add", "new"]) and "task" in user_message:
+            # Commands the intent parser recognises, then looser keyword rules
+            intent = intent_parser.parse(messages[-1]["content"])
+            if intent:
+                result["tool_calls"].append(intent.tool_call())
+                result["content"] = "On it."
+
+            elif any(word in user_message for word in ["create", "add", "new"]) and "task" in user_message:
                 # Extract task details from message
                 title = self._extract_task_title(user_message)
                 priority = self._extract_priority(user_message)
@@ -106,6 +117,28 @@ class MockAIClient:
                 "stop_reason": "end_turn"
             }
 
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict]] = None,
+        max_tokens: int = 1024,
+        formatted_tools: Optional[List[Dict]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Mock streaming: the chat reply word by word, then its tool calls"""
+        result = await self.chat(messages, system_prompt, tools, max_tokens, formatted_tools)
+
+        for word in re.findall(r"\S+\s*", result["content"]):
+            yield text_event(word)
+        for index, tool_call in enumerate(result["tool_calls"]):
+            yield tool_call_event(
+                index,
+                arguments=json.dumps(tool_call["input"]),
+                id=tool_call["id"],
+                name=tool_call["name"]
+            )
+        yield done_event(result)
+
     def _extract_task_title(self, message: str) -> str:
         """Extract task title from message"""
         # Remove common trigger words
@@ -138,3 +171,7 @@ class MockAIClient:
     def get_tool_definitions(self) -> List[Dict]:
         """Get tool definitions (for compatibility)"""
         return []
+
+    def format_tools(self, tools: List[Dict]) -> List[Dict]:
+        """Format tool definitions (for compatibility)"""
+        return tools
@@ -4,11 +4,14 @@ Handles communication with OpenAI's GPT API
 """
 
 import os
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from openai import AsyncOpenAI
 import logging
 import json
 
+from utils.context import ModelInfo
+from utils.streaming import ToolCallBuffer, done_event, text_event, tool_call_event
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,14 +33,16 @@ class OpenAIClient:
             )
 
         self.client = AsyncOpenAI(api_key=self.api_key)
-        self.model = "gpt-3.5-turbo"  # GPT-3.5 Turbo - widely accessible
+        self.model_info = ModelInfo("gpt-3.5-turbo", context_window=16385)  # GPT-3.5 Turbo - widely accessible
+        self.model = self.model_info.name
 
     async def chat(
         self,
         messages: List[Dict[str, str]],
         system_prompt: Optional[str] = None,
         tools: Optional[List[Dict]] = None,
-        max_tokens: int = 1024
+        max_tokens: int = 1024,
+        formatted_tools: Optional[List[Dict]] = None
     ) -> Dict[str, Any]:
         """
         Send chat message to OpenAI and get response
@@ -47,33 +52,14 @@ class OpenAIClient:
             system_prompt: Optional system prompt
             tools: Optional list of tool definitions (Claude format, will be converted)
             max_tokens: Maximum tokens in response
+            formatted_tools: Tools already converted with format_tools (used instead of tools)
 
         Returns:
             Dict with response content and potential tool calls
         """
 
         try:
-            # Prepare messages - add system prompt if provided
-            openai_messages = []
-            if system_prompt:
-                openai_messages.append({
-                    "role": "system",
-                    "content": system_prompt
-                })
-            openai_messages.extend(messages)
-
-            # Build request parameters
-            request_params = {
-                "model": self.model,
-                "max_tokens": max_tokens,
-                "messages": openai_messages
-            }
-
-            # Convert Claude tool format to OpenAI function format
-            if tools:
-                openai_tools = self._convert_tools_to_openai_format(tools)
-                request_params["tools"] = openai_tools
-                request_params["tool_choice"] = "auto"
+            request_params = self._request_params(messages, system_prompt, tools, max_tokens, formatted_tools)
 
             # Call OpenAI API
             response = await self.client.chat.completions.create(**request_params)
@@ -107,6 +93,98 @@ class OpenAIClient:
             logger.error(f"OpenAI API error: {e}")
             raise Exception(f"Failed to get response from OpenAI: {str(e)}")
 
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str] = None,
+        tools: Optional[List[Dict]] = None,
+        max_tokens: int = 1024,
+        formatted_tools: Optional[List[Dict]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Like chat, but yields the reply as it is generated (server-sent events)
+
+        Yields text and tool call pieces, then the full response
+        (see utils/streaming.py for the event shapes).
+        """
+        request_params = self._request_params(messages, system_prompt, tools, max_tokens, formatted_tools)
+
+        content = ""
+        tool_calls = ToolCallBuffer()
+        stop_reason = "stop"
+
+        try:
+            response = await self.client.chat.completions.create(**request_params, stream=True)
+            async for chunk in response:
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                delta = choice.delta
+
+                if delta.content:
+                    content += delta.content
+                    yield text_event(delta.content)
+
+                for tool_call in delta.tool_calls or []:
+                    name = tool_call.function.name if tool_call.function else None
+                    arguments = (tool_call.function.arguments if tool_call.function else None) or ""
+                    tool_calls.add(tool_call.index, id=tool_call.id, name=name, arguments=arguments)
+                    yield tool_call_event(tool_call.index, arguments=arguments, id=tool_call.id, name=name)
+
+                if choice.finish_reason:
+                    stop_reason = choice.finish_reason
+
+        except Exception as e:
+            logger.error(f"OpenAI API error: {e}")
+            raise Exception(f"Failed to get response from OpenAI: {str(e)}")
+
+        logger.info(f"OpenAI streamed response: {content[:100] if content else 'Tool calls only'}...")
+        yield done_event({
+            "content": content,
+            "tool_calls": tool_calls.tool_calls(),
+            "stop_reason": stop_reason
+        })
+
+    def _request_params(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str],
+        tools: Optional[List[Dict]],
+        max_tokens: int,
+        formatted_tools: Optional[List[Dict]]
+    ) -> Dict[str, Any]:
+        """Chat completion parameters (shared by chat and stream)"""
+        # Prepare messages - add system prompt if provided
+        openai_messages = []
+        if system_prompt:
+            openai_messages.append({
+                "role": "system",
+                "content": system_prompt
+            })
+        openai_messages.extend(messages)
+
+        request_params = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": openai_messages
+        }
+
+        # Convert Claude tool format to OpenAI function format
+        if formatted_tools is None and tools:
+            formatted_tools = self.format_tools(tools)
+        if formatted_tools:
+            request_params["tools"] = formatted_tools
+            request_params["tool_choice"] = "auto"
+        return request_params
+
+    def format_tools(self, tools: List[Dict]) -> List[Dict]:
+        """Convert tool definitions to the format sent to OpenAI (do once, reuse)"""
+        return self._convert_tools_to_openai_format(tools)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client"""
+        await self.client.close()
+
     def _convert_tools_to_openai_format(self, claude_tools: List[Dict]) -> List[Dict]:
         """
         Convert Claude tool definitions to OpenAI function format
@@ -269,13 +347,26 @@ Always use these tools to perform actions on tasks instead of just describing wh
             },
             {
                 "name": "search_tasks",
-                "description": "Search tasks by keyword in title or description",
+                "description": "Search tasks by keyword in title or description (best matches first, paginated)",
                 "input_schema": {
                     "type": "object",
                     "properties": {
                         "query": {
                             "type": "string",
                             "description": "Search query keyword"
+                        },
+                        "status": {
+                            "type": "string",
+                            "enum": ["pending", "in_progress", "completed"],
+                            "description": "Only return tasks with this status"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Maximum matches to return (default 10, max 50)"
+                        },
+                        "page": {
+                            "type": "integer",
+                            "description": "Page of results to return when there are more matches (default 1)"
                         }
                     },
                     "required": ["query"]
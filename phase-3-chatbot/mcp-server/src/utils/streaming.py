@@ -0,0 +1,77 @@
+"""
+Streaming Helpers
+Event shapes and parsing shared by the provider clients' stream() methods
+
+Every stream() yields, in order:
+- {"type": "text", "text": "..."}: the next piece of the reply
+- {"type": "tool_call", "index": 0, "id": "...", "name": "...", "arguments": "..."}:
+  the next piece of a tool call; id and name come with the first piece of
+  each call, arguments is the next fragment of its JSON input
+- {"type": "done", "response": {...}}: always last, the same dict chat() returns
+"""
+
+import json
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# on_delta(event) for each text / tool_call event of a streamed reply
+DeltaCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+def text_event(text: str) -> Dict[str, Any]:
+    return {"type": "text", "text": text}
+
+
+def tool_call_event(
+    index: int,
+    arguments: str = "",
+    id: Optional[str] = None,
+    name: Optional[str] = None
+) -> Dict[str, Any]:
+    return {"type": "tool_call", "index": index, "id": id, "name": name, "arguments": arguments}
+
+
+def done_event(response: Dict[str, Any]) -> Dict[str, Any]:
+    return {"type": "done", "response": response}
+
+
+class ToolCallBuffer:
+    """Collects tool call pieces by index and parses the arguments at the end"""
+
+    def __init__(self):
+        self._calls: Dict[int, Dict[str, Any]] = {}
+
+    def add(self, index: int, id: Optional[str] = None, name: Optional[str] = None, arguments: str = "") -> None:
+        call = self._calls.setdefault(index, {"id": None, "name": None, "arguments": ""})
+        if id:
+            call["id"] = id
+        if name:
+            call["name"] = name
+        call["arguments"] += arguments or ""
+
+    def tool_calls(self) -> List[Dict[str, Any]]:
+        """Completed calls as {"id", "name", "input"} dicts, in index order"""
+        tool_calls = []
+        for index in sorted(self._calls):
+            call = self._calls[index]
+            try:
+                tool_input = json.loads(call["arguments"]) if call["arguments"] else {}
+            except json.JSONDecodeError:
+                logger.warning(f"Invalid arguments for streamed tool call {call['name']}: {call['arguments'][:200]}")
+                tool_input = {}
+            tool_calls.append({"id": call["id"], "name": call["name"], "input": tool_input})
+        return tool_calls
+
+
+async def sse_data(lines: AsyncIterator[str]) -> AsyncIterator[Dict[str, Any]]:
+    """JSON payloads of a server-sent event stream, up to "data: [DONE]" """
+    async for line in lines:
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            return
+        if data:
+            yield json.loads(data)
@@ -0,0 +1,111 @@
+"""
+Tool Call Scheduler
+Runs the tool calls requested in one model turn concurrently
+
+- Calls on the same task (same task_id) run one after another, in the
+  order the model asked for them; all other calls run concurrently
+- Each user has a bounded number of tool calls in flight across all of
+  their turns (MAX_CONCURRENT_TOOLS_PER_USER)
+- on_result is awaited as soon as each call finishes, so results can be
+  streamed to the client before the whole batch is done
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# execute(tool_name, parameters, user_id) -> {"success": ..., "data"/"error": ...}
+ToolExecutor = Callable[[str, Dict[str, Any], str], Awaitable[Dict[str, Any]]]
+# on_result(index, {"tool", "input", "result"})
+ResultCallback = Callable[[int, Dict[str, Any]], Awaitable[None]]
+
+
+class ToolScheduler:
+    """
+    Executes a batch of tool calls with per-task ordering and per-user limits
+
+    Usage:
+        scheduler = ToolScheduler(execute_tool, max_concurrent_per_user=4)
+        results = await scheduler.run(response["tool_calls"], user_id, on_result=send_result)
+    """
+
+    def __init__(self, execute: ToolExecutor, max_concurrent_per_user: int = 4):
+        self.execute = execute
+        self.max_concurrent_per_user = max_concurrent_per_user
+        # user_id -> (semaphore, batches using it)
+        self._user_slots: Dict[str, Tuple[asyncio.Semaphore, int]] = {}
+
+    def _acquire_slots(self, user_id: str) -> asyncio.Semaphore:
+        semaphore, users = self._user_slots.get(user_id, (None, 0))
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent_per_user)
+        self._user_slots[user_id] = (semaphore, users + 1)
+        return semaphore
+
+    def _release_slots(self, user_id: str) -> None:
+        semaphore, users = self._user_slots[user_id]
+        if users <= 1:
+            del self._user_slots[user_id]
+        else:
+            self._user_slots[user_id] = (semaphore, users - 1)
+
+    @staticmethod
+    def _chains(tool_calls: List[Dict[str, Any]]) -> List[List[int]]:
+        """Group call indexes: calls on the same task share a chain"""
+        chains: Dict[Any, List[int]] = {}
+        for index, tool_call in enumerate(tool_calls):
+            task_id = (tool_call.get("input") or {}).get("task_id")
+            key = ("task", str(task_id)) if task_id else ("call", index)
+            chains.setdefault(key, []).append(index)
+        return list(chains.values())
+
+    async def run(
+        self,
+        tool_calls: List[Dict[str, Any]],
+        user_id: str,
+        on_result: Optional[ResultCallback] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute tool calls ({"name", "input"}) and return their results in request order
+
+        Returns:
+            List of {"tool", "input", "result"} dicts, one per call
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tool_calls)
+        slots = self._acquire_slots(user_id)
+
+        async def run_chain(indexes: List[int]) -> None:
+            for index in indexes:
+                tool_name = tool_calls[index]["name"]
+                tool_input = tool_calls[index].get("input") or {}
+
+                async with slots:
+                    logger.info(f"Executing tool: {tool_name} with input: {tool_input}")
+                    result = await self.execute(tool_name, tool_input, user_id)
+
+                results[index] = {
+                    "tool": tool_name,
+                    "input": tool_input,
+                    "result": result
+                }
+                if on_result is not None:
+                    try:
+                        await on_result(index, results[index])
+                    except Exception as e:
+                        # A closed socket must not abandon the remaining calls
+                        logger.warning(f"Could not deliver result of {tool_name}: {e}")
+
+        try:
+            await asyncio.gather(*(run_chain(chain) for chain in self._chains(tool_calls)))
+        finally:
+            self._release_slots(user_id)
+
+        return results
+
+
+def max_concurrent_tools_per_user() -> int:
+    """Per-user limit from MAX_CONCURRENT_TOOLS_PER_USER (default 4)"""
+    return max(1, int(os.getenv("MAX_CONCURRENT_TOOLS_PER_USER", "4")))
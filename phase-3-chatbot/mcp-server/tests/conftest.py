@@ -0,0 +1,92 @@
+"""
+Shared fixtures for MCP server tests
+
+anthropic_stub serves a minimal Anthropic Messages API on a local port, from
+its own thread and event loop, so slow completions can be simulated without
+network access or an API key.
+"""
+
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+
+class AnthropicStub:
+    """
+    Replies to POST /v1/messages after `delay` seconds
+
+    Counts overlapping requests, and requests the client abandoned
+    (disconnected) before the reply was sent.
+    """
+
+    def __init__(self):
+        self.delay = 0.0
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.disconnects = 0
+        self.url = ""
+        self._lock = threading.Lock()
+
+    async def messages(self, request: Request) -> JSONResponse:
+        body = await request.json()
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            deadline = time.monotonic() + self.delay
+            while time.monotonic() < deadline:
+                if await request.is_disconnected():
+                    with self._lock:
+                        self.disconnects += 1
+                    return JSONResponse({}, status_code=499)
+                await asyncio.sleep(min(0.02, max(0.0, deadline - time.monotonic())))
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+        return JSONResponse({
+            "id": f"msg_{self.requests}",
+            "type": "message",
+            "role": "assistant",
+            "model": body["model"],
+            "content": [{"type": "text", "text": f"echo: {body['messages'][-1]['content']}"}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": 1, "output_tokens": 1}
+        })
+
+
+@pytest.fixture
+def anthropic_stub():
+    """Running stub server (stub.url is the base URL for the client)"""
+    stub = AnthropicStub()
+    app = Starlette(routes=[Route("/v1/messages", stub.messages, methods=["POST"])])
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    stub.url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+    server = uvicorn.Server(uvicorn.Config(app, lifespan="off", log_level="warning"))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError("Anthropic stub server did not start")
+        time.sleep(0.01)
+
+    yield stub
+
+    server.should_exit = True
+    thread.join(timeout=5)
+    sock.close()
@@ -0,0 +1,64 @@
+"""
+Streaming a reply over the chat WebSocket
+"""
+
+import pytest
+from starlette.testclient import TestClient
+
+import server
+from utils.ai_provider import UnifiedAIClient
+from utils.streaming import done_event, text_event, tool_call_event
+
+PIECES = 200
+
+
+def burst_client() -> UnifiedAIClient:
+    """Mock provider whose reply arrives as one burst, like a single network read"""
+    client = UnifiedAIClient(provider="mock")
+
+    async def stream(messages, **kwargs):
+        for i in range(PIECES):
+            yield text_event(f"{i} ")
+        yield tool_call_event(0, arguments='{"title": ', id="call_1", name="search_tasks")
+        for piece in ('"mi', 'lk"', "}"):
+            yield tool_call_event(0, arguments=piece)
+        yield done_event({"content": "".join(f"{i} " for i in range(PIECES)), "tool_calls": []})
+
+    client.client.stream = stream
+    return client
+
+
+@pytest.fixture
+def chat(tmp_path, monkeypatch):
+    monkeypatch.setenv("CONVERSATION_DATABASE_URL", f"sqlite:///{tmp_path / 'conversations.db'}")
+    monkeypatch.setenv("AI_WARMUP", "false")
+    monkeypatch.setenv("INTENT_FAST_PATH", "false")
+    monkeypatch.setattr(server, "create_ai_client", burst_client)
+
+    with TestClient(server.app) as client:
+        with client.websocket_connect("/ws/chat") as websocket:
+            yield websocket
+
+
+def test_burst_of_deltas_keeps_the_socket_open(chat):
+    chat.send_json({"type": "chat", "message": "tell me something long"})
+
+    text, arguments, frames = "", "", []
+    while True:
+        frame = chat.receive_json()
+        if frame["type"] == "message":
+            break
+        if frame["type"] == "delta":
+            frames.append(frame)
+            if "content" in frame:
+                text += frame["content"]
+            else:
+                arguments += frame["tool_call"]["arguments"]
+
+    assert text == frame["content"]
+    assert arguments == '{"title": "milk"}'
+    assert len(frames) < server.manager.queue_size
+
+    # Still open: the socket answers the next turn
+    chat.send_json({"type": "tool_call", "tool": "unknown_tool"})
+    assert chat.receive_json()["type"] == "tool_result"
@@ -0,0 +1,95 @@
+"""
+ClaudeClient must not block the event loop
+
+Runs against the local stub server (see conftest.py): with a blocking
+transport, concurrent chats would finish one after another.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from utils.claude_client import ClaudeClient
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+@pytest.fixture
+async def claude(anthropic_stub, monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_MAX_RETRIES", "0")
+    client = ClaudeClient(api_key="test-key", base_url=anthropic_stub.url)
+    yield client
+    await client.aclose()
+
+
+async def test_concurrent_chats_finish_in_parallel(claude, anthropic_stub):
+    anthropic_stub.delay = 0.5
+
+    started = time.perf_counter()
+    responses = await asyncio.gather(*(
+        claude.chat([{"role": "user", "content": f"chat {i}"}]) for i in range(5)
+    ))
+    elapsed = time.perf_counter() - started
+
+    assert [response["content"] for response in responses] == [f"echo: chat {i}" for i in range(5)]
+    assert anthropic_stub.max_in_flight == 5
+    # One after another would take 2.5s
+    assert elapsed < 1.5
+
+
+async def test_chat_keeps_event_loop_responsive(claude, anthropic_stub):
+    anthropic_stub.delay = 0.5
+    longest_gap = 0.0
+
+    async def ticker() -> None:
+        nonlocal longest_gap
+        last = time.perf_counter()
+        while True:
+            await asyncio.sleep(0.01)
+            now = time.perf_counter()
+            longest_gap = max(longest_gap, now - last)
+            last = now
+
+    ticks = asyncio.create_task(ticker())
+    await asyncio.sleep(0.05)
+    try:
+        await claude.chat(MESSAGES)
+        # Let the ticker measure the last gap
+        await asyncio.sleep(0.05)
+    finally:
+        ticks.cancel()
+
+    assert longest_gap < 0.2
+
+
+async def test_cancelled_chat_stops_promptly(claude, anthropic_stub):
+    anthropic_stub.delay = 5
+
+    task = asyncio.create_task(claude.chat(MESSAGES))
+    await asyncio.sleep(0.2)
+    started = time.perf_counter()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert time.perf_counter() - started < 0.5
+    # The request was aborted, not left running in the background
+    await asyncio.sleep(0.2)
+    assert anthropic_stub.disconnects == 1
+
+
+async def test_chat_times_out(anthropic_stub, monkeypatch):
+    anthropic_stub.delay = 5
+    monkeypatch.setenv("ANTHROPIC_TIMEOUT", "0.3")
+    monkeypatch.setenv("ANTHROPIC_MAX_RETRIES", "0")
+    client = ClaudeClient(api_key="test-key", base_url=anthropic_stub.url)
+
+    started = time.perf_counter()
+    try:
+        with pytest.raises(Exception, match="timed out"):
+            await client.chat(MESSAGES)
+    finally:
+        await client.aclose()
+
+    assert time.perf_counter() - started < 2
@@ -0,0 +1,148 @@
+"""
+WebSocket connection manager: per-socket queues and slow consumer policies
+"""
+
+import asyncio
+
+import pytest
+
+from utils.connections import TRY_AGAIN_LATER, ConnectionManager
+
+
+class FakeWebSocket:
+    """Records sent messages; sending blocks while `paused` is clear"""
+
+    def __init__(self):
+        self.sent = []
+        self.close_code = None
+        self.paused = asyncio.Event()
+        self.paused.set()
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, message):
+        await self.paused.wait()
+        self.sent.append(message)
+
+    async def close(self, code=1000):
+        self.close_code = code
+
+
+async def drain():
+    """Let the writer tasks run"""
+    await asyncio.sleep(0.01)
+
+
+async def test_messages_are_sent_in_order():
+    manager = ConnectionManager()
+    websocket = FakeWebSocket()
+    connection = await manager.connect(websocket, "user-1")
+
+    for i in range(3):
+        assert manager.send(connection, {"n": i})
+    await drain()
+
+    assert websocket.sent == [{"n": 0}, {"n": 1}, {"n": 2}]
+    await manager.disconnect(connection)
+    assert not manager.send(connection, {"n": 3})
+
+
+async def test_send_to_user_reaches_every_socket():
+    manager = ConnectionManager()
+    first, second, other = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+    await manager.connect(first, "user-1")
+    second_connection = await manager.connect(second, "user-1")
+    await manager.connect(other, "user-2")
+
+    assert manager.send_to_user("user-1", {"type": "ping"}) == 2
+    await drain()
+    assert first.sent == second.sent == [{"type": "ping"}]
+    assert other.sent == []
+
+    await manager.disconnect(second_connection)
+    assert len(manager.get_user_connections("user-1")) == 1
+    assert manager.send_to_user("nobody", {"type": "ping"}) == 0
+
+
+async def test_full_queue_disconnects_the_slow_client():
+    manager = ConnectionManager(queue_size=2, slow_consumer_policy="disconnect")
+    websocket = FakeWebSocket()
+    websocket.paused.clear()
+    connection = await manager.connect(websocket, "user-1")
+
+    # One message held by the writer, two queued
+    for i in range(3):
+        assert manager.send(connection, {"n": i})
+        await drain()
+    assert not manager.send(connection, {"n": 3})
+    await drain()
+
+    assert websocket.close_code == TRY_AGAIN_LATER
+    assert connection.closed
+    assert manager.get_user_connections("user-1") == []
+
+
+async def test_full_queue_drops_messages_with_drop_policy():
+    manager = ConnectionManager(queue_size=1, slow_consumer_policy="drop")
+    websocket = FakeWebSocket()
+    websocket.paused.clear()
+    connection = await manager.connect(websocket, "user-1")
+
+    assert manager.send(connection, {"n": 0})
+    await drain()
+    assert manager.send(connection, {"n": 1})
+    assert not manager.send(connection, {"n": 2})
+
+    websocket.paused.set()
+    await drain()
+    assert websocket.sent == [{"n": 0}, {"n": 1}]
+    assert websocket.close_code is None
+    assert not connection.closed
+    await manager.disconnect(connection)
+
+
+async def test_stalled_send_disconnects_after_the_timeout():
+    manager = ConnectionManager(send_timeout=0.05)
+    websocket = FakeWebSocket()
+    websocket.paused.clear()
+    connection = await manager.connect(websocket, "user-1")
+
+    manager.send(connection, {"n": 0})
+    await asyncio.sleep(0.1)
+    await drain()
+
+    assert websocket.close_code == TRY_AGAIN_LATER
+    assert connection.closed
+
+
+async def test_queued_deltas_are_merged():
+    manager = ConnectionManager(queue_size=3)
+    websocket = FakeWebSocket()
+    websocket.paused.clear()
+    connection = await manager.connect(websocket, "user-1")
+
+    for word in ("a ", "b ", "c"):
+        assert manager.send_delta(connection, {"type": "delta", "content": word})
+    manager.send_delta(connection, {"type": "delta", "tool_call": {"index": 0, "id": "call_1", "name": "x", "arguments": "{"}})
+    manager.send_delta(connection, {"type": "delta", "tool_call": {"index": 0, "id": None, "name": None, "arguments": "}"}})
+    await drain()
+    # A message in between ends the merge, so order is kept
+    manager.send(connection, {"type": "typing"})
+    for word in ("d", "e"):
+        manager.send_delta(connection, {"type": "delta", "content": word})
+
+    websocket.paused.set()
+    await drain()
+    assert websocket.sent == [
+        {"type": "delta", "content": "a b c"},
+        {"type": "delta", "tool_call": {"index": 0, "id": "call_1", "name": "x", "arguments": "{}"}},
+        {"type": "typing"},
+        {"type": "delta", "content": "de"},
+    ]
+    await manager.disconnect(connection)
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        ConnectionManager(slow_consumer_policy="ignore")
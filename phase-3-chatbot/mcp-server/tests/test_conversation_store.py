@@ -0,0 +1,43 @@
+"""
+Tests for the shared conversation store's startup
+"""
+
+import pytest
+
+from utils.conversation_store import (
+    ConversationStoreUnavailable,
+    close_conversation_store,
+    get_conversation_store,
+    start_conversation_store,
+)
+
+
+@pytest.fixture(autouse=True)
+async def reset_store():
+    await close_conversation_store()
+    yield
+    await close_conversation_store()
+
+
+async def test_store_opens_and_persists(tmp_path, monkeypatch):
+    monkeypatch.setenv("CONVERSATION_DATABASE_URL", f"sqlite:///{tmp_path / 'conversations.db'}")
+    await start_conversation_store()
+
+    store = await get_conversation_store()
+    conversation = await store.get_or_create_conversation("user-1", title="Hello")
+    assert (await store.get_conversation(conversation.id, user_id="user-1")).title == "Hello"
+
+
+async def test_unreachable_database_disables_history(tmp_path, monkeypatch, caplog):
+    monkeypatch.setenv("CONVERSATION_DATABASE_URL", f"sqlite:///{tmp_path / 'missing' / 'conversations.db'}")
+
+    await start_conversation_store()  # logs instead of failing startup
+    assert "chat history is disabled" in caplog.text
+
+    with pytest.raises(ConversationStoreUnavailable):
+        await get_conversation_store()
+
+    # Not retried on every message
+    monkeypatch.setenv("CONVERSATION_DATABASE_URL", f"sqlite:///{tmp_path / 'conversations.db'}")
+    with pytest.raises(ConversationStoreUnavailable):
+        await get_conversation_store()
@@ -0,0 +1,83 @@
+"""
+Conversation endpoints: only the authenticated caller's history is readable
+"""
+
+import httpx
+import pytest
+from starlette.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+import server
+import utils.auth
+
+# Bearer token -> backend user id
+USERS = {"alice-token": "alice-id", "bob-token": "bob-id"}
+
+
+def backend_me(request: httpx.Request) -> httpx.Response:
+    token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+    if request.url.path == "/api/auth/me" and token in USERS:
+        return httpx.Response(200, json={"id": USERS[token], "username": token})
+    return httpx.Response(401, json={"detail": "Could not validate credentials"})
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv("CONVERSATION_DATABASE_URL", f"sqlite:///{tmp_path / 'conversations.db'}")
+    monkeypatch.setenv("AI_WARMUP", "false")
+    monkeypatch.setenv("INTENT_FAST_PATH", "false")
+
+    backend = httpx.AsyncClient(base_url="http://backend", transport=httpx.MockTransport(backend_me))
+
+    async def get_backend_client():
+        return backend
+
+    monkeypatch.setattr(utils.auth, "get_backend_client", get_backend_client)
+
+    with TestClient(server.app) as test_client:
+        yield test_client
+
+
+def chat(client, token, message):
+    """One chat turn over an authenticated socket; returns the conversation id"""
+    with client.websocket_connect(f"/ws/chat?token={token}") as websocket:
+        websocket.send_json({"type": "chat", "message": message, "stream": False})
+        while True:
+            frame = websocket.receive_json()
+            if frame["type"] == "message":
+                return frame["conversation_id"]
+
+
+def auth(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_conversations_require_a_valid_token(client):
+    assert client.get("/conversations").status_code == 401
+    assert client.get("/conversations", headers=auth("forged")).status_code == 401
+    assert client.get("/conversations?user_id=alice-id").status_code == 401
+
+
+def test_callers_see_only_their_own_conversations(client):
+    alice_conversation = chat(client, "alice-token", "hello from alice")
+    chat(client, "bob-token", "hello from bob")
+
+    response = client.get("/conversations", headers=auth("alice-token"))
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 1
+    assert [c["id"] for c in body["items"]] == [alice_conversation]
+
+    response = client.get(f"/conversations/{alice_conversation}", headers=auth("alice-token"))
+    assert response.status_code == 200
+    assert [m["role"] for m in response.json()["messages"]] == ["user", "assistant"]
+
+    response = client.get(f"/conversations/{alice_conversation}", headers=auth("bob-token"))
+    assert response.status_code == 404
+
+
+def test_invalid_websocket_token_is_rejected(client):
+    with pytest.raises(WebSocketDisconnect) as disconnect:
+        with client.websocket_connect("/ws/chat?token=forged") as websocket:
+            websocket.receive_json()
+    assert disconnect.value.code == 1008
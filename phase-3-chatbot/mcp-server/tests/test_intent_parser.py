@@ -0,0 +1,94 @@
+"""
+Intent parser: plain commands become tool calls, anything else goes to the model
+"""
+
+import timeit
+from datetime import date
+
+import pytest
+
+from utils.intent_parser import intent_parser
+
+# A Monday
+TODAY = date(2026, 10, 19)
+
+
+@pytest.mark.parametrize("message, tool, tool_input", [
+    ("create a task to buy milk", "create_task", {"title": "Buy milk"}),
+    ("Please add a new task: call the bank.", "create_task", {"title": "Call the bank"}),
+    ("add buy milk to my tasks", "create_task", {"title": "Buy milk"}),
+    ("remind me to call mom tomorrow", "create_task", {"title": "Call mom", "due_date": "2026-10-20"}),
+    (
+        "create a high priority task to review code by friday",
+        "create_task",
+        {"title": "Review code", "priority": "high", "due_date": "2026-10-23"}
+    ),
+    (
+        "add a new task: Write report (low priority) due 2026-11-01",
+        "create_task",
+        {"title": "Write report", "priority": "low", "due_date": "2026-11-01"}
+    ),
+    ("add a task to plan sprint next monday", "create_task", {"title": "Plan sprint", "due_date": "2026-10-26"}),
+    ("create an urgent task to fix login in 3 days", "create_task", {"title": "Fix login", "priority": "high", "due_date": "2026-10-22"}),
+    ("task banao: hackathon submit karo kal tak", "create_task", {"title": "Hackathon submit karo", "due_date": "2026-10-20"}),
+    ("show my tasks", "list_tasks", {}),
+    ("what are my high priority tasks?", "list_tasks", {"priority": "high"}),
+    ("list completed tasks", "list_tasks", {"status": "completed"}),
+    ("what tasks do I have", "list_tasks", {}),
+    ("mere sare pending tasks dikhao", "list_tasks", {"status": "pending"}),
+    ("zaroori tasks dikhao", "list_tasks", {"priority": "high"}),
+    ("تمام ٹاسک دکھائیں", "list_tasks", {}),
+    ("find tasks about testing", "search_tasks", {"query": "testing"}),
+    ("search for pending tasks about report", "search_tasks", {"query": "report", "status": "pending"}),
+    ("dhundo: report", "search_tasks", {"query": "report"}),
+    ("search my tasks for report", "search_tasks", {"query": "report"}),
+    ("search for report in my tasks", "search_tasks", {"query": "report"}),
+])
+def test_commands_become_tool_calls(message, tool, tool_input):
+    intent = intent_parser.parse(message, today=TODAY)
+
+    assert intent is not None
+    assert intent.tool == tool
+    assert intent.input == tool_input
+
+    tool_call = intent.tool_call()
+    assert tool_call["name"] == tool
+    assert tool_call["input"] == tool_input
+    assert tool_call["id"].startswith("intent_")
+
+
+@pytest.mark.parametrize("message", [
+    "",
+    "hello",
+    "tell me a joke",
+    "how do I stay productive?",
+    "find a way to relax",
+    "create a task",
+    "search tasks",
+    "delete task 5",
+    "mark task 3 as done",
+    "show my tasks and delete the completed ones",
+    "create a high priority task to fix login with low priority",
+    "create a task to " + "x" * 300,
+    "new task ideas for the team?",
+    "new task ideas for the team",
+    "set up a reminder that I should not create a new task",
+    "add a new task for each of my meetings next week",
+    "create a task to water the plants every morning",
+    "create a task to file taxes by 2026-13-45",
+    "add a task called meet Sam on 2026-02-30 at noon",
+    "can you create a task to call mom?",
+    "make a task list for the trip",
+    "search the web for python tutorials",
+    "search for a good restaurant nearby",
+    "search python",
+])
+def test_anything_else_goes_to_the_model(message):
+    assert intent_parser.parse(message, today=TODAY) is None
+
+
+def test_parsing_takes_microseconds():
+    runs = 1000
+    for message in ("create a high priority task to review code by friday", "how do I plan my week?"):
+        seconds = timeit.timeit(lambda: intent_parser.parse(message, today=TODAY), number=runs) / runs
+        assert seconds < 0.001
@@ -0,0 +1,100 @@
+"""
+Stream parsing: server-sent events, tool call buffering, provider streams
+"""
+
+import json
+
+import httpx
+
+from utils.groq_client import GroqClient
+from utils.mock_ai_client import MockAIClient
+from utils.streaming import ToolCallBuffer, sse_data
+
+
+async def lines(*items):
+    for item in items:
+        yield item
+
+
+async def collect(stream):
+    return [event async for event in stream]
+
+
+async def test_sse_data_yields_payloads_until_done():
+    stream = lines(
+        ": keep-alive",
+        'data: {"a": 1}',
+        "",
+        "event: message",
+        'data:{"b": 2}',
+        "data: [DONE]",
+        'data: {"after": "done"}',
+    )
+    assert await collect(sse_data(stream)) == [{"a": 1}, {"b": 2}]
+
+
+def test_tool_call_buffer_joins_argument_fragments_by_index():
+    buffer = ToolCallBuffer()
+    buffer.add(1, id="call_b", name="list_tasks", arguments="")
+    buffer.add(0, id="call_a", name="create_task", arguments='{"title": "Bu')
+    buffer.add(0, arguments='y milk", "priority"')
+    buffer.add(1, arguments='{"status": "pending"}')
+    buffer.add(0, arguments=': "high"}')
+
+    assert buffer.tool_calls() == [
+        {"id": "call_a", "name": "create_task", "input": {"title": "Buy milk", "priority": "high"}},
+        {"id": "call_b", "name": "list_tasks", "input": {"status": "pending"}},
+    ]
+
+
+def test_tool_call_buffer_tolerates_bad_arguments():
+    buffer = ToolCallBuffer()
+    buffer.add(0, id="call_a", name="list_tasks")
+    buffer.add(1, id="call_b", name="create_task", arguments='{"title": ')
+
+    assert [call["input"] for call in buffer.tool_calls()] == [{}, {}]
+
+
+def groq_sse(*chunks):
+    body = "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in chunks) + "data: [DONE]\n\n"
+    return httpx.MockTransport(lambda request: httpx.Response(200, text=body))
+
+
+async def test_groq_stream_yields_text_and_tool_call_pieces():
+    client = GroqClient(api_key="test")
+    await client._http.aclose()
+    client._http = httpx.AsyncClient(transport=groq_sse(
+        {"model": "llama", "choices": [{"delta": {"content": "Creating "}}]},
+        {"choices": [{"delta": {"content": "it"}}]},
+        {"choices": [{"delta": {"tool_calls": [
+            {"index": 0, "id": "call_1", "function": {"name": "create_task", "arguments": '{"title": '}}
+        ]}}]},
+        {"choices": [{"delta": {"tool_calls": [{"index": 0, "function": {"arguments": '"Milk"}'}}]}}]},
+        {"choices": [{"delta": {}, "finish_reason": "tool_calls"}]},
+    ))
+
+    events = await collect(client.stream([{"role": "user", "content": "add milk"}]))
+    await client._http.aclose()
+
+    assert [e["text"] for e in events if e["type"] == "text"] == ["Creating ", "it"]
+    pieces = [e for e in events if e["type"] == "tool_call"]
+    assert (pieces[0]["id"], pieces[0]["name"]) == ("call_1", "create_task")
+    assert "".join(p["arguments"] for p in pieces) == '{"title": "Milk"}'
+
+    done = events[-1]
+    assert done["type"] == "done"
+    assert done["response"]["content"] == "Creating it"
+    assert done["response"]["tool_calls"] == [{"id": "call_1", "name": "create_task", "input": {"title": "Milk"}}]
+    assert done["response"]["stop_reason"] == "tool_calls"
+    assert done["response"]["model"] == "llama"
+
+
+async def test_mock_stream_matches_its_chat_reply():
+    client = MockAIClient()
+    messages = [{"role": "user", "content": "hello there"}]
+
+    events = await collect(client.stream(messages))
+    reply = await client.chat(messages)
+
+    assert "".join(e["text"] for e in events if e["type"] == "text") == reply["content"]
+    assert events[-1]["type"] == "done"
@@ -0,0 +1,91 @@
+"""
+Tool call scheduler: per-task ordering, concurrency and per-user limits
+"""
+
+import asyncio
+
+from utils.tool_scheduler import ToolScheduler
+
+
+class RecordingExecutor:
+    """Tool executor that records start / end order and the peak concurrency"""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.events = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, tool_name, parameters, user_id):
+        label = parameters.get("label", tool_name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.events.append(("start", label))
+        await asyncio.sleep(self.delay)
+        self.events.append(("end", label))
+        self.in_flight -= 1
+        return {"success": True, "data": {"label": label}}
+
+
+def call(label, task_id=None):
+    tool_input = {"label": label}
+    if task_id is not None:
+        tool_input["task_id"] = task_id
+    return {"name": "update_task", "input": tool_input}
+
+
+async def test_calls_on_the_same_task_run_in_order():
+    executor = RecordingExecutor()
+    scheduler = ToolScheduler(executor, max_concurrent_per_user=4)
+
+    results = await scheduler.run([call("complete", 7), call("other"), call("rename", 7)], "user-1")
+
+    assert [r["result"]["data"]["label"] for r in results] == ["complete", "other", "rename"]
+    events = executor.events
+    assert events.index(("end", "complete")) < events.index(("start", "rename"))
+
+
+async def test_calls_on_different_tasks_run_concurrently():
+    executor = RecordingExecutor(delay=0.05)
+    scheduler = ToolScheduler(executor, max_concurrent_per_user=4)
+
+    started = asyncio.get_running_loop().time()
+    await scheduler.run([call(str(i), task_id=i) for i in range(4)], "user-1")
+
+    assert executor.max_in_flight == 4
+    assert asyncio.get_running_loop().time() - started < 0.15
+
+
+async def test_per_user_limit_holds_across_turns():
+    executor = RecordingExecutor()
+    scheduler = ToolScheduler(executor, max_concurrent_per_user=2)
+
+    await asyncio.gather(
+        scheduler.run([call(f"a{i}") for i in range(3)], "user-1"),
+        scheduler.run([call(f"b{i}") for i in range(3)], "user-1"),
+    )
+    assert executor.max_in_flight == 2
+    assert scheduler._user_slots == {}
+
+    # Other users have their own slots
+    other = RecordingExecutor()
+    scheduler = ToolScheduler(other, max_concurrent_per_user=1)
+    await asyncio.gather(scheduler.run([call("a")], "user-1"), scheduler.run([call("b")], "user-2"))
+    assert other.max_in_flight == 2
+
+
+async def test_on_result_fires_for_each_call_as_it_finishes():
+    executor = RecordingExecutor()
+    scheduler = ToolScheduler(executor)
+    delivered = []
+
+    async def on_result(index, result):
+        delivered.append((index, result["result"]["data"]["label"]))
+        if index == 0:
+            raise RuntimeError("socket closed")
+
+    results = await scheduler.run([call("first"), call("second", 3)], "user-1", on_result=on_result)
+
+    assert sorted(delivered) == [(0, "first"), (1, "second")]
+    # A failing callback doesn't lose results
+    assert all(result["result"]["success"] for result in results)
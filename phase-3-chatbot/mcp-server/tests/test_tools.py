@@ -0,0 +1,58 @@
+"""
+Tool handlers: backend requests and their per-call timeouts
+"""
+
+import httpx
+import pytest
+
+from tools.create_task import create_task_handler
+from tools.delete_task import delete_task_handler
+from tools.list_tasks import list_tasks_handler
+from tools.search_tasks import search_tasks_handler
+from tools.update_task import update_task_handler
+
+TASK = {"id": "7", "title": "Buy milk", "status": "pending", "priority": "medium"}
+PAGE = {"items": [TASK], "total": 3, "page": 1, "limit": 1, "total_pages": 3}
+
+
+@pytest.fixture
+async def backend(monkeypatch):
+    """Backend double recording each request; the client's default timeout is 10s"""
+    monkeypatch.setenv("BACKEND_WRITE_TIMEOUT", "2")
+    monkeypatch.setenv("BACKEND_QUERY_TIMEOUT", "20")
+    requests = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "GET":
+            return httpx.Response(200, json=PAGE)
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(200, json=TASK)
+
+    client = httpx.AsyncClient(base_url="http://backend", transport=httpx.MockTransport(handle), timeout=10)
+    client.requests = requests
+    yield client
+    await client.aclose()
+
+
+@pytest.mark.parametrize("handler, parameters, read_timeout", [
+    (create_task_handler, {"title": "Buy milk"}, 2),
+    (update_task_handler, {"task_id": "7", "status": "completed"}, 2),
+    (delete_task_handler, {"task_id": "7"}, 2),
+    (list_tasks_handler, {"status": "pending"}, 20),
+    (search_tasks_handler, {"query": "milk"}, 20),
+])
+async def test_each_tool_call_has_its_own_timeout(backend, handler, parameters, read_timeout):
+    result = await handler(parameters, "user-1", backend)
+
+    assert result["message"]
+    (request,) = backend.requests
+    assert request.extensions["timeout"]["read"] == read_timeout
+
+
+async def test_list_tasks_reports_the_backend_total(backend):
+    result = await list_tasks_handler({}, "user-1", backend)
+
+    assert result["tasks"] == [TASK]
+    assert "3" in result["message"] and "showing 1" in result["message"]
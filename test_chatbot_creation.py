@@ -73,15 +73,18 @@ async def test_mcp_tool_creation():
         os.environ['BACKEND_AUTH_TOKEN'] = BACKEND_AUTH_TOKEN
 
         from tools.create_task import create_task_handler
-
-        result = await create_task_handler(
-            parameters={
-                "title": "MCP Tool Test Task",
-                "description": "Testing via MCP create_task handler",
-                "priority": "high"
-            },
-            user_id="demo_user"
-        )
+        from utils.backend_client import create_backend_client
+
+        async with create_backend_client() as client:
+            result = await create_task_handler(
+                parameters={
+                    "title": "MCP Tool Test Task",
+                    "description": "Testing via MCP create_task handler",
+                    "priority": "high"
+                },
+                user_id="demo_user",
+                client=client
+            )
 
         print(f"✅ SUCCESS: {result['message']}")
         print(f"   Task: {result['task']['title']}")